@@ -159,6 +159,11 @@ DAILY_LIMIT_PER_SYMBOL: int = _get_int_env("DAILY_LIMIT_PER_SYMBOL", 20)
 # (cooldown/daily limit), try the next-best candidate instead.
 STRATEGY_FAILOVER_ON_BLOCK: bool = _get_bool_env("STRATEGY_FAILOVER_ON_BLOCK", True)
 
+# Signal state snapshot format: "json" (default, human-readable) or "msgpack"
+# (smaller/faster; needs the optional msgpack package, else falls back to JSON).
+# Either format is read back automatically.
+SIGNAL_STATE_FORMAT: str = os.getenv("SIGNAL_STATE_FORMAT", "json").strip().lower()
+
 
 # --- Performance guards (24/7) ---
 
@@ -177,6 +182,15 @@ SCAN_CYCLE_WARN_MS: int = _get_int_env("SCAN_CYCLE_WARN_MS", 2000)
 # Emit PERF_SUMMARY every N scan cycles (0 disables summary).
 PERF_SUMMARY_EVERY_CYCLES: int = _get_int_env("PERF_SUMMARY_EVERY_CYCLES", 20)
 
+# Signal chart renderer: "matplotlib" (default) or "pil" (Pillow-only fast path:
+# plain candles/grid/labels, no matplotlib figure; falls back if Pillow is missing).
+CHART_BACKEND: str = os.getenv("CHART_BACKEND", "matplotlib").strip().lower()
+
+# Append per-pair metrics events (state/metrics_events.jsonl) from explain payloads.
+# Feeds daily summary + guardrails. When off and EXPLAIN_AUDIT is off too,
+# PAIR_NONE explain payloads are only attached to result.debug, never queued.
+METRICS_EVENTS_ENABLED: bool = _get_bool_env("METRICS_EVENTS_ENABLED", True)
+
 
 # --- Data readiness gate (cache coverage) ---
 
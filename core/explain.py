@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Literal, Mapping, Optional
 
 
 Status = Literal["OK", "NONE"]
@@ -244,10 +244,11 @@ def build_pair_ok_explain(
     tf: str,
     scan_id: str,
     strategy_id: str,
-    debug: Optional[Dict[str, Any]] = None,
+    debug: Optional[Mapping[str, Any]] = None,
     governance: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    dbg = dict(debug or {})
+    # Read-only: callers may pass a ChainMap overlay instead of a copied dict.
+    dbg: Mapping[str, Any] = debug or {}
     bd = dbg.get("score_breakdown") if isinstance(dbg.get("score_breakdown"), dict) else {}
 
     # Prefer breakdown as single source of truth.
@@ -326,10 +327,11 @@ def build_pair_none_explain(
     scan_id: str,
     strategy_id: str,
     reason: str,
-    debug: Optional[Dict[str, Any]] = None,
+    debug: Optional[Mapping[str, Any]] = None,
     governance: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    dbg = dict(debug or {})
+    # Read-only: callers may pass a ChainMap overlay instead of a copied dict.
+    dbg: Mapping[str, Any] = debug or {}
     stable = _stable_reason(reason)
     bd = dbg.get("score_breakdown") if isinstance(dbg.get("score_breakdown"), dict) else {}
 
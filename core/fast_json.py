@@ -0,0 +1,62 @@
+"""Optional fast JSON encode/decode.
+
+Uses `orjson` (C extension, bytes in/out) when installed and falls back to the
+stdlib `json` module otherwise. Output is valid JSON either way; callers must
+not depend on byte-identical formatting across the two backends.
+
+orjson is optional by design: state files and JSONL logs stay readable by
+plain `json` and nothing here raises ImportError.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:  # optional dependency
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    _orjson = None
+
+HAVE_ORJSON = _orjson is not None
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Parse JSON from bytes or str."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any, *, indent: bool = False, sort_keys: bool = False, newline: bool = False) -> bytes:
+    """Serialize to UTF-8 bytes (non-ASCII kept as-is, like `ensure_ascii=False`).
+
+    indent=True matches `json.dumps(indent=2)`; otherwise output is compact.
+    Falls back to stdlib json for objects orjson rejects (e.g. non-str keys).
+    """
+    if _orjson is not None:
+        opt = 0
+        if indent:
+            opt |= _orjson.OPT_INDENT_2
+        if sort_keys:
+            opt |= _orjson.OPT_SORT_KEYS
+        if newline:
+            opt |= _orjson.OPT_APPEND_NEWLINE
+        try:
+            return _orjson.dumps(obj, option=opt)
+        except TypeError:
+            pass
+    if indent:
+        text = json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys)
+    if newline:
+        text += "\n"
+    return text.encode("utf-8")
+
+
+def dumps(obj: Any, *, sort_keys: bool = False) -> str:
+    """Compact JSON text (`separators=(",", ":")`, `ensure_ascii=False`)."""
+    return dumps_bytes(obj, sort_keys=sort_keys).decode("utf-8")
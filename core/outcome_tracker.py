@@ -13,7 +13,7 @@ import os
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -132,6 +132,42 @@ def get_pending_signals(max_age_hours: int = 72) -> List[Dict[str, Any]]:
     return pending
 
 
+def _candle_ts(c: Dict[str, Any]) -> int:
+    """Epoch seconds of a cached candle, or 0 if it has no usable time."""
+    # Handle both "time" (datetime) and "timestamp" (int) formats
+    c_time = c.get("time") or c.get("timestamp") or c.get("ts")
+    if isinstance(c_time, datetime):
+        return int(c_time.timestamp())
+    if isinstance(c_time, str):
+        try:
+            return int(datetime.fromisoformat(c_time.replace("Z", "+00:00")).timestamp())
+        except ValueError:
+            return 0
+    if isinstance(c_time, (int, float)):
+        return int(c_time)
+    return 0
+
+
+def scan_candles_since(candles: List[Dict[str, Any]], since_ts: float) -> Tuple[int, float, float]:
+    """Count candles after `since_ts` and their high/low in a single pass.
+
+    Returns (n_after, high_since, low_since); high/low are 0 / inf when n_after is 0.
+    """
+    n_after = 0
+    high_since = 0.0
+    low_since = float("inf")
+    for c in candles:
+        if _candle_ts(c) > since_ts:
+            n_after += 1
+            h = c.get("high", 0)
+            if h > high_since:
+                high_since = h
+            lo = c.get("low", float("inf"))
+            if lo < low_since:
+                low_since = lo
+    return n_after, high_since, low_since
+
+
 def check_signal_outcome(
     signal: Dict[str, Any],
     current_price: float,
@@ -312,23 +348,7 @@ def run_outcome_check(market_data_cache: Any) -> Dict[str, Any]:
             sig_ts = sig.get("created_at", 0)
             
             # Find candles AFTER signal was created
-            candles_after = []
-            for c in candles:
-                # Handle both "time" (datetime) and "timestamp" (int) formats
-                c_time = c.get("time") or c.get("timestamp") or c.get("ts")
-                if isinstance(c_time, datetime):
-                    c_ts = int(c_time.timestamp())
-                elif isinstance(c_time, str):
-                    try:
-                        c_ts = int(datetime.fromisoformat(c_time.replace("Z", "+00:00")).timestamp())
-                    except:
-                        c_ts = 0
-                elif isinstance(c_time, (int, float)):
-                    c_ts = int(c_time)
-                else:
-                    c_ts = 0
-                if c_ts > sig_ts:
-                    candles_after.append(c)
+            candles_after = [c for c in candles if _candle_ts(c) > sig_ts]
             
             if not candles_after:
                 # No candles after signal, still pending
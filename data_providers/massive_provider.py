@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
 import logging
 import random
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional
 
@@ -139,6 +141,7 @@ def _canon_tf(timeframe: str) -> str:
     return tf or "m5"
 
 
+@lru_cache(maxsize=256)
 def to_massive_ticker(internal_symbol: str) -> str:
     """Map internal symbol to Massive ticker.
 
@@ -206,6 +209,7 @@ class MassiveDataProvider(DataProvider):
 
         self._session = requests.Session()
         self._last_call_at = 0.0
+        self._rate_lock = threading.Lock()
 
     def normalize_symbol(self, symbol: str) -> str:
         raw = str(symbol or "").strip().upper().replace("/", "").replace(" ", "")
@@ -255,12 +259,15 @@ class MassiveDataProvider(DataProvider):
         return False
 
     def _rate_limit(self) -> None:
-        # naive per-process minimum spacing
-        now = time.time()
-        wait = (self._last_call_at + float(self._cfg.min_delay_s)) - now
+        # naive per-process minimum spacing; slots are reserved under a lock so
+        # concurrent callers (e.g. backfill --concurrency) stay spaced too.
+        with self._rate_lock:
+            now = time.time()
+            slot = max(now, self._last_call_at + float(self._cfg.min_delay_s))
+            self._last_call_at = slot
+        wait = slot - now
         if wait > 0:
             time.sleep(wait)
-        self._last_call_at = time.time()
 
     def _headers(self) -> Dict[str, str]:
         # Never log these headers.
@@ -11,6 +11,7 @@ No external dependencies.
 from __future__ import annotations
 
 import json
+import logging
 import secrets
 import time
 from typing import Any, Dict
@@ -42,7 +43,12 @@ def _fmt_value(v: Any) -> str:
 
 
 def log_kv(logger, msg: str, **kv: Any) -> None:
-    """Log `msg` plus `key=value` pairs in one line."""
+    """Log `msg` plus `key=value` pairs in one line.
+
+    Formatting is skipped entirely when INFO is filtered out.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     parts = [msg]
     for k in sorted(kv.keys()):
         parts.append(f"{k}={_fmt_value(kv[k])}")
@@ -58,6 +64,8 @@ def log_kv_error(logger, msg: str, **kv: Any) -> None:
 
 
 def log_kv_warning(logger, msg: str, **kv: Any) -> None:
+    if not logger.isEnabledFor(logging.WARNING):
+        return
     parts = [msg]
     for k in sorted(kv.keys()):
         parts.append(f"{k}={_fmt_value(kv[k])}")
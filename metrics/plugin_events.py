@@ -69,9 +69,14 @@ class PluginEvent:
 def emit_plugin_event(
     event: PluginEvent,
     *,
-    path: str = "state/plugin_events.jsonl",
+    path: Optional[str] = None,
 ) -> None:
-    """Append one plugin event JSONL line. Non-fatal by design."""
+    """Append one plugin event JSONL line. Non-fatal by design.
+
+    Default path: $STATE_DIR/plugin_events.jsonl (STATE_DIR defaults to "state").
+    """
+    if path is None:
+        path = os.path.join(os.getenv("STATE_DIR") or "state", "plugin_events.jsonl")
     try:
         from core.atomic_io import atomic_append_jsonl_via_replace
 
@@ -91,7 +96,7 @@ def emit_plugin_event_now(
     message: str = "",
     extra: Optional[Any] = None,
     flags: Optional[Any] = None,
-    path: str = "state/plugin_events.jsonl",
+    path: Optional[str] = None,
 ) -> None:
     emit_plugin_event(
         PluginEvent(
@@ -103,5 +108,5 @@ def emit_plugin_event_now(
             extra=extra,
             flags=flags,
         ),
-        path=str(path),
+        path=path,
     )
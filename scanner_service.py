@@ -6,8 +6,11 @@ import sys
 import time
 import hashlib
 import json
+import queue
+from collections import ChainMap
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from typing import Any as _Any
 
@@ -24,7 +27,7 @@ from data_ingestor_5m import DataIngestor
 from resample_5m import resample
 from engine_blocks import Candle
 from services.models import SignalEvent
-from services.notifier_telegram import telegram_notifier
+from services.notifier_telegram import SCANNER_RETRY_AFTER_MAX_S, telegram_notifier
 from services.chart_generator import generate_chart_image
 from signals_tracker import evaluate_pending_signals_for_user, record_signal
 from scanner_state import SignalStateStore
@@ -58,6 +61,26 @@ from engine.utils.logging_utils import make_scan_id, log_kv, log_kv_error
 from engine.utils.reason_codes import build_governance_evidence, normalize_pair_none_reason
 
 
+# Shared read-only stand-in for a missing/non-dict engine debug payload.
+_EMPTY_DEBUG: Mapping[str, Any] = MappingProxyType({})
+
+_CANON: Dict[Any, str] = {}
+_CANON_MAX = 256
+
+
+def _canon(v: Any) -> str:
+    """Interned `str(v).strip().lower()` for small config vocabularies (policy/mode)."""
+    try:
+        c = _CANON.get(v)
+    except TypeError:  # unhashable profile value
+        return str(v or "").strip().lower()
+    if c is None:
+        c = sys.intern(str(v or "").strip().lower())
+        if len(_CANON) < _CANON_MAX:
+            _CANON[v] = c
+    return c
+
+
 def _format_top_contribs(breakdown: Any, *, max_items: int = 3) -> Optional[str]:
     """Return compact contrib string: d1:0.62,d2:0.55"""
     if not isinstance(breakdown, dict):
@@ -125,8 +148,16 @@ logger = logging.getLogger("ScannerService")
 _EXPLAIN_AUDIT_LOCK = threading.Lock()
 
 
+def _explain_audit_enabled() -> bool:
+    return str(os.getenv("EXPLAIN_AUDIT", "")).strip() == "1"
+
+
+def _metrics_events_enabled() -> bool:
+    return bool(getattr(config, "METRICS_EVENTS_ENABLED", True))
+
+
 def _maybe_audit_explain(payload: Dict[str, Any]) -> None:
-    if str(os.getenv("EXPLAIN_AUDIT", "")).strip() != "1":
+    if not _explain_audit_enabled():
         return
     try:
         os.makedirs("logs", exist_ok=True)
@@ -145,9 +176,11 @@ def _maybe_emit_metrics_from_explain(
     debug: Any = None,
     failover_used: Optional[bool] = None,
 ) -> None:
+    if not _metrics_events_enabled():
+        return
     try:
         candidates = None
-        if isinstance(debug, dict):
+        if isinstance(debug, Mapping):
             candidates = debug.get("candidates")
         ev = build_event_from_explain(
             explain=payload,
@@ -159,6 +192,54 @@ def _maybe_emit_metrics_from_explain(
         return
 
 
+# Explain sinks (audit file + metrics events) run on a background thread so the
+# scanner never blocks on their file appends. When the queue is full the write
+# happens inline instead, so nothing is dropped.
+_EXPLAIN_SINK_QUEUE: "queue.Queue[Tuple[Dict[str, Any], Any, Optional[bool]]]" = queue.Queue(
+    maxsize=int(os.getenv("EXPLAIN_SINK_QUEUE_MAX", "2000") or 2000)
+)
+_EXPLAIN_SINK_THREAD: Optional[threading.Thread] = None
+_EXPLAIN_SINK_START_LOCK = threading.Lock()
+
+
+def _write_explain_sinks(payload: Dict[str, Any], candidates: Any, failover_used: Optional[bool]) -> None:
+    _maybe_audit_explain(payload)
+    _maybe_emit_metrics_from_explain(payload, debug={"candidates": candidates}, failover_used=failover_used)
+
+
+def _explain_sink_loop() -> None:
+    while True:
+        payload, candidates, failover_used = _EXPLAIN_SINK_QUEUE.get()
+        try:
+            _write_explain_sinks(payload, candidates, failover_used)
+        except Exception:
+            pass
+        finally:
+            _EXPLAIN_SINK_QUEUE.task_done()
+
+
+def _submit_explain_sinks(payload: Dict[str, Any], *, debug: Any = None, failover_used: Optional[bool] = None) -> None:
+    """Queue audit + metrics writes for the sink thread (inline fallback when full)."""
+    global _EXPLAIN_SINK_THREAD
+    candidates = debug.get("candidates") if isinstance(debug, Mapping) else None
+    if _EXPLAIN_SINK_THREAD is None:
+        with _EXPLAIN_SINK_START_LOCK:
+            if _EXPLAIN_SINK_THREAD is None:
+                t = threading.Thread(target=_explain_sink_loop, name="explain-sinks", daemon=True)
+                t.start()
+                _EXPLAIN_SINK_THREAD = t
+    try:
+        _EXPLAIN_SINK_QUEUE.put_nowait((payload, candidates, failover_used))
+    except queue.Full:
+        _write_explain_sinks(payload, candidates, failover_used)
+
+
+def _drain_explain_sinks() -> None:
+    """Block until queued explain sink writes are on disk (daily summary, shutdown)."""
+    if _EXPLAIN_SINK_THREAD is not None:
+        _EXPLAIN_SINK_QUEUE.join()
+
+
 def _attach_explain_to_debug(debug: Any, payload: Dict[str, Any]) -> Dict[str, Any]:
     """Attach explain payload into debug dict (NA-safe)."""
     if isinstance(debug, dict):
@@ -168,6 +249,90 @@ def _attach_explain_to_debug(debug: Any, payload: Dict[str, Any]) -> Dict[str, A
     out["explain"] = dict(payload or {})
     return out
 
+
+def _emit_explain(
+    *,
+    kind: str,
+    symbol: str,
+    tf: str,
+    scan_id: str,
+    strategy_id: Any,
+    reason: Optional[str] = None,
+    debug: Any = None,
+    explain_debug: Any = None,
+    governance: Optional[Dict[str, Any]] = None,
+    failover_used: Optional[bool] = None,
+    result: Any = None,
+    consumers_on: bool = True,
+    overlay: Optional[Mapping[str, Any]] = None,
+) -> Tuple[Optional[Dict[str, Any]], Any]:
+    """Build a PAIR_OK/PAIR_NONE explain payload, attach it and queue audit/metrics.
+
+    `explain_debug` is what the explain builder and metrics see; `debug` is the
+    dict the payload gets attached to (only when `result` is given).
+    `overlay` keys are layered over both: the builder sees them over
+    `explain_debug`, and the sinks see them over `debug` after the attach.
+    With `consumers_on` False (no audit, no metrics) PAIR_NONE payloads are
+    not queued for the sinks, and are not built at all unless there is a
+    `result` whose debug carries them. PAIR_OK payloads are always built and
+    queued (persist/notify).
+    Returns (payload, debug). Never raises: on failure payload is None and
+    debug is returned unchanged.
+    """
+    to_sinks = kind == "OK" or consumers_on
+    if not to_sinks and result is None:
+        return None, debug
+    try:
+        if overlay is not None:
+            explain_debug = ChainMap(dict(overlay), explain_debug if isinstance(explain_debug, Mapping) else {})
+        if kind == "OK":
+            payload = build_pair_ok_explain(
+                symbol=symbol,
+                tf=str(tf),
+                scan_id=scan_id,
+                strategy_id=str(strategy_id or "NA"),
+                debug=explain_debug,
+                governance=governance,
+            )
+        else:
+            payload = build_pair_none_explain(
+                symbol=symbol,
+                tf=str(tf),
+                scan_id=scan_id,
+                strategy_id=str(strategy_id or "NA"),
+                reason=str(reason),
+                debug=explain_debug,
+                governance=governance,
+            )
+        sink_debug = explain_debug
+        if result is not None:
+            debug = _attach_explain_to_debug(debug, payload)
+            result.debug = debug
+            if overlay is not None:
+                sink_debug = ChainMap(explain_debug.maps[0], debug)
+        if to_sinks:
+            _submit_explain_sinks(payload, debug=sink_debug, failover_used=failover_used)
+    except Exception:
+        return None, debug
+    return payload, debug
+
+def _setup_direction_str(direction: Any) -> str:
+    """str() of a setup direction, but "" (falsy) for None so `or` fallbacks still apply."""
+    return str(direction) if direction is not None else ""
+
+
+class _LazyMs:
+    """Elapsed monotonic nanoseconds, rendered as `12.34` ms only when a log line is built."""
+
+    __slots__ = ("ns",)
+
+    def __init__(self, ns: int) -> None:
+        self.ns = ns
+
+    def __str__(self) -> str:
+        return f"{self.ns / 1_000_000:.2f}"
+
+
 _CACHE_PERSIST_PATH = os.getenv("MARKET_CACHE_PATH", "state/market_cache.json")
 
 
@@ -189,24 +354,6 @@ def _convert_dicts_to_candles(items: List[Dict[str, Any]]) -> List[Candle]:
     return out
 
 
-def _shift_candle_dict_times(items: List[Dict[str, Any]], tz_offset_hours: int) -> List[Dict[str, Any]]:
-    if not tz_offset_hours:
-        return items
-    out: List[Dict[str, Any]] = []
-    delta = timedelta(hours=int(tz_offset_hours))
-    for d in items:
-        try:
-            t = d.get("time")
-            if isinstance(t, datetime):
-                nd = dict(d)
-                nd["time"] = t + delta
-                out.append(nd)
-            else:
-                out.append(d)
-        except Exception:
-            out.append(d)
-    return out
-
 class ScannerService:
     def __init__(self):
         self._stop_event = threading.Event()
@@ -218,7 +365,7 @@ class ScannerService:
         # if the environment has a broken APScheduler installation.
         self._scheduler: Optional[_Any] = None
 
-        self._state_store = SignalStateStore()
+        self._state_store = SignalStateStore(fmt=config.SIGNAL_STATE_FORMAT)
         self._state_loaded = False
         self._state_dirty = False
         self._state_last_saved_ts: float = 0.0
@@ -267,6 +414,10 @@ class ScannerService:
         if self._thread:
             self._thread.join(timeout=5)
             logger.info("ScannerService stopped.")
+        self._flush_state_if_dirty(scan_id="shutdown", force=True)
+        # The sink thread is a daemon: wait for queued audit/metrics writes
+        # before the process can exit.
+        _drain_explain_sinks()
 
     def manual_scan(self):
         logger.info("Manual scan triggered.")
@@ -935,6 +1086,9 @@ class ScannerService:
             today = datetime.now(timezone.utc).date().isoformat()
             last = str(getattr(self, "_metrics_last_summary_date", "") or "")
             if today != last:
+                # The summary reads metrics events written by the sink thread;
+                # wait for queued writes only here, not on every cycle.
+                _drain_explain_sinks()
                 summary = summarize_last_24h(events_path="state/metrics_events.jsonl")
                 summary_dict = summary.to_dict()
                 top_reason = summary.top_reasons[0]["reason"] if summary.top_reasons else "NA"
@@ -1321,7 +1475,7 @@ class ScannerService:
                 f"⚠️ DATA_GAP {sym} "
                 f"{trend_tf} {have_trend}/{need_trend} | {entry_tf} {have_entry}/{need_entry}"
             )
-            telegram_notifier.send_message(msg, chat_id=chat_id)
+            telegram_notifier.send_message(msg, chat_id=chat_id, retry_after_max_s=SCANNER_RETRY_AFTER_MAX_S)
         except Exception:
             return
 
@@ -1462,6 +1616,10 @@ class ScannerService:
         if not self._state_dirty:
             return
 
+        # Journaled store: each change is already on disk; only compact periodically.
+        if not self._state_store.should_compact():
+            return
+
         now_ts = time.time()
         if (now_ts - self._state_last_saved_ts) < float(self._state_save_min_interval_sec):
             return
@@ -1485,10 +1643,12 @@ class ScannerService:
         except Exception:
             log_kv_error(logger, "STATE_SAVE_ERROR", scan_id=scan_id)
 
-    def _flush_state_if_dirty(self, *, scan_id: str) -> None:
-        # Force save at end-of-cycle if dirty.
+    def _flush_state_if_dirty(self, *, scan_id: str, force: bool = False) -> None:
+        # Save at end-of-cycle if dirty (journaled store: only when compaction is due).
         if not self._state_dirty:
             return
+        if not force and not self._state_store.should_compact():
+            return
         t0 = time.perf_counter()
         try:
             now_ts = time.time()
@@ -1595,6 +1755,17 @@ class ScannerService:
         
         signals_sent = 0
 
+        # Probe explain consumers once per scan; PAIR_NONE payloads are skipped when both are off.
+        explain_consumers_on = _explain_audit_enabled() or _metrics_events_enabled()
+
+        # Winner strategy lookup by id (used after engine arbitration / failover).
+        strategies_by_id: Dict[str, Dict[str, Any]] = {}
+        for s in strategies:
+            if isinstance(s, dict):
+                sid = str(s.get("strategy_id") or "").strip()
+                if sid:
+                    strategies_by_id.setdefault(sid, s)
+
         default_entry_tf = "NA"
         try:
             if isinstance(active_strategy, dict):
@@ -1605,7 +1776,7 @@ class ScannerService:
             default_entry_tf = "NA"
 
         for pair in pairs:
-            t_symbol = time.perf_counter()
+            t_symbol = time.monotonic_ns()
             symbol = pair.strip().upper()
             # If profile strategy config is invalid, do not proceed with scanning.
             if not strategies and profile_errors:
@@ -1618,20 +1789,15 @@ class ScannerService:
                         "reason": "PROFILE_INVALID",
                         "internal_reason": "profile_invalid",
                     }
-                try:
-                    payload = build_pair_none_explain(
-                        symbol=symbol,
-                        tf=default_entry_tf,
-                        scan_id=scan_id,
-                        strategy_id=str(strategy_id or "NA"),
-                        reason="PROFILE_INVALID",
-                        debug=None,
-                        governance=None,
-                    )
-                    _maybe_audit_explain(payload)
-                    _maybe_emit_metrics_from_explain(payload, debug=None, failover_used=None)
-                except Exception:
-                    pass
+                _emit_explain(
+                    kind="NONE",
+                    consumers_on=explain_consumers_on,
+                    symbol=symbol,
+                    tf=default_entry_tf,
+                    scan_id=scan_id,
+                    strategy_id=strategy_id,
+                    reason="PROFILE_INVALID",
+                )
                 log_kv(
                     logger,
                     "PAIR_NONE",
@@ -1640,15 +1806,12 @@ class ScannerService:
                     strategy_id=strategy_id,
                     reason="PROFILE_INVALID",
                     **extra,
-                    ms_total=f"{(time.perf_counter() - t_symbol) * 1000.0:.2f}",
+                    ms_total=_LazyMs(time.monotonic_ns() - t_symbol),
                 )
                 continue
 
 
-            t_market = time.perf_counter()
             raw_5m = market_cache.get_candles(symbol)
-            market_cache_get_ms = (time.perf_counter() - t_market) * 1000.0
-            market_cache_hit = bool(raw_5m)
             if not raw_5m:
                 r_out = normalize_pair_none_reason(["no_m5"])
                 if isinstance(outcomes, dict):
@@ -1657,20 +1820,16 @@ class ScannerService:
                         "reason": r_out,
                         "internal_reason": "no_m5",
                     }
-                try:
-                    payload = build_pair_none_explain(
-                        symbol=symbol,
-                        tf=default_entry_tf,
-                        scan_id=scan_id,
-                        strategy_id=str(strategy_id or "NA"),
-                        reason=r_out,
-                        debug={"internal_reason": "no_m5"},
-                        governance=None,
-                    )
-                    _maybe_audit_explain(payload)
-                    _maybe_emit_metrics_from_explain(payload, debug={"internal_reason": "no_m5"}, failover_used=None)
-                except Exception:
-                    pass
+                _emit_explain(
+                    kind="NONE",
+                    consumers_on=explain_consumers_on,
+                    symbol=symbol,
+                    tf=default_entry_tf,
+                    scan_id=scan_id,
+                    strategy_id=strategy_id,
+                    reason=r_out,
+                    explain_debug={"internal_reason": "no_m5"},
+                )
                 log_kv(
                     logger,
                     "PAIR_NONE",
@@ -1679,7 +1838,7 @@ class ScannerService:
                     strategy_id=strategy_id,
                     reason=r_out,
                     internal_reason="no_m5",
-                    ms_total=f"{(time.perf_counter() - t_symbol) * 1000.0:.2f}",
+                    ms_total=_LazyMs(time.monotonic_ns() - t_symbol),
                 )
                 continue
 
@@ -1729,26 +1888,22 @@ class ScannerService:
                         "trend_tf": str(details.get("trend_tf") or trend_tf),
                         "entry_tf": str(details.get("entry_tf") or entry_tf),
                     }
-                try:
-                    payload = build_pair_none_explain(
-                        symbol=symbol,
-                        tf=str(entry_tf),
-                        scan_id=scan_id,
-                        strategy_id=str(strategy_id or "NA"),
-                        reason=r_out,
-                        debug={
-                            "internal_reason": "data_gap",
-                            f"have_{tf1}": have1,
-                            f"need_{tf1}": need1,
-                            f"have_{tf2}": have2,
-                            f"need_{tf2}": need2,
-                        },
-                        governance=None,
-                    )
-                    _maybe_audit_explain(payload)
-                    _maybe_emit_metrics_from_explain(payload, debug={"internal_reason": "data_gap"}, failover_used=None)
-                except Exception:
-                    pass
+                _emit_explain(
+                    kind="NONE",
+                    consumers_on=explain_consumers_on,
+                    symbol=symbol,
+                    tf=entry_tf,
+                    scan_id=scan_id,
+                    strategy_id=strategy_id,
+                    reason=r_out,
+                    explain_debug={
+                        "internal_reason": "data_gap",
+                        f"have_{tf1}": have1,
+                        f"need_{tf1}": need1,
+                        f"have_{tf2}": have2,
+                        f"need_{tf2}": need2,
+                    },
+                )
                 log_kv(
                     logger,
                     "PAIR_NONE",
@@ -1758,7 +1913,7 @@ class ScannerService:
                     reason=r_out,
                     internal_reason="data_gap",
                     **{f"have_{tf1}": have1, f"need_{tf1}": need1, f"have_{tf2}": have2, f"need_{tf2}": need2},
-                    ms_total=f"{(time.perf_counter() - t_symbol) * 1000.0:.2f}",
+                    ms_total=_LazyMs(time.monotonic_ns() - t_symbol),
                 )
                 continue
 
@@ -1771,8 +1926,6 @@ class ScannerService:
 
             engine_version = str(active_strategy.get("engine_version") or profile.get("engine_version") or "").strip()
 
-            # Engine call timing
-            t_engine = time.perf_counter()
             try:
                 if engine_version.lower().startswith("indicator_free"):
                     # New indicator-free pipeline (structure trend + engines.detectors)
@@ -1809,30 +1962,19 @@ class ScannerService:
                         "internal_reason": str(type(_eng_exc).__name__),
                     }
                 continue
-            engine_ms = (time.perf_counter() - t_engine) * 1000.0
 
             if result.strategy_name is None and isinstance(active_strategy, dict):
                 result.strategy_name = str(active_strategy.get("name") or "").strip() or None
 
             debug = result.debug or {}
+            # Read-only view, re-bound whenever `debug` is reassigned.
+            dbg_view = debug if isinstance(debug, dict) else _EMPTY_DEBUG
             # Prefer engine-provided strategy_id if present.
-            try:
-                if isinstance(debug, dict):
-                    strategy_id = str(debug.get("strategy_id") or "").strip() or strategy_id
-            except Exception:
-                pass
+            strategy_id = str(dbg_view.get("strategy_id") or "").strip() or strategy_id
 
             # Governance must be applied using the winner strategy config (not strategies[0]).
             # This ensures one noisy strategy doesn't block others.
-            winner_strategy = active_strategy
-            try:
-                if isinstance(strategies, list) and strategies and strategy_id:
-                    winner_strategy = next(
-                        (s for s in strategies if isinstance(s, dict) and str(s.get("strategy_id") or "").strip() == str(strategy_id)),
-                        active_strategy,
-                    )
-            except Exception:
-                winner_strategy = active_strategy
+            winner_strategy = strategies_by_id.get(str(strategy_id or ""), active_strategy)
             per_detector_ms = debug.get("per_detector_ms") if isinstance(debug.get("per_detector_ms"), dict) else {}
 
             # Performance guard: feature build + per-detector timing (indicator-free engine)
@@ -1913,13 +2055,13 @@ class ScannerService:
                     pass
                 return out
 
-            selected = _extract_selected(result, debug if isinstance(debug, dict) else {})
+            selected = _extract_selected(result, dbg_view)
 
-            ms_total = (time.perf_counter() - t_symbol) * 1000.0
+            ms_total_ns = time.monotonic_ns() - t_symbol
 
             # Performance guard: per-pair total runtime
             try:
-                if float(ms_total) > float(config.PAIR_WARN_MS):
+                if ms_total_ns > int(config.PAIR_WARN_MS) * 1_000_000:
                     self._perf_pair_warn_total += 1
                     log_kv(
                         logger,
@@ -1927,7 +2069,7 @@ class ScannerService:
                         scan_id=scan_id,
                         symbol=symbol,
                         kind="pair_ms",
-                        ms=f"{ms_total:.2f}",
+                        ms=_LazyMs(ms_total_ns),
                         warn_ms=int(config.PAIR_WARN_MS),
                         engine=str(engine_version or ""),
                     )
@@ -2041,25 +2183,18 @@ class ScannerService:
                 except Exception:
                     extra = {}
 
-                try:
-                    payload = build_pair_none_explain(
-                        symbol=symbol,
-                        tf=str(entry_tf),
-                        scan_id=scan_id,
-                        strategy_id=str(strategy_id or "NA"),
-                        reason=str(reason),
-                        debug=(dbg if isinstance(dbg, dict) else None),
-                        governance=None,
-                    )
-                    debug = _attach_explain_to_debug(debug, payload)
-                    try:
-                        result.debug = debug
-                    except Exception:
-                        pass
-                    _maybe_audit_explain(payload)
-                    _maybe_emit_metrics_from_explain(payload, debug=(dbg if isinstance(dbg, dict) else None), failover_used=None)
-                except Exception:
-                    pass
+                _, debug = _emit_explain(
+                    kind="NONE",
+                    consumers_on=explain_consumers_on,
+                    symbol=symbol,
+                    tf=entry_tf,
+                    scan_id=scan_id,
+                    strategy_id=strategy_id,
+                    reason=reason,
+                    debug=debug,
+                    explain_debug=(dbg if isinstance(dbg, dict) else None),
+                    result=result,
+                )
                 log_kv(
                     logger,
                     "PAIR_NONE",
@@ -2068,7 +2203,7 @@ class ScannerService:
                     strategy_id=strategy_id,
                     reason=reason,
                     **extra,
-                    ms_total=f"{ms_total:.2f}",
+                    ms_total=_LazyMs(ms_total_ns),
                 )
 
                 if isinstance(outcomes, dict):
@@ -2080,21 +2215,17 @@ class ScannerService:
 
             if result.has_setup and result.setup is not None:
                 # Keep original arbitration summary from engine (winner before governance).
-                base_debug = debug if isinstance(debug, dict) else {}
                 base_summary = {}
-                try:
-                    for k in ("candidates", "candidates_top", "winner_strategy_id"):
-                        if k in base_debug and base_debug.get(k) is not None:
-                            base_summary[k] = base_debug.get(k)
-                except Exception:
-                    base_summary = {}
+                for k in ("candidates", "candidates_top", "winner_strategy_id"):
+                    if dbg_view.get(k) is not None:
+                        base_summary[k] = dbg_view.get(k)
 
                 ranked_results = None
                 try:
-                    if isinstance(debug, dict) and isinstance(debug.get("_candidates_ranked_results"), list):
+                    if isinstance(dbg_view.get("_candidates_ranked_results"), list):
                         ranked_results = [
                             r
-                            for r in debug.get("_candidates_ranked_results")
+                            for r in dbg_view.get("_candidates_ranked_results")
                             if getattr(r, "has_setup", False) and getattr(r, "setup", None) is not None
                         ]
                 except Exception:
@@ -2122,25 +2253,21 @@ class ScannerService:
                     gov = gov or build_governance_evidence(strategy_id=blocked_winner_strategy_id, symbol=symbol, tf=entry_tf)
                     gov_flat = {f"governance_{k}": v for k, v in gov.items()}
 
-                    try:
-                        payload = build_pair_none_explain(
-                            symbol=symbol,
-                            tf=str(entry_tf),
-                            scan_id=scan_id,
-                            strategy_id=str(strategy_id or "NA"),
-                            reason=r_out,
-                            debug=(debug if isinstance(debug, dict) else None),
-                            governance=gov,
-                        )
-                        debug = _attach_explain_to_debug(debug, payload)
-                        try:
-                            result.debug = debug
-                        except Exception:
-                            pass
-                        _maybe_audit_explain(payload)
-                        _maybe_emit_metrics_from_explain(payload, debug=debug, failover_used=used_failover)
-                    except Exception:
-                        pass
+                    _, debug = _emit_explain(
+                        kind="NONE",
+                        consumers_on=explain_consumers_on,
+                        symbol=symbol,
+                        tf=entry_tf,
+                        scan_id=scan_id,
+                        strategy_id=strategy_id,
+                        reason=r_out,
+                        debug=debug,
+                        explain_debug=dbg_view,
+                        governance=gov,
+                        failover_used=used_failover,
+                        result=result,
+                    )
+                    dbg_view = debug if isinstance(debug, dict) else _EMPTY_DEBUG
                     log_kv(
                         logger,
                         "PAIR_NONE",
@@ -2148,12 +2275,12 @@ class ScannerService:
                         symbol=symbol,
                         strategy_id=str(strategy_id),
                         reason=r_out,
-                        candidates=(debug.get("candidates") if isinstance(debug, dict) else None),
-                        candidates_top=(debug.get("candidates_top") if isinstance(debug, dict) else None),
+                        candidates=dbg_view.get("candidates"),
+                        candidates_top=dbg_view.get("candidates_top"),
                         blocked_winner_strategy_id=blocked_winner_strategy_id,
                         blocked_reason=r_out,
                         **gov_flat,
-                        ms_total=f"{ms_total:.2f}",
+                        ms_total=_LazyMs(ms_total_ns),
                     )
 
                     if isinstance(outcomes, dict):
@@ -2170,46 +2297,39 @@ class ScannerService:
                     result = chosen_result
                     debug = result.debug or {}
                     # Preserve arbitration summary fields from the original engine winner.
-                    try:
-                        if isinstance(debug, dict) and isinstance(base_summary, dict) and base_summary:
-                            merged = dict(debug)
-                            merged.update(base_summary)
-                            result.debug = merged
-                            debug = merged
-                    except Exception:
-                        pass
+                    if isinstance(debug, dict) and base_summary:
+                        merged = dict(debug)
+                        merged.update(base_summary)
+                        result.debug = merged
+                        debug = merged
+                    dbg_view = debug if isinstance(debug, dict) else _EMPTY_DEBUG
                     # Prefer chosen strategy id.
-                    try:
-                        if isinstance(debug, dict):
-                            strategy_id = str(debug.get("strategy_id") or "").strip() or strategy_id
-                    except Exception:
-                        pass
+                    strategy_id = str(dbg_view.get("strategy_id") or "").strip() or strategy_id
                     # Also update winner strategy config
-                    try:
-                        if isinstance(strategies, list) and strategies and strategy_id:
-                            winner_strategy = next(
-                                (s for s in strategies if isinstance(s, dict) and str(s.get("strategy_id") or "").strip() == str(strategy_id)),
-                                active_strategy,
-                            )
-                    except Exception:
-                        winner_strategy = active_strategy
+                    winner_strategy = strategies_by_id.get(str(strategy_id or ""), active_strategy)
 
                     # Recompute selected fields after failover to avoid stale score/direction/rr.
-                    selected = _extract_selected(result, debug if isinstance(debug, dict) else {})
+                    selected = _extract_selected(result, dbg_view)
 
                 setup = result.setup
+                setup_dir = _setup_direction_str(setup.direction)
+                setup_entry = float(setup.entry)
+                setup_sl = float(setup.sl)
+                setup_tp = float(setup.tp)
+                setup_rr = float(setup.rr)
                 reasons = list(result.reasons)
                 if result.strategy_name:
                     reasons.insert(0, f"STRATEGY|{result.strategy_name}")
 
-                signal = SignalEvent(
+                # Fields below are already coerced; skip pydantic re-validation per signal.
+                signal = SignalEvent.model_construct(
                     pair=symbol,
-                    direction=setup.direction,
+                    direction=setup_dir,
                     timeframe=entry_tf,
-                    entry=float(setup.entry),
-                    sl=float(setup.sl),
-                    tp=float(setup.tp),
-                    rr=float(setup.rr),
+                    entry=setup_entry,
+                    sl=setup_sl,
+                    tp=setup_tp,
+                    rr=setup_rr,
                     reasons=reasons,
                     tz_offset_hours=tz_offset_hours,
                     engine_version=(engine_version or (result.strategy_name or "")),
@@ -2235,35 +2355,36 @@ class ScannerService:
                 if min_score > 0.0 and score_val is not None and score_val < min_score:
                     r_out = normalize_pair_none_reason(["low_score"])
 
+                    overlay: Optional[Dict[str, Any]] = None
                     try:
-                        tmp_dbg = dict(debug) if isinstance(debug, dict) else {}
-                        tmp_dbg["min_score"] = float(min_score)
+                        overlay = {"min_score": float(min_score)}
                         if score_val is not None:
-                            d = str(selected.get("direction") or setup.direction or "").upper()
-                            tmp_dbg["direction"] = d or tmp_dbg.get("direction")
+                            d = str(selected.get("direction") or setup_dir or "").upper()
+                            if d:
+                                overlay["direction"] = d
                             if d == "BUY":
-                                tmp_dbg["buy_score"] = float(score_val)
+                                overlay["buy_score"] = float(score_val)
                             elif d == "SELL":
-                                tmp_dbg["sell_score"] = float(score_val)
-
-                        payload = build_pair_none_explain(
+                                overlay["sell_score"] = float(score_val)
+                    except Exception:
+                        overlay = None
+                        log_kv_error(logger, "EXPLAIN_BUILD_ERROR", scan_id=scan_id, symbol=symbol, reason=r_out)
+                    if overlay is not None:
+                        _, debug = _emit_explain(
+                            kind="NONE",
+                            consumers_on=explain_consumers_on,
                             symbol=symbol,
-                            tf=str(entry_tf),
+                            tf=entry_tf,
                             scan_id=scan_id,
-                            strategy_id=str(strategy_id or "NA"),
+                            strategy_id=strategy_id,
                             reason=r_out,
-                            debug=tmp_dbg,
+                            debug=debug,
+                            explain_debug=dbg_view,
+                            overlay=overlay,
                             governance=gov,
+                            failover_used=used_failover,
+                            result=result,
                         )
-                        debug = _attach_explain_to_debug(debug, payload)
-                        try:
-                            result.debug = debug
-                        except Exception:
-                            pass
-                        _maybe_audit_explain(payload)
-                        _maybe_emit_metrics_from_explain(payload, debug=tmp_dbg, failover_used=used_failover)
-                    except Exception:
-                        pass
                     log_kv(
                         logger,
                         "PAIR_NONE",
@@ -2273,7 +2394,7 @@ class ScannerService:
                         reason=r_out,
                         score=f"{score_val:.2f}",
                         min_score=f"{min_score:.2f}",
-                        ms_total=f"{ms_total:.2f}",
+                        ms_total=_LazyMs(ms_total_ns),
                     )
 
                     if isinstance(outcomes, dict):
@@ -2299,20 +2420,20 @@ class ScannerService:
                 )
 
                 # Conflict policy (same-day opposite direction)
-                conflict_policy = str(
+                conflict_policy = _canon(
                     (winner_strategy.get("conflict_policy") if isinstance(winner_strategy, dict) else None)
                     or profile.get("conflict_policy")
                     or "skip"
-                ).strip().lower()
+                )
 
-                notify_mode = str(getattr(config, "NOTIFY_MODE", "all") or "all").strip().lower()
+                notify_mode = _canon(getattr(config, "NOTIFY_MODE", "all") or "all")
 
                 # Strategy-scoped persistence key (Step 8)
                 signal_key = self._make_persistent_signal_key(
                     symbol=str(symbol),
-                    timeframe=str(signal.timeframe),
+                    timeframe=str(entry_tf),
                     strategy_id=str(strategy_id or ""),
-                    direction=str(signal.direction),
+                    direction=setup_dir,
                 )
                 now_ts = time.time()
 
@@ -2320,7 +2441,7 @@ class ScannerService:
                     if conflict_policy == "skip":
                         try:
                             day_key = self._get_day_key_utc(tz_offset_hours)
-                            target_dir = str(signal.direction).upper()
+                            target_dir = setup_dir.upper()
                             for rec in self._state_store.snapshot_sent():
                                 if rec.symbol != symbol:
                                     continue
@@ -2335,27 +2456,21 @@ class ScannerService:
                                 if self._get_day_key_from_epoch(rec.ts, tz_offset_hours) == day_key:
                                     r_out = normalize_pair_none_reason(["conflict"])
 
-                                    try:
-                                        tmp_dbg = dict(debug) if isinstance(debug, dict) else {}
-                                        tmp_dbg["direction"] = target_dir
-                                        payload = build_pair_none_explain(
-                                            symbol=symbol,
-                                            tf=str(entry_tf),
-                                            scan_id=scan_id,
-                                            strategy_id=str(strategy_id or "NA"),
-                                            reason=r_out,
-                                            debug=tmp_dbg,
-                                            governance=gov,
-                                        )
-                                        debug = _attach_explain_to_debug(debug, payload)
-                                        try:
-                                            result.debug = debug
-                                        except Exception:
-                                            pass
-                                        _maybe_audit_explain(payload)
-                                        _maybe_emit_metrics_from_explain(payload, debug=tmp_dbg, failover_used=used_failover)
-                                    except Exception:
-                                        pass
+                                    _, debug = _emit_explain(
+                                        kind="NONE",
+                                        consumers_on=explain_consumers_on,
+                                        symbol=symbol,
+                                        tf=entry_tf,
+                                        scan_id=scan_id,
+                                        strategy_id=strategy_id,
+                                        reason=r_out,
+                                        debug=debug,
+                                        explain_debug=dbg_view,
+                                        overlay={"direction": target_dir},
+                                        governance=gov,
+                                        failover_used=used_failover,
+                                        result=result,
+                                    )
                                     log_kv(
                                         logger,
                                         "PAIR_NONE",
@@ -2366,7 +2481,7 @@ class ScannerService:
                                         policy=conflict_policy,
                                         prev_direction=rec.direction,
                                         direction=target_dir,
-                                        ms_total=f"{ms_total:.2f}",
+                                        ms_total=_LazyMs(ms_total_ns),
                                     )
                                     raise StopIteration()
                         except StopIteration:
@@ -2385,7 +2500,7 @@ class ScannerService:
                         # Shadow Logic: strictly experimental.
                         # Example: Shadow model penalizes low RR more heavily logic.
                         shadow_score = score_val
-                        if getattr(signal, "rr", 0.0) < 2.0:
+                        if setup_rr < 2.0:
                             shadow_score *= 0.8
                         
                         log_kv(
@@ -2403,47 +2518,37 @@ class ScannerService:
                 # -------------------------------
 
                 hits_n = None
-                try:
-                    if isinstance(debug, dict):
-                        hd = debug.get("hits")
-                        if isinstance(hd, list):
-                            hits_n = int(len(hd))
-                        chosen = debug.get("detectors_hit")
-                        if isinstance(chosen, list) and chosen:
-                            top_hits = ",".join([str(x) for x in chosen[:4]])
-                except Exception:
-                    top_hits = None
-                    hits_n = None
-
-                try:
-                    payload = build_pair_ok_explain(
-                        symbol=symbol,
-                        tf=str(entry_tf),
-                        scan_id=scan_id,
-                        strategy_id=str(strategy_id or "NA"),
-                        debug=(debug if isinstance(debug, dict) else None),
-                        governance=gov,
-                    )
-                    debug = _attach_explain_to_debug(debug, payload)
-                    try:
-                        result.debug = debug
-                    except Exception:
-                        pass
-                    _maybe_audit_explain(payload)
-                    _maybe_emit_metrics_from_explain(payload, debug=debug, failover_used=used_failover)
-                except Exception:
-                    payload = None
+                hd = dbg_view.get("hits")
+                if isinstance(hd, list):
+                    hits_n = len(hd)
+                chosen = dbg_view.get("detectors_hit")
+                if isinstance(chosen, list) and chosen:
+                    top_hits = ",".join([str(x) for x in chosen[:4]])
+
+                payload, debug = _emit_explain(
+                    kind="OK",
+                    symbol=symbol,
+                    tf=entry_tf,
+                    scan_id=scan_id,
+                    strategy_id=strategy_id,
+                    debug=debug,
+                    explain_debug=dbg_view,
+                    governance=gov,
+                    failover_used=used_failover,
+                    result=result,
+                )
+                dbg_view = debug if isinstance(debug, dict) else _EMPTY_DEBUG
 
                 try:
                     self._persist_signal_safely(
                         user_id=str(user_id),
                         symbol=str(symbol),
                         entry_tf=str(entry_tf),
-                        direction=str(setup.direction),
-                        entry=float(setup.entry),
-                        sl=float(setup.sl),
-                        tp=float(setup.tp),
-                        rr=float(setup.rr),
+                        direction=setup_dir,
+                        entry=setup_entry,
+                        sl=setup_sl,
+                        tp=setup_tp,
+                        rr=setup_rr,
                         strategy_id=str(strategy_id or "NA"),
                         scan_id=str(scan_id),
                         reasons=list(reasons or []),
@@ -2463,7 +2568,7 @@ class ScannerService:
                             signal_key,
                             now_ts,
                             symbol,
-                            direction=str(signal.direction),
+                            direction=setup_dir,
                             timeframe=str(entry_tf),
                             strategy_id=str(strategy_id or ""),
                         )
@@ -2474,6 +2579,9 @@ class ScannerService:
                     except Exception:
                         log_kv_error(logger, "STATE_RECORD_PERSIST_ERROR", scan_id=scan_id, symbol=symbol)
 
+                score_log_fields = _extract_score_breakdown_fields_for_logs(dbg_view)
+                regime_ev = dbg_view.get("regime_evidence")
+                regime_counts = regime_ev if isinstance(regime_ev, dict) else _EMPTY_DEBUG
                 log_kv(
                     logger,
                     "PAIR_OK",
@@ -2482,8 +2590,8 @@ class ScannerService:
                     strategy_id=strategy_id,
                     # Log contract: winner_strategy_id must match final winner (strategy_id).
                     winner_strategy_id=strategy_id,
-                    candidates=(debug.get("candidates") if isinstance(debug, dict) else None),
-                    candidates_top=(debug.get("candidates_top") if isinstance(debug, dict) else None),
+                    candidates=dbg_view.get("candidates"),
+                    candidates_top=dbg_view.get("candidates_top"),
                     blocked_winner_strategy_id=blocked_winner_strategy_id,
                     blocked_reason=blocked_reason,
                     failover_used=("true" if used_failover else "false"),
@@ -2491,51 +2599,35 @@ class ScannerService:
                     detector="soft_combine",
                     direction=selected.get("direction"),
                     score=selected.get("score"),
-                    **(_extract_score_breakdown_fields_for_logs(debug) if isinstance(debug, dict) else {}),
+                    **score_log_fields,
                     min_score=selected.get("min_score"),
                     hits=hits_n,
                     top_hits=top_hits,
                     final_strategy="soft_combine",
                     regime=selected.get("regime"),
-                    regime_evidence=(debug.get("regime_evidence") if isinstance(debug, dict) else None),
-                    hh=(
-                        (debug.get("regime_evidence") or {}).get("hh")
-                        if isinstance(debug, dict) and isinstance(debug.get("regime_evidence"), dict)
-                        else None
-                    ),
-                    hl=(
-                        (debug.get("regime_evidence") or {}).get("hl")
-                        if isinstance(debug, dict) and isinstance(debug.get("regime_evidence"), dict)
-                        else None
-                    ),
-                    lh=(
-                        (debug.get("regime_evidence") or {}).get("lh")
-                        if isinstance(debug, dict) and isinstance(debug.get("regime_evidence"), dict)
-                        else None
-                    ),
-                    ll=(
-                        (debug.get("regime_evidence") or {}).get("ll")
-                        if isinstance(debug, dict) and isinstance(debug.get("regime_evidence"), dict)
-                        else None
-                    ),
+                    regime_evidence=regime_ev,
+                    hh=regime_counts.get("hh"),
+                    hl=regime_counts.get("hl"),
+                    lh=regime_counts.get("lh"),
+                    ll=regime_counts.get("ll"),
                     detectors=selected.get("detectors"),
-                    params_digest=(debug.get("params_digest") if isinstance(debug, dict) else None),
+                    params_digest=dbg_view.get("params_digest"),
                     rr=selected.get("rr"),
-                    ms_total=f"{ms_total:.2f}",
+                    ms_total=_LazyMs(ms_total_ns),
                 )
 
                 # Enqueue event for async worker processing (non-blocking)
                 try:
-                    _enqueue_ts = time.perf_counter()
+                    _enqueue_ts = time.monotonic_ns()
                     _eq_payload = {
                         "scan_id": str(scan_id),
                         "user_id": str(user_id),
                         "detector": "soft_combine",
                         "direction": str(selected.get("direction") or ""),
-                        "entry": float(getattr(setup, "entry", 0.0)),
-                        "sl": float(getattr(setup, "sl", 0.0)),
-                        "tp": float(getattr(setup, "tp", 0.0)),
-                        "rr": float(getattr(setup, "rr", 0.0)),
+                        "entry": setup_entry,
+                        "sl": setup_sl,
+                        "tp": setup_tp,
+                        "rr": setup_rr,
                         "score": float(selected.get("score") or 0.0),
                         "strategy_id": str(strategy_id or ""),
                         "detectors": selected.get("detectors"),
@@ -2549,39 +2641,26 @@ class ScannerService:
                         setup_key=signal_key,
                         payload=_eq_payload,
                     )
-                    _enqueue_ms = (time.perf_counter() - _enqueue_ts) * 1000.0
+                    _enqueue_ns = time.monotonic_ns() - _enqueue_ts
                     if _eq_id:
-                        log_kv(logger, "EVENT_ENQUEUE", scan_id=scan_id, symbol=symbol, event_id=_eq_id[:8], ms=f"{_enqueue_ms:.2f}")
+                        log_kv(logger, "EVENT_ENQUEUE", scan_id=scan_id, symbol=symbol, event_id=_eq_id[:8], ms=_LazyMs(_enqueue_ns))
                 except Exception as _eq_err:
                     log_kv_error(logger, "EVENT_ENQUEUE_ERROR", scan_id=scan_id, symbol=symbol, err=str(type(_eq_err).__name__))
 
                 if isinstance(outcomes, dict):
-                    try:
-                        outcomes[str(symbol).upper()] = {
-                            "kind": "OK",
-                            "strategy_id": str(strategy_id or "NA"),
-                            "direction": str(getattr(setup, "direction", None) or selected.get("direction") or "NA"),
-                            "entry": float(getattr(setup, "entry", 0.0)),
-                            "sl": float(getattr(setup, "sl", 0.0)),
-                            "tp": float(getattr(setup, "tp", 0.0)),
-                            "rr": float(getattr(setup, "rr", 0.0)),
-                        }
-                    except Exception:
-                        outcomes[str(symbol).upper()] = {
-                            "kind": "OK",
-                            "strategy_id": str(strategy_id or "NA"),
-                        }
-
-                # Contract sanity: avoid winner/strategy mismatch in logs.
-                try:
-                    if str(strategy_id) != str(strategy_id):
-                        raise ValueError("strategy_id mismatch")
-                except Exception:
-                    pass
+                    outcomes[str(symbol).upper()] = {
+                        "kind": "OK",
+                        "strategy_id": str(strategy_id or "NA"),
+                        "direction": setup_dir or str(selected.get("direction") or "NA"),
+                        "entry": setup_entry,
+                        "sl": setup_sl,
+                        "tp": setup_tp,
+                        "rr": setup_rr,
+                    }
 
                 strat_label = f" | strat={result.strategy_name}" if result.strategy_name else ""
                 logger.info(
-                    f"✨ SETUP FOUND [{symbol}] for user {uid}: {setup.direction} RR: {setup.rr:.2f}{strat_label}"
+                    f"✨ SETUP FOUND [{symbol}] for user {uid}: {setup_dir} RR: {setup_rr:.2f}{strat_label}"
                 )
 
                 # Notification mode:
@@ -2591,19 +2670,12 @@ class ScannerService:
                 if notify_mode in ("off", "false", "0", "none", "dry_run", "dryrun"):
                     sent = False
                 else:
-                    chart_source = entry_data[-120:] if len(entry_data) > 120 else entry_data
-                    chart_source = _shift_candle_dict_times(chart_source, tz_offset_hours)
-                    img_buf = generate_chart_image(chart_source, symbol, entry_tf)
+                    img_buf = generate_chart_image(entry_data[-120:], symbol, entry_tf, tz_offset_hours=tz_offset_hours)
 
                     chat_id = None
                     if notify_mode == "admin_only":
                         chat_id = getattr(config, "ADMIN_CHAT_ID", None) or getattr(config, "DEFAULT_CHAT_ID", None)
-                    explain_payload = None
-                    try:
-                        if isinstance(debug, dict):
-                            explain_payload = debug.get("explain")
-                    except Exception:
-                        explain_payload = None
+                    explain_payload = dbg_view.get("explain")
 
                     sent = telegram_notifier.send_signal(
                         signal,
@@ -2611,6 +2683,7 @@ class ScannerService:
                         chat_id=chat_id,
                         explain=explain_payload if isinstance(explain_payload, dict) else None,
                         mode=notify_mode,
+                        retry_after_max_s=SCANNER_RETRY_AFTER_MAX_S,
                     )
 
                 if sent:
@@ -2621,7 +2694,7 @@ class ScannerService:
                                 signal_key,
                                 now_ts,
                                 symbol,
-                                direction=str(signal.direction),
+                                direction=setup_dir,
                                 timeframe=str(entry_tf),
                                 strategy_id=str(strategy_id or ""),
                             )
@@ -1,15 +1,59 @@
 from __future__ import annotations
 
-import json
 import os
 import threading
 import time
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from sys import intern
 from typing import Any, Dict, List, Optional, Tuple
 
+from core import fast_json
 
-@dataclass
+try:  # optional dependency (SIGNAL_STATE_FORMAT=msgpack)
+    import msgpack as _msgpack
+except ImportError:  # pragma: no cover - exercised when msgpack is absent
+    _msgpack = None
+
+
+def _upper(value: Any) -> str:
+    """Upper-cased, interned str: symbol/TF/direction repeat across thousands of records."""
+    return intern(str(value or "").upper())
+
+
+def _sid(value: Any) -> str:
+    return intern(str(value or "").strip() or "legacy")
+
+
+@lru_cache(maxsize=4096)
+def _cached_key(symbol: Any, timeframe: Any, strategy_id: Any, direction: Any) -> str:
+    return intern(f"{_upper(symbol)}|{_upper(timeframe)}|{_sid(strategy_id)}|{_upper(direction)}")
+
+
+@lru_cache(maxsize=4096)
+def _cached_bucket(symbol: Any, timeframe: Any, strategy_id: Any) -> str:
+    return intern(f"{_upper(symbol)}|{_upper(timeframe)}|{_sid(strategy_id)}")
+
+
+# fdatasync skips the metadata flush fsync does (not available on macOS/Windows).
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _write_durable(path: str, payload: bytes) -> None:
+    """Write bytes through a raw fd (no buffered file object) and fdatasync."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        _datasync(fd)
+    finally:
+        os.close(fd)
+
+
+@dataclass(slots=True, frozen=True)
 class SentRecord:
     ts: float
     symbol: str
@@ -27,45 +71,73 @@ class SignalStateStore:
             "sent": { "<signal_key>": {"ts": 1730000000.0, "symbol": "EURUSD", "direction": "BUY", "timeframe": "M15", "strategy_id": "range_v1"}, ... },
             "daily": { "EURUSD|M15|range_v1": {"2025-12-20": 3, ...}, ... }
     }
+
+    Journal (JSONL, `<path>.journal`): every record_sent/increment_daily appends
+    one idempotent op (absolute values), so a change costs O(1) bytes on disk:
+        {"op": "sent", "k": "<signal_key>", "v": {...same as "sent" entry...}}
+        {"op": "daily", "b": "EURUSD|M15|range_v1", "d": "2025-12-20", "n": 3}
+    load() = snapshot + journal replay. save_atomic() compacts: it rotates the
+    journal, writes a full snapshot, then drops the rotated journal.
+
+    fmt="msgpack" writes the snapshot as msgpack (same data model, same path)
+    when the package is installed; otherwise JSON. load() sniffs the format,
+    so switching back and forth needs no migration.
     """
 
-    def __init__(self, path: str = "state/signal_state.json") -> None:
+    def __init__(
+        self,
+        path: str = "state/signal_state.json",
+        *,
+        journal: bool = True,
+        compact_every: int = 500,
+        fmt: str = "json",
+    ) -> None:
         self.path = path
+        self.journal_path = f"{path}.journal"
+        self._msgpack = _msgpack is not None and str(fmt).strip().lower() == "msgpack"
         self._lock = threading.Lock()
         self._schema = 2
+        # _sent is copy-on-write: writers build a new dict under _lock and rebind
+        # it, so readers (can_send/get_sent_record/snapshot_sent) take the
+        # current reference without locking. Reads may be one write stale.
         self._sent: Dict[str, SentRecord] = {}
-        self._daily: Dict[str, Dict[str, int]] = {}
+        self._daily: Dict[str, Counter] = defaultdict(Counter)
+        # _sent is kept in ascending ts order (dict insertion order) so prune()
+        # only walks the expired head; an out-of-order ts re-sorts lazily.
+        self._sent_max_ts = 0.0
+        self._sent_ordered = True
+        self._journal = bool(journal)
+        self._compact_every = max(1, int(compact_every))
+        self._journal_ops = 0
+        self._journal_dir_ready = False
+        # Set when a journal append fails: that change is only in memory, so
+        # the next save must be a full snapshot regardless of _journal_ops.
+        self._compact_due = False
 
     @staticmethod
     def make_key(*, symbol: str, timeframe: str, strategy_id: str, direction: str) -> str:
-        sym = str(symbol).upper()
-        tf = str(timeframe).upper()
-        sid = str(strategy_id or "").strip() or "legacy"
-        d = str(direction).upper()
-        return "|".join([sym, tf, sid, d])
+        return _cached_key(symbol, timeframe, strategy_id, direction)
 
     @staticmethod
     def make_daily_bucket(*, symbol: str, timeframe: str, strategy_id: str) -> str:
-        sym = str(symbol).upper()
-        tf = str(timeframe).upper()
-        sid = str(strategy_id or "").strip() or "legacy"
-        return "|".join([sym, tf, sid])
+        return _cached_bucket(symbol, timeframe, strategy_id)
 
     def load(self) -> None:
-        """Load state from disk. If missing -> empty."""
+        """Load state from disk (snapshot + journal replay). If missing -> empty."""
         with self._lock:
-            if not os.path.exists(self.path):
-                self._sent = {}
-                self._daily = {}
-                return
-
-            try:
-                with open(self.path, "r", encoding="utf-8") as f:
-                    data = json.load(f) or {}
-            except Exception:
-                self._sent = {}
-                self._daily = {}
-                return
+            data: Dict[str, Any] = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, "rb") as f:
+                        raw = f.read()
+                    if raw.lstrip()[:1] == b"{" or _msgpack is None:
+                        data = fast_json.loads(raw) or {}
+                    else:
+                        data = _msgpack.unpackb(raw, raw=False) or {}
+                except Exception:
+                    data = {}
+            if not isinstance(data, dict):
+                data = {}
 
             sent_raw = data.get("sent", {}) or {}
             daily_raw = data.get("daily", {}) or {}
@@ -110,18 +182,18 @@ class SignalStateStore:
                         sid = "legacy"
 
                 new_key = self.make_key(
-                    symbol=str(symbol).upper(),
-                    timeframe=str(timeframe).upper(),
+                    symbol=symbol,
+                    timeframe=timeframe,
                     strategy_id=sid,
-                    direction=str(direction).upper(),
+                    direction=direction,
                 )
 
                 sent[new_key] = SentRecord(
                     ts=ts_f,
-                    symbol=str(symbol).upper(),
-                    direction=str(direction).upper(),
-                    timeframe=str(timeframe).upper(),
-                    strategy_id=sid,
+                    symbol=_upper(symbol),
+                    direction=_upper(direction),
+                    timeframe=_upper(timeframe),
+                    strategy_id=_sid(sid),
                 )
 
             daily: Dict[str, Dict[str, int]] = {}
@@ -144,10 +216,80 @@ class SignalStateStore:
                         except Exception:
                             continue
                     if dd:
-                        daily[bucket] = dd
-
-            self._sent = sent
-            self._daily = daily
+                        daily[intern(bucket)] = dd
+
+            self._journal_ops = self._replay_journal(sent, daily)
+            self._sent = dict(sorted(sent.items(), key=lambda kv: kv[1].ts))
+            self._sent_max_ts = max((r.ts for r in self._sent.values()), default=0.0)
+            self._sent_ordered = True
+            self._daily = defaultdict(Counter, {b: Counter(by_date) for b, by_date in daily.items()})
+
+    def _replay_journal(self, sent: Dict[str, SentRecord], daily: Dict[str, Dict[str, int]]) -> int:
+        """Apply journal ops (rotated first, then live) onto loaded state. Returns op count."""
+        n = 0
+        for path in (f"{self.journal_path}.old", self.journal_path):
+            try:
+                f = open(path, "rb")
+            except OSError:
+                continue
+            with f:
+                for raw in f:
+                    try:
+                        op = fast_json.loads(raw)
+                        if op.get("op") == "sent":
+                            v = op["v"]
+                            sent[intern(str(op["k"]))] = SentRecord(
+                                ts=float(v["ts"]),
+                                symbol=_upper(v["symbol"]),
+                                direction=_upper(v.get("direction")),
+                                timeframe=_upper(v.get("timeframe")),
+                                strategy_id=_sid(v.get("strategy_id")),
+                            )
+                        elif op.get("op") == "daily":
+                            daily.setdefault(intern(str(op["b"])), {})[str(op["d"])] = int(op["n"])
+                        else:
+                            continue
+                    except Exception:
+                        # Torn/garbled line (e.g. crash mid-append): skip it.
+                        continue
+                    n += 1
+        return n
+
+    def _journal_append(self, op: Dict[str, Any]) -> None:
+        """Append one op line (caller holds the lock). Best-effort: snapshot saves remain the fallback."""
+        if not self._journal:
+            return
+        try:
+            if not self._journal_dir_ready:
+                os.makedirs(os.path.dirname(self.journal_path) or ".", exist_ok=True)
+                self._journal_dir_ready = True
+            fd = os.open(self.journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, fast_json.dumps_bytes(op, newline=True))
+            finally:
+                os.close(fd)
+            self._journal_ops += 1
+        except OSError:
+            self._compact_due = True
+
+    def _rotate_journal(self) -> None:
+        """Move the live journal aside (caller holds the lock) before a snapshot write."""
+        old_path = f"{self.journal_path}.old"
+        try:
+            if os.path.exists(old_path):
+                # A previous compaction did not finish; keep its ops too.
+                with open(self.journal_path, "rb") as src, open(old_path, "ab") as dst:
+                    dst.write(src.read())
+                os.remove(self.journal_path)
+            else:
+                os.replace(self.journal_path, old_path)
+        except FileNotFoundError:
+            pass
+        self._journal_ops = 0
+
+    def should_compact(self) -> bool:
+        """True when a full snapshot save is due (always true without a journal)."""
+        return (not self._journal) or self._compact_due or self._journal_ops >= self._compact_every
 
     def record_sent(
         self,
@@ -160,13 +302,35 @@ class SignalStateStore:
         strategy_id: str = "",
     ) -> None:
         with self._lock:
-            sid = str(strategy_id or "").strip() or "legacy"
-            self._sent[str(signal_key)] = SentRecord(
+            rec = SentRecord(
                 ts=float(ts),
-                symbol=str(symbol).upper(),
-                direction=str(direction or "").upper(),
-                timeframe=str(timeframe or "").upper(),
-                strategy_id=sid,
+                symbol=_upper(symbol),
+                direction=_upper(direction),
+                timeframe=_upper(timeframe),
+                strategy_id=_sid(strategy_id),
+            )
+            key = intern(str(signal_key))
+            # Re-insert at the tail to keep ts order.
+            sent = dict(self._sent)
+            sent.pop(key, None)
+            sent[key] = rec
+            self._sent = sent
+            if rec.ts >= self._sent_max_ts:
+                self._sent_max_ts = rec.ts
+            else:
+                self._sent_ordered = False
+            self._journal_append(
+                {
+                    "op": "sent",
+                    "k": str(signal_key),
+                    "v": {
+                        "ts": rec.ts,
+                        "symbol": rec.symbol,
+                        "direction": rec.direction,
+                        "timeframe": rec.timeframe,
+                        "strategy_id": rec.strategy_id,
+                    },
+                }
             )
 
     def can_send(self, signal_key: str, ts: float, cooldown_minutes: int) -> bool:
@@ -174,26 +338,41 @@ class SignalStateStore:
         if cooldown_minutes <= 0:
             return True
 
-        with self._lock:
-            rec = self._sent.get(str(signal_key))
-            if rec is None:
-                return True
-            age_sec = float(ts) - float(rec.ts)
-            return age_sec >= float(cooldown_minutes) * 60.0
+        rec = self._sent.get(str(signal_key))
+        if rec is None:
+            return True
+        age_sec = float(ts) - rec.ts
+        return age_sec >= float(cooldown_minutes) * 60.0
+
+    def can_send_batch(self, signal_keys: List[str], ts: float, cooldown_minutes: int) -> List[bool]:
+        """can_send() for many keys against one read of the published _sent dict."""
+        cooldown_minutes = int(cooldown_minutes)
+        if cooldown_minutes <= 0:
+            return [True] * len(signal_keys)
+        sent = self._sent
+        cutoff = float(ts) - float(cooldown_minutes) * 60.0
+        out: List[bool] = []
+        for k in signal_keys:
+            rec = sent.get(k)
+            out.append(rec is None or rec.ts <= cutoff)
+        return out
 
     def increment_daily(self, symbol: str, timeframe: str, strategy_id: str, date: str) -> int:
         bucket = self.make_daily_bucket(symbol=symbol, timeframe=timeframe, strategy_id=strategy_id)
         date = str(date)
         with self._lock:
-            by_date = self._daily.setdefault(bucket, {})
-            by_date[date] = int(by_date.get(date, 0)) + 1
-            return int(by_date[date])
+            by_date = self._daily[bucket]
+            by_date[date] += 1
+            n = by_date[date]
+            self._journal_append({"op": "daily", "b": bucket, "d": date, "n": n})
+            return n
 
     def get_daily_count(self, symbol: str, timeframe: str, strategy_id: str, date: str) -> int:
         bucket = self.make_daily_bucket(symbol=symbol, timeframe=timeframe, strategy_id=strategy_id)
         date = str(date)
         with self._lock:
-            return int((self._daily.get(bucket) or {}).get(date, 0))
+            by_date = self._daily.get(bucket)
+            return by_date[date] if by_date is not None else 0
 
     def prune(self, *, older_than_days: int = 14, now_ts: Optional[float] = None) -> Tuple[int, int]:
         """Prune old sent keys and daily buckets.
@@ -211,22 +390,37 @@ class SignalStateStore:
         cutoff_date = datetime.fromtimestamp(float(now_ts), tz=timezone.utc).date() - timedelta(days=older_than_days)
 
         with self._lock:
-            pruned_sent = 0
-            for k in list(self._sent.keys()):
-                if float(self._sent[k].ts) < cutoff_ts:
-                    del self._sent[k]
-                    pruned_sent += 1
+            if not self._sent_ordered:
+                self._sent = dict(sorted(self._sent.items(), key=lambda kv: kv[1].ts))
+                self._sent_ordered = True
+            expired: List[str] = []
+            for k, rec in self._sent.items():
+                if rec.ts >= cutoff_ts:
+                    break
+                expired.append(k)
+            if expired:
+                sent = dict(self._sent)
+                for k in expired:
+                    del sent[k]
+                self._sent = sent
+            pruned_sent = len(expired)
 
             pruned_daily = 0
+            # Canonical keys are ISO "YYYY-MM-DD", which order lexicographically:
+            # compare strings and only parse non-conforming keys.
+            cutoff_str = cutoff_date.isoformat()
             for symbol in list(self._daily.keys()):
                 by_date = self._daily.get(symbol) or {}
                 for date_key in list(by_date.keys()):
-                    try:
-                        d = datetime.fromisoformat(date_key).date()
-                    except Exception:
-                        # If unparsable, keep (safer)
-                        continue
-                    if d < cutoff_date:
+                    if len(date_key) == 10 and date_key[4] == "-" and date_key[7] == "-":
+                        expired = date_key < cutoff_str
+                    else:
+                        try:
+                            expired = datetime.fromisoformat(date_key).date() < cutoff_date
+                        except Exception:
+                            # If unparsable, keep (safer)
+                            continue
+                    if expired:
                         del by_date[date_key]
                         pruned_daily += 1
                 if not by_date:
@@ -244,34 +438,21 @@ class SignalStateStore:
 
     def snapshot_sent(self) -> List[SentRecord]:
         """Return a snapshot list of sent records (best-effort)."""
-        with self._lock:
-            return [
-                SentRecord(
-                    ts=v.ts,
-                    symbol=v.symbol,
-                    direction=v.direction,
-                    timeframe=v.timeframe,
-                    strategy_id=v.strategy_id,
-                )
-                for v in self._sent.values()
-            ]
+        # Lock-free: _sent is never mutated after publish and SentRecord is frozen.
+        return list(self._sent.values())
 
     def get_sent_record(self, signal_key: str) -> Optional[SentRecord]:
-        with self._lock:
-            rec = self._sent.get(str(signal_key))
-            if rec is None:
-                return None
-            return SentRecord(
-                ts=rec.ts,
-                symbol=rec.symbol,
-                direction=rec.direction,
-                timeframe=rec.timeframe,
-                strategy_id=rec.strategy_id,
-            )
+        return self._sent.get(str(signal_key))
 
     def save_atomic(self) -> None:
-        """Atomic JSON save: write temp then os.replace."""
+        """Atomic JSON save (journal compaction): write temp then os.replace (orjson when available)."""
         with self._lock:
+            # Ops appended after this point go to a fresh journal; the rotated
+            # one is dropped only once the snapshot below is on disk.
+            if self._journal:
+                self._rotate_journal()
+            compact_due = self._compact_due
+            self._compact_due = False
             data: Dict[str, Any] = {
                 "schema": self._schema,
                 "sent": {
@@ -284,16 +465,28 @@ class SignalStateStore:
                     }
                     for k, v in self._sent.items()
                 },
-                "daily": self._daily,
+                "daily": {b: dict(by_date) for b, by_date in self._daily.items()},
             }
 
         dir_path = os.path.dirname(self.path) or "."
         os.makedirs(dir_path, exist_ok=True)
 
-        tmp_path = f"{self.path}.tmp"
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
-            f.flush()
-            os.fsync(f.fileno())
+        if self._msgpack:
+            payload = _msgpack.packb(data, use_bin_type=True)
+        else:
+            payload = fast_json.dumps_bytes(data, indent=True, sort_keys=True)
 
-        os.replace(tmp_path, self.path)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            _write_durable(tmp_path, payload)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if compact_due:
+                self._compact_due = True
+            raise
+
+        if self._journal:
+            try:
+                os.remove(f"{self.journal_path}.old")
+            except FileNotFoundError:
+                pass
@@ -11,39 +11,40 @@ Indicator-free: operates on detector hits only.
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Set, Union
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Set, Tuple, Union
 
 from engine.models import CombineResult, DetectorHit
 from strategies.strategy_spec import StrategySpec
 
 
 _REGIMES = {"TREND_BULL", "TREND_BEAR", "RANGE", "CHOP"}
-_FAMILIES = {"range", "sr", "structure", "fibo", "geometry", "time", "pattern"}
+# Shared read-only fallback for specs without weight overrides (never mutated).
+_EMPTY_WEIGHTS: Dict[str, float] = {}
+
+_FAMILIES = frozenset({"range", "sr", "structure", "fibo", "geometry", "time", "pattern"})
 
 
 def _hit_family(hit: DetectorHit) -> Optional[str]:
     """Infer family tag for confluence.
 
     Priority:
+    - hit.family (always set by current detectors; fast path)
     - evidence['family'] if present
     - evidence['tags'] list if present (first matching known family)
     """
     try:
-        fam_direct = getattr(hit, "family", None)
-        if isinstance(fam_direct, str) and fam_direct:
-            return fam_direct
-    except Exception:
-        pass
-    try:
-        fam = hit.evidence.get("family") if isinstance(hit.evidence, dict) else None
-        if isinstance(fam, str) and fam:
+        fam = getattr(hit, "family", None)
+        if fam and isinstance(fam, str):
             return fam
-    except Exception:
-        pass
-
-    try:
-        tags = hit.evidence.get("tags") if isinstance(hit.evidence, dict) else None
+        ev = hit.evidence
+        if not isinstance(ev, dict):
+            return None
+        fam = ev.get("family")
+        if fam and isinstance(fam, str):
+            return fam
+        tags = ev.get("tags")
         if isinstance(tags, list):
             for t in tags:
                 ts = str(t)
@@ -51,10 +52,31 @@ def _hit_family(hit: DetectorHit) -> Optional[str]:
                     return ts
     except Exception:
         pass
-
     return None
 
 
+def _spec_consts(spec: StrategySpec) -> Tuple[float, float, float, int, Dict[str, float], Dict[str, float]]:
+    """(eps, confluence bonus, min_score, max_top_hits, detector_weights, family_weights).
+
+    StrategySpec is frozen, so the converted values are cached on the instance
+    after the first combine(). (It is unhashable - list/dict fields - which
+    rules out a WeakKeyDictionary.)
+    """
+    c = spec.__dict__.get("_combine_consts")
+    if c is None:
+        c = (
+            float(spec.conflict_epsilon),
+            float(spec.confluence_bonus_per_family),
+            float(spec.min_score),
+            int(getattr(spec, "max_top_hits", 3) or 3),
+            # Read-only (.get only): the spec's own dicts, no copies.
+            spec.detector_weights or _EMPTY_WEIGHTS,
+            spec.family_weights or _EMPTY_WEIGHTS,
+        )
+        object.__setattr__(spec, "_combine_consts", c)
+    return c
+
+
 def combine(
     hits: Sequence[DetectorHit],
     spec: Union[StrategySpec, float],
@@ -115,20 +137,27 @@ def combine(
     if regime_s not in _REGIMES:
         regime_s = "RANGE"
 
-    eps = float(spec_obj.conflict_epsilon)
-    fam_bonus = float(spec_obj.confluence_bonus_per_family)
-    det_w = dict(spec_obj.detector_weights or {})
-    fam_w = dict(spec_obj.family_weights or {})
+    # Spec numerics converted once per spec; everything derived below is already float/str.
+    eps, fam_bonus, min_score_f, top_n, det_w, fam_w = _spec_consts(spec_obj)
 
-    by_dir: Dict[str, Dict[str, Any]] = {
-        "BUY": {"score": 0.0, "score_raw": 0.0, "families": set(), "hits": [], "contribs": []},
-        "SELL": {"score": 0.0, "score_raw": 0.0, "families": set(), "hits": [], "contribs": []},
-    }
+    # Per-side accumulators kept in locals (no per-hit dict-of-dicts lookups).
+    buy_weighted = buy_raw = sell_weighted = sell_raw = 0.0
+    buy_fams: Set[str] = set()
+    sell_fams: Set[str] = set()
+    buy_hits: List[DetectorHit] = []
+    sell_hits: List[DetectorHit] = []
+    buy_contribs: List[Dict[str, Any]] = []
+    sell_contribs: List[Dict[str, Any]] = []
 
     for hit in hits:
         if not hit.ok:
             continue
-        if hit.direction not in ("BUY", "SELL"):
+        hit_dir = hit.direction
+        if hit_dir == "BUY":
+            is_buy = True
+        elif hit_dir == "SELL":
+            is_buy = False
+        else:
             continue
 
         base = float(hit.score_contrib or 0.0)
@@ -139,21 +168,16 @@ def combine(
         det_mult = 1.0
         fam_mult = 1.0
         try:
-            det_mult = float(det_w.get(str(hit.detector), 1.0))
+            det_mult = float(det_w.get(hit.detector, 1.0))
         except Exception:
             det_mult = 1.0
         try:
             if fam:
-                fam_mult = float(fam_w.get(str(fam), 1.0))
+                fam_mult = float(fam_w.get(fam, 1.0))
         except Exception:
             fam_mult = 1.0
 
         contrib = base * det_mult * fam_mult
-        by_dir[hit.direction]["score_raw"] += float(base)
-        by_dir[hit.direction]["score"] += float(contrib)
-        by_dir[hit.direction]["hits"].append(hit)
-        if fam:
-            by_dir[hit.direction]["families"].add(str(fam))
 
         # For breakdown/debugging
         try:
@@ -162,90 +186,93 @@ def combine(
                 reasons_short = [str(x) for x in hit.reasons[:2] if str(x)]
         except Exception:
             reasons_short = []
-        by_dir[hit.direction]["contribs"].append(
-            {
-                "detector": str(hit.detector),
-                "family": str(fam or ""),
-                "base": float(base),
-                "w_det": float(det_mult),
-                "w_fam": float(fam_mult),
-                "weighted": float(contrib),
-                "reasons": reasons_short,
-            }
-        )
+        contrib_row = {
+            "detector": hit.detector,
+            "family": fam or "",
+            "base": base,
+            "w_det": det_mult,
+            "w_fam": fam_mult,
+            "weighted": contrib,
+            "reasons": reasons_short,
+        }
+
+        if is_buy:
+            buy_raw += base
+            buy_weighted += contrib
+            buy_hits.append(hit)
+            buy_contribs.append(contrib_row)
+            if fam:
+                buy_fams.add(fam)
+        else:
+            sell_raw += base
+            sell_weighted += contrib
+            sell_hits.append(hit)
+            sell_contribs.append(contrib_row)
+            if fam:
+                sell_fams.add(fam)
 
     # Confluence bonus v1: +confluence_weight*(unique_families-1)
     # Example: 2 families => +0.25, 3 families => +0.50
-    for ddir in ("BUY", "SELL"):
-        fam_n = len(by_dir[ddir]["families"])
-        bonus = float(fam_bonus) * max(0, fam_n - 1)
-        by_dir[ddir]["bonus"] = bonus
-        by_dir[ddir]["score_total"] = float(by_dir[ddir]["score"] + bonus)
-
-    buy_score = float(by_dir["BUY"].get("score_total", 0.0))
-    sell_score = float(by_dir["SELL"].get("score_total", 0.0))
-
-    # Prepare breakdown (single-source; based on the same values used above)
-    buy_contribs_sorted = sorted(
-        list(by_dir["BUY"].get("contribs") or []),
-        key=lambda d: float(d.get("weighted") or 0.0),
-        reverse=True,
-    )
-    sell_contribs_sorted = sorted(
-        list(by_dir["SELL"].get("contribs") or []),
-        key=lambda d: float(d.get("weighted") or 0.0),
-        reverse=True,
-    )
+    buy_bonus = fam_bonus * max(0, len(buy_fams) - 1)
+    sell_bonus = fam_bonus * max(0, len(sell_fams) - 1)
+    buy_score = buy_weighted + buy_bonus
+    sell_score = sell_weighted + sell_bonus
 
     evidence: Dict[str, Any] = {
         "regime": regime_s,
         "buy_score": buy_score,
         "sell_score": sell_score,
-        "min_score": float(spec_obj.min_score),
-        "epsilon": float(eps),
-        "family_bonus": float(fam_bonus),
+        "min_score": min_score_f,
+        "epsilon": eps,
+        "family_bonus": fam_bonus,
         # Back-compat keys for existing logs/tests
-        "conflict_epsilon": float(eps),
-        "confluence_weight": float(fam_bonus),
-        "detectors_hit_buy": [h.detector for h in by_dir["BUY"]["hits"]],
-        "detectors_hit_sell": [h.detector for h in by_dir["SELL"]["hits"]],
-        "families_buy": sorted(by_dir["BUY"]["families"]),
-        "families_sell": sorted(by_dir["SELL"]["families"]),
+        "conflict_epsilon": eps,
+        "confluence_weight": fam_bonus,
+        "detectors_hit_buy": [h.detector for h in buy_hits],
+        "detectors_hit_sell": [h.detector for h in sell_hits],
+        "families_buy": sorted(buy_fams),
+        "families_sell": sorted(sell_fams),
 
         # Breakdown fields (v2)
-        "buy_score_raw": float(by_dir["BUY"].get("score_raw", 0.0) or 0.0),
-        "sell_score_raw": float(by_dir["SELL"].get("score_raw", 0.0) or 0.0),
-        "buy_score_weighted": float(by_dir["BUY"].get("score", 0.0) or 0.0),
-        "sell_score_weighted": float(by_dir["SELL"].get("score", 0.0) or 0.0),
-        "confluence_bonus_buy": float(by_dir["BUY"].get("bonus", 0.0) or 0.0),
-        "confluence_bonus_sell": float(by_dir["SELL"].get("bonus", 0.0) or 0.0),
+        "buy_score_raw": buy_raw,
+        "sell_score_raw": sell_raw,
+        "buy_score_weighted": buy_weighted,
+        "sell_score_weighted": sell_weighted,
+        "confluence_bonus_buy": buy_bonus,
+        "confluence_bonus_sell": sell_bonus,
     }
 
-    buy_ok = buy_score >= float(spec_obj.min_score)
-    sell_ok = sell_score >= float(spec_obj.min_score)
+    def _score_breakdown(best_side: str, final_direction: Optional[str], final_score: float) -> Dict[str, Any]:
+        # Single-source breakdown; only the reported side's contribs get ranked.
+        side_contribs = buy_contribs if best_side == "BUY" else sell_contribs
+        # nlargest == sorted(reverse=True)[:n] (ties keep input order), in O(N log n).
+        top_hit_contribs = heapq.nlargest(top_n, side_contribs, key=lambda d: d["weighted"])
+        return {
+            "strategy_id": getattr(spec_obj, "strategy_id", None),
+            "regime": regime_s,
+            "buy_score_raw": evidence["buy_score_raw"],
+            "sell_score_raw": evidence["sell_score_raw"],
+            "buy_score_weighted": evidence["buy_score_weighted"],
+            "sell_score_weighted": evidence["sell_score_weighted"],
+            "confluence_bonus_buy": evidence["confluence_bonus_buy"],
+            "confluence_bonus_sell": evidence["confluence_bonus_sell"],
+            "final_direction": final_direction,
+            "final_score": final_score,
+            "best_side": best_side,
+            "top_hit_contribs": top_hit_contribs,
+        }
+
+    buy_ok = buy_score >= min_score_f
+    sell_ok = sell_score >= min_score_f
 
     if buy_ok and sell_ok:
         delta = abs(buy_score - sell_score)
-        evidence["conflict_delta"] = float(delta)
+        evidence["conflict_delta"] = delta
         # Inclusive boundary with small tolerance for float rounding.
-        if float(delta) <= float(eps) + 1e-12:
+        if delta <= eps + 1e-12:
             # Winner/"best" side context for debugging.
             best_side = "BUY" if buy_score >= sell_score else "SELL"
-            top_hit_contribs = buy_contribs_sorted if best_side == "BUY" else sell_contribs_sorted
-            evidence["score_breakdown"] = {
-                "strategy_id": getattr(spec_obj, "strategy_id", None),
-                "regime": regime_s,
-                "buy_score_raw": evidence["buy_score_raw"],
-                "sell_score_raw": evidence["sell_score_raw"],
-                "buy_score_weighted": evidence["buy_score_weighted"],
-                "sell_score_weighted": evidence["sell_score_weighted"],
-                "confluence_bonus_buy": evidence["confluence_bonus_buy"],
-                "confluence_bonus_sell": evidence["confluence_bonus_sell"],
-                "final_direction": None,
-                "final_score": float(max(buy_score, sell_score)),
-                "best_side": best_side,
-                "top_hit_contribs": list(top_hit_contribs)[: int(getattr(spec_obj, "max_top_hits", 3) or 3)],
-            }
+            evidence["score_breakdown"] = _score_breakdown(best_side, None, max(buy_score, sell_score))
             return CombineResult(
                 ok=False,
                 direction=None,
@@ -256,21 +283,7 @@ def combine(
 
     if not buy_ok and not sell_ok:
         best_side = "BUY" if buy_score >= sell_score else "SELL"
-        top_hit_contribs = buy_contribs_sorted if best_side == "BUY" else sell_contribs_sorted
-        evidence["score_breakdown"] = {
-            "strategy_id": getattr(spec_obj, "strategy_id", None),
-            "regime": regime_s,
-            "buy_score_raw": evidence["buy_score_raw"],
-            "sell_score_raw": evidence["sell_score_raw"],
-            "buy_score_weighted": evidence["buy_score_weighted"],
-            "sell_score_weighted": evidence["sell_score_weighted"],
-            "confluence_bonus_buy": evidence["confluence_bonus_buy"],
-            "confluence_bonus_sell": evidence["confluence_bonus_sell"],
-            "final_direction": None,
-            "final_score": float(max(buy_score, sell_score)),
-            "best_side": best_side,
-            "top_hit_contribs": list(top_hit_contribs)[: int(getattr(spec_obj, "max_top_hits", 3) or 3)],
-        }
+        evidence["score_breakdown"] = _score_breakdown(best_side, None, max(buy_score, sell_score))
         return CombineResult(
             ok=False,
             direction=None,
@@ -283,26 +296,12 @@ def combine(
     score = buy_score if direction == "BUY" else sell_score
 
     evidence["direction"] = direction
-    evidence["score"] = float(score)
+    evidence["score"] = score
     evidence["detectors_hit"] = (
         evidence["detectors_hit_buy"] if direction == "BUY" else evidence["detectors_hit_sell"]
     )
 
     # Winner-side breakdown
-    top_hit_contribs = buy_contribs_sorted if direction == "BUY" else sell_contribs_sorted
-    evidence["score_breakdown"] = {
-        "strategy_id": getattr(spec_obj, "strategy_id", None),
-        "regime": regime_s,
-        "buy_score_raw": evidence["buy_score_raw"],
-        "sell_score_raw": evidence["sell_score_raw"],
-        "buy_score_weighted": evidence["buy_score_weighted"],
-        "sell_score_weighted": evidence["sell_score_weighted"],
-        "confluence_bonus_buy": evidence["confluence_bonus_buy"],
-        "confluence_bonus_sell": evidence["confluence_bonus_sell"],
-        "final_direction": direction,
-        "final_score": float(score),
-        "best_side": direction,
-        "top_hit_contribs": list(top_hit_contribs)[: int(getattr(spec_obj, "max_top_hits", 3) or 3)],
-    }
+    evidence["score_breakdown"] = _score_breakdown(direction, direction, score)
 
-    return CombineResult(ok=True, direction=direction, score=float(score), evidence=evidence)
+    return CombineResult(ok=True, direction=direction, score=score, evidence=evidence)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-import copy
 import hashlib
 import json
 import os
@@ -14,7 +13,8 @@ from pathlib import Path
 
 from strategies.strategy_spec import StrategySpec
 
-from core.atomic_io import atomic_append_jsonl_via_replace, atomic_write_text
+from core import fast_json
+from core.atomic_io import append_jsonl_line, atomic_write_bytes
 
 
 @dataclass(frozen=True)
@@ -36,27 +36,35 @@ def _stable_patch_id(strategy_id: str, changes: Dict[str, Dict[str, Any]]) -> st
         "strategy_id": str(strategy_id),
         "changes": changes,
     }
+    # Stays on stdlib json: patch ids are persisted/compared, so the hashed
+    # bytes must not depend on whether orjson is installed.
     raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
     return hashlib.sha1(raw).hexdigest()[:12]
 
 
 def load_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        obj = json.load(f)
+    with open(path, "rb") as f:
+        obj = fast_json.loads(f.read())
     if not isinstance(obj, dict):
         raise ValueError("JSON root must be an object")
     return obj
 
 
 def save_json_atomic(data: Dict[str, Any], path: str) -> None:
-    text = json.dumps(data, ensure_ascii=False, indent=2)
-    atomic_write_text(Path(path), text)
+    # C-speed indent=2 when orjson is installed; bytes go straight to disk.
+    atomic_write_bytes(Path(path), fast_json.dumps_bytes(data, indent=True))
 
 
 def backup_file(path: str) -> str:
     ts = _utc_ts()
     backup_path = f"{path}.bak.{ts}"
-    shutil.copy2(path, backup_path)
+    # The file is only ever replaced via os.replace (new inode), so a hardlink
+    # keeps the old content without copying it. Fall back to a real copy when
+    # links are unsupported (cross-device, some FS/containers mounts).
+    try:
+        os.link(path, backup_path)
+    except OSError:
+        shutil.copy2(path, backup_path)
     return backup_path
 
 
@@ -86,7 +94,8 @@ def append_patch_audit(
             "before": dict(before or {}),
             "after": dict(after or {}),
         }
-        atomic_append_jsonl_via_replace(Path(audit_path), json.dumps(rec, ensure_ascii=False))
+        # Append-only log (rollback skips unparsable lines): no full-file rewrite.
+        append_jsonl_line(Path(audit_path), fast_json.dumps(rec))
     except Exception:
         return
 
@@ -159,15 +168,13 @@ def apply_patch_workflow(
     strategies = data.get("strategies")
     assert isinstance(strategies, list)
 
-    # Work on a copy first.
-    new_data = copy.deepcopy(data)
-    new_strategies = new_data.get("strategies")
-    assert isinstance(new_strategies, list)
-
-    strategy_obj = new_strategies[int(idx)]
-    if not isinstance(strategy_obj, dict):
+    if not isinstance(strategies[int(idx)], dict):
         raise ValueError("strategy_entry_not_a_dict")
 
+    # Work on a copy first. _apply_changes only rebinds top-level keys, so a
+    # shallow copy of the one patched entry is enough (no deepcopy of the file).
+    strategy_obj = dict(strategies[int(idx)])
+
     before_snapshot, after_snapshot = _apply_changes(strategy_obj, changes)
 
     ok, err = _validate_strategy(strategy_obj)
@@ -186,6 +193,7 @@ def apply_patch_workflow(
         }
 
     # Apply: backup then atomic replace
+    new_data = {**data, "strategies": [*strategies[: int(idx)], strategy_obj, *strategies[int(idx) + 1 :]]}
     backup_path = backup_file(strategies_path)
     save_json_atomic(new_data, strategies_path)
 
@@ -235,34 +243,43 @@ def apply_patch_and_audit(
     return res
 
 
+def _index_patch_items(items: List[Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """patch_id -> items (file order kept; ids may repeat across strategies)."""
+    index: Dict[str, List[Dict[str, Any]]] = {}
+    for it in items:
+        if isinstance(it, dict):
+            index.setdefault(str(it.get("patch_id") or ""), []).append(it)
+    return index
+
+
 def load_patch_suggestions(path: str = "state/patch_suggestions.json") -> Dict[str, Any]:
+    """Load the suggestions registry plus a one-pass `_index` for find_patch_by_id."""
     if not os.path.exists(path):
-        return {"schema": 1, "items": []}
+        return {"schema": 1, "items": [], "_index": {}}
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            obj = json.load(f) or {}
+        with open(path, "rb") as f:
+            obj = fast_json.loads(f.read()) or {}
     except Exception:
-        return {"schema": 1, "items": []}
+        return {"schema": 1, "items": [], "_index": {}}
     if not isinstance(obj, dict):
-        return {"schema": 1, "items": []}
+        return {"schema": 1, "items": [], "_index": {}}
     items = obj.get("items")
     if not isinstance(items, list):
         items = []
-    return {"schema": int(obj.get("schema") or 1), "items": items}
+    return {"schema": int(obj.get("schema") or 1), "items": items, "_index": _index_patch_items(items)}
 
 
 def find_patch_by_id(suggestions: Dict[str, Any], patch_id: str, *, strategy_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
-    items = suggestions.get("items")
-    if not isinstance(items, list):
-        return None
     pid = str(patch_id or "").strip()
     if not pid:
         return None
-    for it in items:
-        if not isinstance(it, dict):
-            continue
-        if str(it.get("patch_id") or "") != pid:
-            continue
+    index = suggestions.get("_index")
+    if not isinstance(index, dict):
+        items = suggestions.get("items")
+        if not isinstance(items, list):
+            return None
+        index = _index_patch_items(items)
+    for it in index.get(pid) or ():
         if strategy_id is not None and str(it.get("strategy_id") or "") != str(strategy_id):
             continue
         return it
@@ -270,7 +287,7 @@ def find_patch_by_id(suggestions: Dict[str, Any], patch_id: str, *, strategy_id:
 
 
 def _parse_patch_json(raw: str) -> Dict[str, Any]:
-    obj = json.loads(raw)
+    obj = fast_json.loads(raw)
     if not isinstance(obj, dict):
         raise ValueError("patch_json_root_must_be_object")
     return obj
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import os
 import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Optional
 
 
 @dataclass(frozen=True)
@@ -38,10 +40,21 @@ _OPEN_WA_RE = re.compile(r"open\(.*?,\s*[\"'](?P<mode>[wa])[\"']", re.IGNORECASE
 
 
 def _iter_py_files(root: Path) -> Iterable[Path]:
-    for p in root.rglob("*.py"):
-        if any(part in _SKIP_DIRS for part in p.parts):
+    # os.scandir walk that prunes _SKIP_DIRS before descending (rglob would
+    # enumerate all of .venv/node_modules first and filter afterwards).
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
             continue
-        yield p
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield Path(entry.path)
 
 
 def _is_test_path(path: Path) -> bool:
@@ -52,70 +65,100 @@ def _is_test_path(path: Path) -> bool:
     return name.startswith("test_") or name.endswith("_test.py")
 
 
-def audit_repo(root: Path) -> List[Finding]:
-    findings: List[Finding] = []
+# Any line that can produce a finding mentions state/ or calls open( (any case).
+_CANDIDATE_B = re.compile(rb"state/|(?i:open\()")
 
-    for path in _iter_py_files(root):
-        if path.name == "audit_atomic_state_writes.py":
-            continue
-        # Tests can use direct writes; they are not production state.
-        if _is_test_path(path):
-            continue
 
-        try:
-            text = path.read_text(encoding="utf-8")
-        except Exception:
+def _candidate_lines(data: bytes) -> Dict[int, str]:
+    """{line_no: line} for candidate lines only; other lines are never decoded."""
+    out: Dict[int, str] = {}
+    line_no = 1
+    pos = 0
+    for m in _CANDIDATE_B.finditer(data):
+        start = m.start()
+        line_no += data.count(b"\n", pos, start)
+        pos = start
+        if line_no in out:
             continue
+        line_start = data.rfind(b"\n", 0, start) + 1
+        line_end = data.find(b"\n", start)
+        if line_end < 0:
+            line_end = len(data)
+        out[line_no] = data[line_start:line_end].decode("utf-8", errors="replace")
+    return out
 
-        lines = text.splitlines()
-        for idx, line in enumerate(lines, start=1):
-            if _STATE_LITERAL_OPEN_RE.search(line):
-                findings.append(
-                    Finding(
-                        path=path,
-                        line_no=idx,
-                        line=line.strip(),
-                        reason="DIRECT_STATE_OPEN_WA",
-                    )
-                )
-                continue
-            if _STATE_LITERAL_WRITE_TEXT_RE.search(line):
-                findings.append(
-                    Finding(
-                        path=path,
-                        line_no=idx,
-                        line=line.strip(),
-                        reason="DIRECT_STATE_WRITE_TEXT",
-                    )
-                )
-                continue
-
-            m = _OPEN_WA_RE.search(line)
-            if m and "state/" in line:
-                findings.append(
-                    Finding(
-                        path=path,
-                        line_no=idx,
-                        line=line.strip(),
-                        reason="OPEN_WA_NEAR_STATE_LITERAL",
-                    )
+
+def _scan_file(path: Path) -> List[Finding]:
+    try:
+        data = path.read_bytes()
+    except Exception:
+        return []
+    # Every finding needs a state/ line (directly or within the context
+    # window), so files without the literal are skipped with one memchr-style scan.
+    if b"state/" not in data:
+        return []
+
+    findings: List[Finding] = []
+    state_line_nos: List[int] = []
+    open_wa_line_nos: List[int] = []
+    lines = _candidate_lines(data)
+    for idx, line in lines.items():
+        is_open_wa = "open(" in line.lower() and _OPEN_WA_RE.search(line) is not None
+        if is_open_wa:
+            open_wa_line_nos.append(idx)
+        if "state/" not in line:
+            continue
+        state_line_nos.append(idx)
+
+        if "open(" in line and _STATE_LITERAL_OPEN_RE.search(line):
+            reason = "DIRECT_STATE_OPEN_WA"
+        elif ".write_text(" in line and _STATE_LITERAL_WRITE_TEXT_RE.search(line):
+            reason = "DIRECT_STATE_WRITE_TEXT"
+        elif is_open_wa:
+            reason = "OPEN_WA_NEAR_STATE_LITERAL"
+        else:
+            continue
+        findings.append(Finding(path=path, line_no=idx, line=line.strip(), reason=reason))
+
+    # Heuristic: open(..., w/a) within 6 lines of a state/ mention.
+    for idx in open_wa_line_nos:
+        k = bisect_left(state_line_nos, idx - 6)
+        if k < len(state_line_nos) and state_line_nos[k] <= idx + 6:
+            findings.append(
+                Finding(
+                    path=path,
+                    line_no=idx,
+                    line=lines[idx].strip(),
+                    reason="OPEN_WA_NEAR_STATE_CONTEXT",
                 )
+            )
+    return findings
+
+
+# Below this many files a process pool costs more (startup/pickling) than the scan.
+_PARALLEL_MIN_FILES = 400
 
-        # Heuristic across small windows: open(..., w/a) within 6 lines of a state/ mention.
-        for i in range(len(lines)):
-            window = "\n".join(lines[i : i + 7])
-            if "state/" not in window:
-                continue
-            for j, win_line in enumerate(lines[i : i + 7], start=0):
-                if _OPEN_WA_RE.search(win_line):
-                    findings.append(
-                        Finding(
-                            path=path,
-                            line_no=i + j + 1,
-                            line=win_line.strip(),
-                            reason="OPEN_WA_NEAR_STATE_CONTEXT",
-                        )
-                    )
+
+def audit_repo(root: Path, *, workers: Optional[int] = None) -> List[Finding]:
+    paths = [
+        path
+        for path in _iter_py_files(root)
+        # Tests can use direct writes; they are not production state.
+        if path.name != "audit_atomic_state_writes.py" and not _is_test_path(path)
+    ]
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(paths) >= _PARALLEL_MIN_FILES else 1
+
+    findings: List[Finding] = []
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(paths) // (workers * 4))
+            for file_findings in pool.map(_scan_file, paths, chunksize=chunksize):
+                findings.extend(file_findings)
+    else:
+        for path in paths:
+            findings.extend(_scan_file(path))
 
     # Deduplicate
     uniq = {(f.path, f.line_no, f.reason): f for f in findings}
@@ -137,7 +180,7 @@ def main() -> int:
         rel = f.path.relative_to(root)
         print(f"{rel}:{f.line_no}: {f.reason}: {f.line}")
 
-    print("\nExpected: use core.atomic_io.atomic_write_text / atomic_append_jsonl_via_replace for state/*.json* writes")
+    print("\nExpected: use core.atomic_io.atomic_write_text / atomic_append_jsonl_via_replace / append_jsonl_line for state/*.json* writes")
     return 2
 
 
@@ -4,9 +4,10 @@ import argparse
 import json
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 # When executed as `python scripts/backfill_massive.py`, Python sets sys.path[0]
 # to `/app/scripts` and won't see `/app` for top-level imports.
@@ -139,6 +140,8 @@ def run_backfill(
     chunk_days: int,
     validate_tickers: bool,
     validate_output: bool,
+    flush_chunks: int = 8,
+    concurrency: int = 1,
 ) -> int:
     provider = create_provider(name="massive")
 
@@ -159,6 +162,45 @@ def run_backfill(
         chunk_days,
     )
 
+    total_written = 0
+    # flush_chunks <= 0: hold the whole symbol in memory and persist once.
+    flush_chunks = int(flush_chunks)
+    # Provider calls stay spaced by its own rate limiter (MASSIVE_MIN_DELAY_S).
+    pool = ThreadPoolExecutor(max_workers=int(concurrency)) if int(concurrency) > 1 else None
+    try:
+        total_written = _backfill_symbols(
+            provider=provider,
+            pool=pool,
+            symbols=symbols,
+            tf=tf,
+            start=start,
+            end=end,
+            chunk_days=chunk_days,
+            flush_chunks=flush_chunks,
+            validate_tickers=validate_tickers,
+            validate_output=validate_output,
+        )
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    logger.info("Backfill complete total_written=%d", total_written)
+    return 0
+
+
+def _backfill_symbols(
+    *,
+    provider: Any,
+    pool: Optional[ThreadPoolExecutor],
+    symbols: List[str],
+    tf: str,
+    start: datetime,
+    end: datetime,
+    chunk_days: int,
+    flush_chunks: int,
+    validate_tickers: bool,
+    validate_output: bool,
+) -> int:
     total_written = 0
 
     for sym in symbols:
@@ -174,8 +216,57 @@ def run_backfill(
             except Exception:
                 logger.warning("Ticker validation error for %s (skipping)", sym)
 
-        logger.info("Backfilling %s tf=%s from %s to %s", sym, tf, start.isoformat(), end.isoformat())
-        for (a, b) in _chunk_ranges(start, end, chunk_days=chunk_days):
+        massive_ticker: Optional[str] = None
+        try:
+            massive_ticker = to_massive_ticker(sym)
+        except Exception:
+            massive_ticker = None
+
+        # upsert() reads + rewrites the whole per-symbol store, so chunks are
+        # buffered and persisted every `flush_chunks` chunks (or only at symbol
+        # end when flush_chunks <= 0) instead of once per chunk (which made a
+        # long backfill O(n^2)).
+        pending: List[Dict[str, Any]] = []
+        pending_chunks = 0
+        pending_fetched = 0
+        pending_start: Optional[datetime] = None
+        pending_end: Optional[datetime] = None
+        pending_ms = 0.0
+
+        def _flush() -> None:
+            nonlocal total_written, pending, pending_chunks, pending_fetched, pending_start, pending_end, pending_ms
+            if not pending_chunks:
+                return
+            t0 = time.perf_counter()
+            written, path = store_upsert(sym, tf, pending, provider=getattr(provider, "name", None))
+            total_written += int(written)
+            log_ingest_event(
+                logger,
+                "backfill_chunk",
+                provider=getattr(provider, "name", "unknown"),
+                symbol=sym,
+                timeframe=str(tf),
+                candles_count=int(written),
+                requested_start=pending_start.isoformat() if pending_start else None,
+                requested_end=pending_end.isoformat() if pending_end else None,
+                persist_path=str(path),
+                duration_ms=pending_ms + (time.perf_counter() - t0) * 1000.0,
+                extra={
+                    "internalSymbol": sym,
+                    "massiveTicker": massive_ticker,
+                    "fetchedCandles": int(pending_fetched),
+                    "chunks": int(pending_chunks),
+                },
+            )
+            pending = []
+            pending_chunks = 0
+            pending_fetched = 0
+            pending_start = None
+            pending_end = None
+            pending_ms = 0.0
+
+        def _fetch(rng: tuple[datetime, datetime]) -> tuple[datetime, datetime, List[Candle], float]:
+            a, b = rng
             t0 = time.perf_counter()
             # conservative limit estimate based on timeframe seconds
             est = int((b - a).total_seconds() / float(_tf_seconds(tf))) + 20
@@ -187,7 +278,14 @@ def run_backfill(
                 since_ts=a,
                 until_ts=b,
             )
-            dt_ms = (time.perf_counter() - t0) * 1000.0
+            return a, b, candles, (time.perf_counter() - t0) * 1000.0
+
+        logger.info("Backfilling %s tf=%s from %s to %s", sym, tf, start.isoformat(), end.isoformat())
+        ranges = list(_chunk_ranges(start, end, chunk_days=chunk_days))
+        # Fetches may run concurrently (network-bound); results are consumed in
+        # range order so buffering/store writes stay serial and ascending.
+        fetched = pool.map(_fetch, ranges) if pool is not None else map(_fetch, ranges)
+        for (a, b, candles, dt_ms) in fetched:
 
             if validate_output:
                 stats = _validate_candles(candles or [], tf)
@@ -203,46 +301,29 @@ def run_backfill(
                 else:
                     logger.info("VALIDATE_OK %s tf=%s count=%d", sym, tf, int(len(candles or [])))
 
-            cache_dicts = candles_to_cache_dicts(candles) if candles else []
-            written, path = store_upsert(sym, tf, cache_dicts, provider=getattr(provider, "name", None))
-            total_written += int(written)
-
-            massive_ticker: Optional[str] = None
-            try:
-                massive_ticker = to_massive_ticker(sym)
-            except Exception:
-                massive_ticker = None
-
-            log_ingest_event(
-                logger,
-                "backfill_chunk",
-                provider=getattr(provider, "name", "unknown"),
-                symbol=sym,
-                timeframe=str(tf),
-                candles_count=int(written),
-                requested_start=a.isoformat(),
-                requested_end=b.isoformat(),
-                persist_path=str(path),
-                duration_ms=dt_ms,
-                extra={
-                    "internalSymbol": sym,
-                    "massiveTicker": massive_ticker,
-                    "fetchedCandles": int(len(candles or [])),
-                },
-            )
+            if candles:
+                pending.extend(candles_to_cache_dicts(candles))
+            pending_chunks += 1
+            pending_fetched += len(candles or [])
+            pending_start = pending_start or a
+            pending_end = b
+            pending_ms += dt_ms
 
             logger.info(
-                "chunk %s %s..%s fetched=%d wrote=%d ms=%.1f",
+                "chunk %s %s..%s fetched=%d ms=%.1f",
                 sym,
                 a.date().isoformat(),
                 b.date().isoformat(),
                 len(candles or []),
-                int(written),
                 dt_ms,
             )
 
-    logger.info("Backfill complete total_written=%d", total_written)
-    return 0
+            if flush_chunks > 0 and pending_chunks >= flush_chunks:
+                _flush()
+
+        _flush()
+
+    return total_written
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -254,6 +335,21 @@ def main(argv: Optional[List[str]] = None) -> int:
     ap.add_argument("--years", type=int, default=2, help="How many years to backfill")
     ap.add_argument("--days", type=int, default=None, help="Override: backfill last N days")
     ap.add_argument("--chunk-days", type=int, default=7, help="Days per request chunk")
+    ap.add_argument(
+        "--flush-chunks",
+        type=int,
+        default=8,
+        help=(
+            "Persist to the store every N fetched chunks (each persist rewrites the symbol file); "
+            "0 = once per symbol"
+        ),
+    )
+    ap.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Chunk fetches in flight per symbol (provider rate limit still applies)",
+    )
     ap.add_argument("--validate-tickers", action="store_true", help="Validate Massive tickers via ref endpoint (best-effort)")
     ap.add_argument(
         "--validate",
@@ -275,6 +371,8 @@ def main(argv: Optional[List[str]] = None) -> int:
         chunk_days=int(args.chunk_days),
         validate_tickers=bool(args.validate_tickers),
         validate_output=bool(getattr(args, "validate_output", False)),
+        flush_chunks=int(args.flush_chunks),
+        concurrency=int(args.concurrency),
     )
 
 
@@ -1,13 +1,22 @@
 #!/usr/bin/env python3
 """Check market cache data range"""
-import json
-with open("/app/state/market_cache.json") as f:
-    d = json.load(f)
+import sys
+from itertools import islice
+from pathlib import Path
+
+# Running as `python scripts/check_cache.py` puts scripts/ on sys.path, not the repo root.
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from core import fast_json
+
+with open("/app/state/market_cache.json", "rb") as f:
+    d = fast_json.loads(f.read())
 
 symbols = d.get("symbols", d)  # Handle both formats
 print(f"Total symbols: {len(symbols)}")
-for sym in list(symbols.keys())[:5]:
-    candles = symbols[sym]
+for sym, candles in islice(symbols.items(), 5):
     if isinstance(candles, list) and candles:
         first = candles[0].get("time") or candles[0].get("timestamp")
         last = candles[-1].get("time") or candles[-1].get("timestamp")
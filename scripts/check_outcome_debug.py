@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """Debug script to check outcome tracker"""
-from core.outcome_tracker import get_pending_signals, run_outcome_check
+from core.outcome_tracker import get_pending_signals, run_outcome_check, scan_candles_since
 from market_data_cache import MarketDataCache
 from datetime import datetime
 
@@ -29,23 +29,11 @@ if signals:
     print(f"\nCache has {len(candles)} candles for {symbol}")
     
     if candles:
-        # Find candles after signal
-        candles_after = []
-        for c in candles:
-            c_ts = c.get("timestamp") or 0
-            if isinstance(c_ts, str):
-                try:
-                    c_ts = int(datetime.fromisoformat(c_ts.replace("Z", "+00:00")).timestamp())
-                except:
-                    c_ts = 0
-            if c_ts > created_at:
-                candles_after.append(c)
+        n_after, high_since, low_since = scan_candles_since(candles, created_at)
         
-        print(f"Candles AFTER signal: {len(candles_after)}")
+        print(f"Candles AFTER signal: {n_after}")
         
-        if candles_after:
-            high_since = max(c.get("high", 0) for c in candles_after)
-            low_since = min(c.get("low", float("inf")) for c in candles_after)
+        if n_after:
             print(f"High since entry: {high_since}")
             print(f"Low since entry: {low_since}")
             
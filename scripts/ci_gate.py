@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
@@ -13,18 +14,22 @@ def _run(cmd: list[str]) -> int:
 def main() -> int:
     repo = Path(__file__).resolve().parents[1]
 
-    # 0) Audit for accidental non-atomic writes.
-    rc = _run([sys.executable, str(repo / "scripts" / "audit_atomic_state_writes.py")])
-    if rc != 0:
-        return rc
-
-    # 1) Syntax/import check.
-    rc = _run([sys.executable, "-m", "compileall", "-q", str(repo)])
-    if rc != 0:
-        return rc
-
-    # 2) Test suite.
-    rc = _run([sys.executable, "-m", "pytest", "-q"])
+    # 0) Audit for accidental non-atomic writes and 1) syntax/import check.
+    # Both are read-only and independent, so they run concurrently.
+    p_audit = subprocess.Popen([sys.executable, str(repo / "scripts" / "audit_atomic_state_writes.py")])
+    p_cc = subprocess.Popen([sys.executable, "-m", "compileall", "-q", "-j", "0", str(repo)])
+    rc_audit = int(p_audit.wait())
+    rc_cc = int(p_cc.wait())
+    if rc_audit != 0:
+        return rc_audit
+    if rc_cc != 0:
+        return rc_cc
+
+    # 2) Test suite (sharded across CPUs when pytest-xdist is installed).
+    cmd = [sys.executable, "-m", "pytest", "-q"]
+    if importlib.util.find_spec("xdist") is not None:
+        cmd += ["-n", "auto", "--dist=loadfile"]
+    rc = _run(cmd)
     return rc
 
 
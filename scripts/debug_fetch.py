@@ -2,6 +2,7 @@
 """Debug script to test Polygon API fetching."""
 import os
 import sys
+import time
 import requests
 
 # Ensure we're in the app directory
@@ -28,9 +29,12 @@ print(f"Start ms: {start_ms}, End ms: {end_ms}")
 
 # Test raw API call with those exact params
 api_key = os.getenv('MASSIVE_API_KEY', '')
+# One session for both calls: the second request reuses the TCP+TLS connection.
+sess = requests.Session()
 url = f'https://api.polygon.io/v2/aggs/ticker/C:EURUSD/range/5/minute/{start_ms}/{end_ms}'
-resp = requests.get(url, params={'apiKey': api_key, 'limit': 5, 'sort': 'desc'})
-print(f"\nAPI with ms timestamps status: {resp.status_code}")
+t0 = time.perf_counter()
+resp = sess.get(url, params={'apiKey': api_key, 'limit': 5, 'sort': 'desc'})
+print(f"\nAPI with ms timestamps status: {resp.status_code} ({(time.perf_counter() - t0) * 1000:.0f} ms)")
 data = resp.json()
 print(f"Results count: {data.get('resultsCount', 0)}")
 if data.get('results'):
@@ -41,7 +45,9 @@ if data.get('results'):
 # Test with date strings (like working curl)
 print("\n=== Test with date strings ===")
 url2 = 'https://api.polygon.io/v2/aggs/ticker/C:EURUSD/range/5/minute/2026-01-13/2026-01-13'
-resp2 = requests.get(url2, params={'apiKey': api_key, 'limit': 5})
+t0 = time.perf_counter()
+resp2 = sess.get(url2, params={'apiKey': api_key, 'limit': 5})
+print(f"Status: {resp2.status_code} ({(time.perf_counter() - t0) * 1000:.0f} ms)")
 data2 = resp2.json()
 print(f"Results count with dates: {data2.get('resultsCount', 0)}")
 
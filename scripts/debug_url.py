@@ -2,27 +2,26 @@
 """Debug the actual URL being generated and test it."""
 import os
 import sys
+import time
 sys.path.insert(0, "/app")
 
-from datetime import datetime, timezone, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 import requests
 
-def _dt_to_unix(dt):
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    return int(dt.astimezone(timezone.utc).timestamp())
-
-# Same logic as massive_provider.py
-end = datetime.now(timezone.utc)
+# Same window as massive_provider.py, in unix seconds (time.time() is UTC);
+# datetimes are only built for the printout.
 limit = 5
 tf_seconds = 300  # 5 minutes
-use_start = end - timedelta(seconds=int(limit) * int(tf_seconds) * 4)
-
-start_ts = _dt_to_unix(use_start)
-end_ts = _dt_to_unix(end)
+end_ts = int(time.time())
+start_ts = end_ts - int(limit) * int(tf_seconds) * 4
+end = datetime.fromtimestamp(end_ts, tz=timezone.utc)
+use_start = datetime.fromtimestamp(start_ts, tz=timezone.utc)
 
 API_KEY = os.getenv("POLYGON_API_KEY", "13pxjpTe80GhXDijoB_3s4QVbo6CBKN7")
 BASE_URL = "https://api.polygon.io"
+# Shared keep-alive session: one TLS handshake for all probes below.
+SESSION = requests.Session()
 
 symbols = ["C:EURUSD", "C:USDJPY", "C:GBPUSD", "C:AUDUSD", "C:XAUUSD", "X:BTCUSD"]
 
@@ -31,12 +30,21 @@ print(f"Timestamps: {start_ts} to {end_ts}")
 print(f"Duration: {(end_ts - start_ts) / 60:.1f} minutes")
 print()
 
-for sym in symbols:
-    url = f"{BASE_URL}/v2/aggs/ticker/{sym}/range/5/minute/{start_ts}/{end_ts}"
+def probe(sym, frm=start_ts, to=end_ts):
+    url = f"{BASE_URL}/v2/aggs/ticker/{sym}/range/5/minute/{frm}/{to}"
     params = {"adjusted": "true", "sort": "desc", "limit": 5, "apiKey": API_KEY}
-    
-    resp = requests.get(url, params=params, timeout=10)
-    data = resp.json()
+    return SESSION.get(url, params=params, timeout=10).json()
+
+# Probes are network-bound: both sections are submitted up front on one pool
+# (the per-ticker 5m range URL is what's being debugged, so no grouped bars).
+today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+date_symbols = symbols[:2]
+with ThreadPoolExecutor(max_workers=8) as ex:
+    date_futures = [ex.submit(probe, sym, today, today) for sym in date_symbols]
+    results = list(ex.map(probe, symbols))
+    date_results = [f.result() for f in date_futures]
+
+for sym, data in zip(symbols, results):
     count = data.get("resultsCount", 0)
     status = data.get("status", "?")
     
@@ -48,12 +56,6 @@ for sym in symbols:
         print(f"  Latest candle: {latest_dt}")
 
 print("\n--- Testing with date string format ---")
-today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-for sym in symbols[:2]:
-    url = f"{BASE_URL}/v2/aggs/ticker/{sym}/range/5/minute/{today}/{today}"
-    params = {"adjusted": "true", "sort": "desc", "limit": 5, "apiKey": API_KEY}
-    
-    resp = requests.get(url, params=params, timeout=10)
-    data = resp.json()
+for sym, data in zip(date_symbols, date_results):
     count = data.get("resultsCount", 0)
     print(f"{sym} (date string): {count} results")
@@ -13,11 +13,11 @@ Exits:
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import sys
 from pathlib import Path
 
+from core import fast_json
 from core.ops import build_health_snapshot
 
 
@@ -44,7 +44,15 @@ def main(argv: list[str] | None = None) -> int:
         patch_audit_path=str(repo_dir / args.patch_audit_path),
     )
 
-    sys.stdout.write(json.dumps(payload, ensure_ascii=False, indent=2) + "\n")
+    # Serialize straight to bytes (orjson when installed) and skip the str round trip.
+    data = fast_json.dumps_bytes(payload, indent=True, newline=True)
+    out = getattr(sys.stdout, "buffer", None)
+    if out is not None:
+        sys.stdout.flush()
+        out.write(data)
+        out.flush()
+    else:  # stdout replaced by a text-only stream
+        sys.stdout.write(data.decode("utf-8"))
 
     status = str(payload.get("status") or "error").strip().lower()
     return 0 if status == "ok" else 1
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
 import argparse
-import json
+import mmap
 import os
-from datetime import datetime
+import shutil
+import time
 from typing import Any, Dict, Optional
 
+from core import fast_json
 from strategies.loader import load_strategy_pack
 
 
 def _unix_ts() -> int:
-    try:
-        return int(datetime.utcnow().timestamp())
-    except Exception:
-        return 0
+    # time.time() is already UTC epoch seconds (utcnow().timestamp() was also
+    # off by the local UTC offset, since naive datetimes are read as local).
+    return int(time.time())
 
 
 def _read_latest_audit_entry(audit_path: str, patch_id: str) -> Optional[Dict[str, Any]]:
@@ -23,26 +24,29 @@ def _read_latest_audit_entry(audit_path: str, patch_id: str) -> Optional[Dict[st
     if not os.path.exists(audit_path):
         return None
 
-    latest: Optional[Dict[str, Any]] = None
+    # Newest record wins, so walk lines from the end and stop at the first
+    # match; only lines containing the patch id bytes are JSON-decoded.
+    needle = pid.encode("utf-8")
     try:
-        with open(audit_path, "r", encoding="utf-8") as f:
-            for line in f:
-                s = str(line or "").strip()
-                if not s:
-                    continue
-                try:
-                    obj = json.loads(s)
-                except Exception:
-                    continue
-                if not isinstance(obj, dict):
-                    continue
-                if str(obj.get("patch_id") or "").strip() != pid:
-                    continue
-                latest = obj
+        with open(audit_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = len(mm)
+                while end > 0:
+                    start = mm.rfind(b"\n", 0, end) + 1
+                    if mm.find(needle, start, end) != -1:
+                        try:
+                            obj = fast_json.loads(mm[start:end])
+                        except Exception:
+                            obj = None
+                        if isinstance(obj, dict) and str(obj.get("patch_id") or "").strip() == pid:
+                            return obj
+                    end = start - 1
     except Exception:
         return None
 
-    return latest
+    return None
 
 
 def _atomic_write_bytes(dst_path: str, content: bytes) -> None:
@@ -54,6 +58,34 @@ def _atomic_write_bytes(dst_path: str, content: bytes) -> None:
     os.replace(tmp, dst_path)
 
 
+def _atomic_copy_file(src_path: str, dst_path: str) -> None:
+    """Copy src over dst atomically without reading it into Python memory.
+
+    shutil.copyfile copies in-kernel (os.sendfile on Linux) with a plain
+    read/write fallback elsewhere. A real copy rather than a hardlink, so
+    the backup never shares an inode with the live file.
+    """
+    directory = os.path.dirname(dst_path) or "."
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{dst_path}.tmp"
+    shutil.copyfile(src_path, tmp)
+    os.replace(tmp, dst_path)
+
+
+def _fast_valid(path: str) -> bool:
+    """Cheap structural check: a JSON object with a "strategies" list.
+
+    Catches truncated/garbled backups with one read + parse, before the full
+    loader (presets, detectors, schema walk) is worth running.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = fast_json.loads(f.read())
+    except Exception:
+        return False
+    return isinstance(data, dict) and isinstance(data.get("strategies"), list)
+
+
 def _validate_strategies(path: str) -> bool:
     pack = load_strategy_pack(path, presets_dir="config/presets")
     # Treat hard file/schema errors as invalid.
@@ -72,6 +104,7 @@ def rollback_patch(
     strategies_path: str = "config/strategies.json",
     dry_run: bool = True,
     validate: bool = True,
+    deep_validate: bool = True,
 ) -> Dict[str, Any]:
     entry = _read_latest_audit_entry(audit_path, patch_id)
     if entry is None:
@@ -93,12 +126,13 @@ def rollback_patch(
     except Exception:
         current_bytes = b""
 
-    with open(backup_path, "rb") as f:
-        backup_bytes = f.read()
+    # A structurally broken backup is rejected before anything is written.
+    if validate and not _fast_valid(backup_path):
+        raise ValueError("rollback_validation_failed")
 
-    _atomic_write_bytes(strategies_path, backup_bytes)
+    _atomic_copy_file(backup_path, strategies_path)
 
-    if validate:
+    if validate and deep_validate:
         if not _validate_strategies(strategies_path):
             # revert
             _atomic_write_bytes(strategies_path, current_bytes)
@@ -118,6 +152,11 @@ def main() -> int:
     mode.add_argument("--dry-run", action="store_true")
 
     p.add_argument("--no-validate", action="store_true", help="skip loader validation after restore")
+    p.add_argument(
+        "--fast-validate",
+        action="store_true",
+        help="structural check only (valid JSON with a strategies list); skip the full loader",
+    )
 
     args = p.parse_args()
 
@@ -138,6 +177,7 @@ def main() -> int:
             strategies_path=str(args.strategies_path),
             dry_run=bool(dry_run),
             validate=(not bool(args.no_validate)),
+            deep_validate=(not bool(args.fast_validate)),
         )
 
         print(
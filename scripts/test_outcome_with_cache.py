@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """Test outcome check with loaded cache"""
-from core.outcome_tracker import run_outcome_check, get_pending_signals
+from core.outcome_tracker import run_outcome_check, get_pending_signals, scan_candles_since
 from market_data_cache import market_cache
 from datetime import datetime
 
@@ -27,22 +27,11 @@ if euraud:
         created_at = sig.get("created_at")
         print(f"First signal created at: {datetime.fromtimestamp(created_at)}")
         
-        # Count candles after signal
-        candles_after = []
-        for c in euraud:
-            c_time = c.get("time")
-            if isinstance(c_time, datetime):
-                c_ts = c_time.timestamp()
-            else:
-                c_ts = 0
-            if c_ts > created_at:
-                candles_after.append(c)
+        n_after, high_since, low_since = scan_candles_since(euraud, created_at)
         
-        print(f"Candles after signal: {len(candles_after)}")
+        print(f"Candles after signal: {n_after}")
         
-        if candles_after:
-            high_since = max(c.get("high", 0) for c in candles_after)
-            low_since = min(c.get("low", float("inf")) for c in candles_after)
+        if n_after:
             print(f"High since: {high_since}")
             print(f"Low since: {low_since}")
             print(f"SL: {sig.get('sl')}, TP: {sig.get('tp')}")
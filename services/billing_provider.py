@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def get_billing_provider() -> str:
     """Return the active billing provider.
 
     Supported: "manual", "qpay", "stripe".
 
     Defaults to manual bank-transfer approval flow.
+
+    Resolved once: BILLING_PROVIDER must be set before the first call
+    (tests can use get_billing_provider.cache_clear()).
     """
 
     provider = str(os.getenv("BILLING_PROVIDER") or "manual").strip().lower()
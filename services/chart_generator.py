@@ -1,43 +1,98 @@
 
 import io
+import os
+import threading
 import matplotlib
 matplotlib.use("Agg") # Non-interactive backend
-import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.collections import PatchCollection
+from matplotlib.figure import Figure
 from matplotlib.patches import Rectangle
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+import config
+
+# Dark theme (shared by the matplotlib and Pillow renderers)
+_BG_COLOR = "#131722"
+_GRID_COLOR = "#363c4e"
+_TEXT_COLOR = "#d1d4dc"
+_UP_COLOR = "#26a69a"
+_DOWN_COLOR = "#ef5350"
+
+# Reused matplotlib figure (see _chart_axes); matplotlib artists are not thread-safe.
+_FIG = None
+_AX = None
+_FIG_LOCK = threading.Lock()
+_DEFAULT_SUBPLOT_PARAMS = {
+    k: matplotlib.rcParams[f"figure.subplot.{k}"] for k in ("left", "right", "bottom", "top", "wspace", "hspace")
+}
+
 
 def generate_chart_image(
     candles: List[Dict[str, Any]],
     pair_for_title: str,
     timeframe: str,
+    tz_offset_hours: int = 0,
 ) -> io.BytesIO:
     """
     Generates a dark-themed candlestick chart.
     Expects candles to have 'time', 'open', 'high', 'low', 'close' keys.
+    tz_offset_hours shifts the x-axis (candle dicts are not copied).
     """
     if not candles:
         return io.BytesIO()
 
-    # Data prep
+    # Data prep: one pass over the candle dicts, then a single vectorised
+    # date2num call (per-scalar calls cost ~40us each). date2num is in days,
+    # so the tz shift is a single add per candle.
+    day_offset = int(tz_offset_hours or 0) / 24.0
     try:
-        dates = [mdates.date2num(c["time"]) for c in candles]
-        opens = [c["open"] for c in candles]
-        highs = [c["high"] for c in candles]
-        lows = [c["low"] for c in candles]
-        closes = [c["close"] for c in candles]
+        times, opens, highs, lows, closes = (
+            list(col) for col in zip(*((c["time"], c["open"], c["high"], c["low"], c["close"]) for c in candles))
+        )
     except KeyError as e:
         print(f"Chart data error: {e}")
         return io.BytesIO()
+    dates = [x + day_offset for x in mdates.date2num(times).tolist()]
+
+    if str(getattr(config, "CHART_BACKEND", "") or "").lower() == "pil":
+        buf = _render_pil(dates, opens, highs, lows, closes, f"{pair_for_title} – {timeframe}")
+        if buf is not None:
+            return buf
+
+    with _FIG_LOCK:
+        fig, ax = _chart_axes()
+        return _draw_matplotlib(
+            fig, ax, dates, opens, highs, lows, closes, f"{pair_for_title} – {timeframe}"
+        )
+
 
+def _chart_axes():
+    """Module-level Figure/Axes reused across charts (caller holds _FIG_LOCK).
+
+    A plain Figure (not pyplot) so it never joins pyplot's global figure
+    registry; the axes are cleared per chart instead of building a new tree.
+    """
+    global _FIG, _AX
+    if _FIG is None:
+        _FIG = Figure(figsize=(10, 5))
+        _AX = _FIG.subplots()
+    else:
+        _AX.cla()
+        # tight_layout starts from the current subplot params; reset them so a
+        # reused figure lays out exactly like a fresh one.
+        _FIG.subplots_adjust(**_DEFAULT_SUBPLOT_PARAMS)
+    return _FIG, _AX
+
+
+def _draw_matplotlib(fig, ax, dates, opens, highs, lows, closes, title: str) -> io.BytesIO:
     # Styling
-    bg_color = "#131722"
-    grid_color = "#363c4e"
-    text_color = "#d1d4dc"
-    up_color = "#26a69a"
-    down_color = "#ef5350"
+    bg_color = _BG_COLOR
+    grid_color = _GRID_COLOR
+    text_color = _TEXT_COLOR
+    up_color = _UP_COLOR
+    down_color = _DOWN_COLOR
 
-    fig, ax = plt.subplots(figsize=(10, 5))
     fig.patch.set_facecolor(bg_color)
     ax.set_facecolor(bg_color)
 
@@ -56,34 +111,29 @@ def generate_chart_image(
     else:
         width = 0.0005
 
-    # Plotting
+    # Plotting: one LineCollection for wicks and one PatchCollection for bodies
+    # (per-candle vlines/add_patch made rendering O(N) matplotlib artists).
+    colors = [up_color if c >= o else down_color for o, c in zip(opens, closes)]
+    ax.vlines(dates, lows, highs, colors=colors, linewidth=0.8)
+    bodies = []
     for x, o, h, l, c in zip(dates, opens, highs, lows, closes):
-        color = up_color if c >= o else down_color
-        # Wick
-        ax.vlines(x, l, h, color=color, linewidth=0.8)
-        # Body
-        body_lower = min(o, c)
         body_height = abs(c - o)
         if body_height == 0:
             body_height = max((h - l) * 0.05, 0.0001)
-            
-        rect = Rectangle(
-            (x - width / 2, body_lower),
-            width,
-            body_height,
-            facecolor=color,
-            edgecolor=color,
-            linewidth=0.8,
-        )
-        ax.add_patch(rect)
+        bodies.append(Rectangle((x - width / 2, min(o, c)), width, body_height))
+    ax.add_collection(
+        PatchCollection(bodies, facecolors=colors, edgecolors=colors, linewidths=0.8),
+        autolim=True,
+    )
+    ax.autoscale_view()
 
     # Formatting axis
     ax.set_xlim(min(dates) - width*2, max(dates) + width*2)
     ax.xaxis_date()
     ax.xaxis.set_major_formatter(mdates.DateFormatter("%m-%d %H:%M"))
-    plt.xticks(rotation=0)
+    ax.tick_params(axis="x", labelrotation=0)
 
-    ax.set_title(f"{pair_for_title} – {timeframe}", color=text_color, fontsize=12, fontweight='bold')
+    ax.set_title(title, color=text_color, fontsize=12, fontweight='bold')
     ax.grid(True, alpha=0.15, color=grid_color, linestyle='--')
 
     # Watermark (Optional)
@@ -93,9 +143,93 @@ def generate_chart_image(
 
     # Save to buffer
     buf = io.BytesIO()
-    plt.tight_layout()
+    fig.tight_layout()
     fig.savefig(buf, format="png", dpi=150, bbox_inches='tight')
-    plt.close(fig)
     buf.seek(0)
     
     return buf
+
+
+def _render_pil(
+    dates: List[float],
+    opens: List[float],
+    highs: List[float],
+    lows: List[float],
+    closes: List[float],
+    title: str,
+) -> Optional[io.BytesIO]:
+    """
+    Pillow-only candlestick render (CHART_BACKEND=pil).
+    Same theme and 1500x750 canvas as the matplotlib path (10x5in @ 150dpi),
+    without building a figure. Returns None if Pillow is unavailable.
+    """
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+    except ImportError:
+        return None
+
+    def _font(size: int, name: str = "DejaVuSans.ttf"):
+        # matplotlib ships DejaVu (covers the "–" in titles); Pillow's default otherwise
+        try:
+            return ImageFont.truetype(os.path.join(matplotlib.get_data_path(), "fonts", "ttf", name), size)
+        except OSError:
+            try:
+                return ImageFont.load_default(size=size)
+            except TypeError:  # Pillow < 10.1: fixed-size bitmap font
+                return ImageFont.load_default()
+
+    W, H = 1500, 750
+    left, right, top, bottom = 110, 30, 50, 50
+    pw, ph = W - left - right, H - top - bottom
+
+    img = Image.new("RGB", (W, H), _BG_COLOR)
+    draw = ImageDraw.Draw(img)
+    label_font = _font(16)
+    grid_faint = "#1f2431"  # _GRID_COLOR at ~35% over the background
+
+    # Scales (x in date2num days, padded like the matplotlib xlim)
+    width = (dates[-1] - dates[0]) / len(dates) * 0.6 if len(dates) > 1 else 0.0005
+    x0, x1 = min(dates) - width * 2, max(dates) + width * 2
+    y0, y1 = min(lows), max(highs)
+    pad = (y1 - y0) * 0.05 or abs(y1) * 0.001 or 1.0
+    y0, y1 = y0 - pad, y1 + pad
+    sx = pw / (x1 - x0)
+    sy = ph / (y1 - y0)
+
+    def px(x: float) -> float:
+        return left + (x - x0) * sx
+
+    def py(y: float) -> float:
+        return top + (y1 - y) * sy
+
+    # Grid + axis labels
+    n_ticks = 6
+    for i in range(n_ticks + 1):
+        yv = y0 + (y1 - y0) * i / n_ticks
+        yp = py(yv)
+        draw.line([(left, yp), (W - right, yp)], fill=grid_faint, width=1)
+        draw.text((left - 8, yp), f"{yv:.5g}", fill=_TEXT_COLOR, font=label_font, anchor="rm")
+    step = max(1, len(dates) // n_ticks)
+    for x in dates[::step]:
+        xp = px(x)
+        draw.line([(xp, top), (xp, H - bottom)], fill=grid_faint, width=1)
+        label = mdates.num2date(x).strftime("%m-%d %H:%M")
+        draw.text((xp, H - bottom + 8), label, fill=_TEXT_COLOR, font=label_font, anchor="ma")
+    draw.rectangle([left, top, W - right, H - bottom], outline=_GRID_COLOR, width=1)
+
+    # Candles
+    half = max(1.0, width * sx / 2)
+    for x, o, h, l, c in zip(dates, opens, highs, lows, closes):
+        color = _UP_COLOR if c >= o else _DOWN_COLOR
+        xp = px(x)
+        draw.line([(xp, py(h)), (xp, py(l))], fill=color, width=1)
+        top_px, bot_px = py(max(o, c)), py(min(o, c))
+        draw.rectangle([xp - half, top_px, xp + half, max(bot_px, top_px + 1)], fill=color)
+
+    draw.text((W / 2, top / 2), title, fill=_TEXT_COLOR, font=_font(22, "DejaVuSans-Bold.ttf"), anchor="mm")
+
+    buf = io.BytesIO()
+    # compress_level=1: encode speed matters more than a few KB here
+    img.save(buf, "PNG", compress_level=1)
+    buf.seek(0)
+    return buf
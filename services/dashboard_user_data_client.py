@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import os
+import threading
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
+# Callers build a fresh (cheap, frozen) client per operation via from_env(), so
+# the underlying httpx.Client lives here, shared per (base_url, api_key,
+# timeout), to keep connections alive across calls instead of a new TCP/TLS
+# handshake per request.
+_HTTP_CLIENTS: Dict[Tuple[str, str, float], httpx.Client] = {}
+_HTTP_CLIENTS_LOCK = threading.Lock()
+
 
 @dataclass(frozen=True)
 class DashboardUserDataClient:
@@ -28,48 +36,69 @@ class DashboardUserDataClient:
             "accept": "application/json",
         }
 
+    def _cache_key(self) -> Tuple[str, str, float]:
+        return (self.base_url, self.api_key, float(self.timeout_s))
+
+    def _client(self) -> httpx.Client:
+        key = self._cache_key()
+        client = _HTTP_CLIENTS.get(key)
+        if client is not None and not client.is_closed:
+            return client
+        with _HTTP_CLIENTS_LOCK:
+            client = _HTTP_CLIENTS.get(key)
+            if client is None or client.is_closed:
+                client = httpx.Client(
+                    base_url=self.base_url,
+                    headers=self._headers(),
+                    timeout=self.timeout_s,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+                )
+                _HTTP_CLIENTS[key] = client
+            return client
+
+    def close(self) -> None:
+        """Close the shared connection pool for this base_url/api_key (e.g. on shutdown)."""
+        with _HTTP_CLIENTS_LOCK:
+            client = _HTTP_CLIENTS.pop(self._cache_key(), None)
+        if client is not None:
+            client.close()
+
     def get_strategies(self, user_id: str) -> List[Dict[str, Any]]:
-        url = f"{self.base_url}/api/internal/user-data/strategies/{user_id}"
-        with httpx.Client(timeout=self.timeout_s) as client:
-            res = client.get(url, headers=self._headers())
+        url = f"/api/internal/user-data/strategies/{user_id}"
+        res = self._client().get(url)
         res.raise_for_status()
         data = res.json()
         strategies = data.get("strategies")
         return list(strategies) if isinstance(strategies, list) else []
 
     def put_strategies(self, user_id: str, strategies: List[Dict[str, Any]]) -> None:
-        url = f"{self.base_url}/api/internal/user-data/strategies/{user_id}"
-        with httpx.Client(timeout=self.timeout_s) as client:
-            res = client.put(url, headers=self._headers(), json={"strategies": strategies})
+        url = f"/api/internal/user-data/strategies/{user_id}"
+        res = self._client().put(url, json={"strategies": strategies})
         res.raise_for_status()
 
     def upsert_signal(self, *, user_id: str, signal_key: str, signal: Dict[str, Any]) -> None:
-        url = f"{self.base_url}/api/internal/user-data/signals"
+        url = "/api/internal/user-data/signals"
         payload = {"user_id": str(user_id), "signal_key": str(signal_key), "signal": signal}
-        with httpx.Client(timeout=self.timeout_s) as client:
-            res = client.post(url, headers=self._headers(), json=payload)
+        res = self._client().post(url, json=payload)
         res.raise_for_status()
 
     def list_active_users(self) -> List[Dict[str, Any]]:
-        url = f"{self.base_url}/api/internal/user-data/users"
-        with httpx.Client(timeout=self.timeout_s) as client:
-            res = client.get(url, headers=self._headers())
+        url = "/api/internal/user-data/users"
+        res = self._client().get(url)
         res.raise_for_status()
         data = res.json()
         users = data.get("users")
         return list(users) if isinstance(users, list) else []
 
     def get_user_prefs(self, user_id: str) -> Dict[str, Any]:
-        url = f"{self.base_url}/api/internal/user-data/users/{user_id}"
-        with httpx.Client(timeout=self.timeout_s) as client:
-            res = client.get(url, headers=self._headers())
+        url = f"/api/internal/user-data/users/{user_id}"
+        res = self._client().get(url)
         res.raise_for_status()
         data = res.json()
         prefs = data.get("prefs")
         return dict(prefs) if isinstance(prefs, dict) else {}
 
     def put_user_prefs(self, user_id: str, prefs: Dict[str, Any]) -> None:
-        url = f"{self.base_url}/api/internal/user-data/users/{user_id}"
-        with httpx.Client(timeout=self.timeout_s) as client:
-            res = client.put(url, headers=self._headers(), json={"prefs": prefs})
+        url = f"/api/internal/user-data/users/{user_id}"
+        res = self._client().put(url, json={"prefs": prefs})
         res.raise_for_status()
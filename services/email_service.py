@@ -1,12 +1,144 @@
 from __future__ import annotations
 
+import logging
 import os
+import queue
 import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from email.mime.text import MIMEText
 from email.utils import formataddr
+from typing import Iterator
 
+logger = logging.getLogger("services.email")
 
-def send_email(*, to_email: str, subject: str, text_body: str) -> None:
+
+@dataclass(frozen=True)
+class _SmtpSettings:
+    host: str
+    port: int
+    username: str
+    password: str
+
+
+@dataclass
+class _PooledSMTP:
+    smtp: smtplib.SMTP
+    sends: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+# Logged-in connections are kept per settings and reused LIFO, so a burst of
+# emails pays DNS + TCP + STARTTLS + AUTH once instead of per message. Idle
+# ones are dropped on checkout (providers kill them server-side anyway) and
+# each connection is retired after _SMTP_MAX_SENDS messages.
+_SMTP_POOL_SIZE = 5
+_SMTP_IDLE_S = 60.0
+_SMTP_MAX_SENDS = 100
+_SMTP_POOLS: dict[_SmtpSettings, "queue.LifoQueue[_PooledSMTP]"] = {}
+_SMTP_POOLS_LOCK = threading.Lock()
+
+
+def _smtp_connect(settings: _SmtpSettings) -> smtplib.SMTP:
+    smtp = smtplib.SMTP(settings.host, settings.port, timeout=20)
+    try:
+        smtp.ehlo()
+        if settings.port == 587:
+            smtp.starttls()
+            smtp.ehlo()
+        smtp.login(settings.username, settings.password)
+    except BaseException:
+        smtp.close()
+        raise
+    return smtp
+
+
+def _smtp_close(smtp: smtplib.SMTP) -> None:
+    try:
+        smtp.quit()
+    except Exception:
+        smtp.close()
+
+
+def _smtp_alive(smtp: smtplib.SMTP) -> bool:
+    try:
+        return smtp.noop()[0] == 250
+    except (smtplib.SMTPException, OSError):
+        return False
+
+
+@contextmanager
+def _get_smtp(settings: _SmtpSettings) -> Iterator[smtplib.SMTP]:
+    """Check out a logged-in connection; it is returned to the pool only if
+    the block completes without error."""
+    with _SMTP_POOLS_LOCK:
+        pool = _SMTP_POOLS.setdefault(settings, queue.LifoQueue(maxsize=_SMTP_POOL_SIZE))
+
+    conn = None
+    while conn is None:
+        try:
+            conn = pool.get_nowait()
+        except queue.Empty:
+            break
+        if time.monotonic() - conn.last_used > _SMTP_IDLE_S or not _smtp_alive(conn.smtp):
+            _smtp_close(conn.smtp)
+            conn = None
+    if conn is None:
+        conn = _PooledSMTP(_smtp_connect(settings))
+
+    try:
+        yield conn.smtp
+    except BaseException:
+        _smtp_close(conn.smtp)
+        raise
+
+    conn.sends += 1
+    conn.last_used = time.monotonic()
+    if conn.sends >= _SMTP_MAX_SENDS:
+        _smtp_close(conn.smtp)
+        return
+    try:
+        pool.put_nowait(conn)
+    except queue.Full:
+        _smtp_close(conn.smtp)
+
+
+# Outgoing mail is handed to one background sender thread by default, so a
+# request handler returns in microseconds instead of waiting on SMTP.
+_MAIL_QUEUE_SIZE = 1024
+_MAIL_QUEUE: "queue.Queue[tuple[_SmtpSettings, str, str, str]]" = queue.Queue(maxsize=_MAIL_QUEUE_SIZE)
+_SENDER_THREAD: threading.Thread | None = None
+_SENDER_LOCK = threading.Lock()
+
+
+def _deliver(settings: _SmtpSettings, from_email: str, to_email: str, message: str) -> None:
+    with _get_smtp(settings) as smtp:
+        smtp.sendmail(from_email, [to_email], message)
+
+
+def _sender_loop() -> None:
+    while True:
+        item = _MAIL_QUEUE.get()
+        try:
+            _deliver(*item)
+        except Exception as e:
+            # No credentials or message bodies in the log.
+            logger.error("Background email send failed: %s", type(e).__name__)
+        finally:
+            _MAIL_QUEUE.task_done()
+
+
+def _ensure_sender() -> None:
+    global _SENDER_THREAD
+    with _SENDER_LOCK:
+        if _SENDER_THREAD is None or not _SENDER_THREAD.is_alive():
+            _SENDER_THREAD = threading.Thread(target=_sender_loop, name="email-sender", daemon=True)
+            _SENDER_THREAD.start()
+
+
+def send_email(*, to_email: str, subject: str, text_body: str, sync: bool = False) -> None:
     """Send a plain-text email via SMTP.
 
     Configure via env:
@@ -18,6 +150,12 @@ def send_email(*, to_email: str, subject: str, text_body: str) -> None:
       SMTP_FROM_NAME (optional)
 
     For Gmail, use an App Password (2FA enabled) as SMTP_PASSWORD.
+    Connections are pooled and reused across calls (see _get_smtp).
+
+    By default the message is queued for the background sender and this
+    returns immediately; delivery errors are logged, not raised. Configuration
+    errors still raise here. sync=True sends inline and raises on failure
+    (also used when the queue is full, so mail is never dropped).
     """
 
     host = os.getenv("SMTP_HOST", "smtp.gmail.com").strip()
@@ -37,13 +175,20 @@ def send_email(*, to_email: str, subject: str, text_body: str) -> None:
     msg["From"] = formataddr((from_name, from_email))
     msg["To"] = to_email
 
-    with smtplib.SMTP(host, port, timeout=20) as smtp:
-        smtp.ehlo()
-        if port == 587:
-            smtp.starttls()
-            smtp.ehlo()
-        smtp.login(username, password)
-        smtp.sendmail(from_email, [to_email], msg.as_string())
+    item = (
+        _SmtpSettings(host=host, port=port, username=username, password=password),
+        from_email,
+        to_email,
+        msg.as_string(),
+    )
+    if not sync:
+        _ensure_sender()
+        try:
+            _MAIL_QUEUE.put_nowait(item)
+            return
+        except queue.Full:
+            logger.warning("Email queue full; sending inline")
+    _deliver(*item)
 
 
 def send_verification_email(*, to_email: str, code: str, verify_url: str | None = None) -> None:
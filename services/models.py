@@ -4,7 +4,9 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, ConfigDict, Field
 
 class SignalEvent(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    # Immutable once built: the scanner hands the same instance to persistence,
+    # notifier dedupe history and the signals tracker.
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
 
     pair: str
     direction: str  # "BUY" or "SELL"
@@ -1,10 +1,16 @@
+import atexit
 import logging
 import json
+import re
+import threading
+import time
 import httpx
-from typing import Dict, Any, Optional, Union, List
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, Any, Optional, Tuple, Union
 import io
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from config import TELEGRAM_TOKEN, DEFAULT_CHAT_ID
 from services.models import SignalEvent
 from notify.formatters import format_signal_message
@@ -14,6 +20,44 @@ logger = logging.getLogger("notifier.telegram")
 # Deduplication Config
 DEDUP_WINDOW_MINUTES = 30
 PRICE_TOLERANCE_PERCENT = 0.001  # 0.1% difference considered "same setup"
+_DEDUP_WINDOW = timedelta(minutes=DEDUP_WINDOW_MINUTES)
+
+# Bot API send limits: ~30 msg/s overall, ~1 msg/s per chat.
+GLOBAL_MIN_INTERVAL_S = 1.0 / 30.0
+CHAT_MIN_INTERVAL_S = 1.0
+SEND_MAX_ATTEMPTS = 3
+RETRY_AFTER_MAX_S = 30.0  # give up rather than block a sender longer than this
+# ScannerService sends inline on the scan thread; it passes this lower cap so a
+# 429 storm costs the cycle a few seconds, not RETRY_AFTER_MAX_S per message.
+SCANNER_RETRY_AFTER_MAX_S = 5.0
+
+# Legacy caption reason translations (one regex pass instead of chained replaces).
+_REASON_TRANSLATIONS = {
+    "Uptrend": "Өсөх тренд",
+    "Downtrend": "Унах тренд",
+}
+_REASON_RE = re.compile("|".join(map(re.escape, _REASON_TRANSLATIONS)))
+_REASON_ALIGN = "D1 болон H4 тренд баталгаажсан"
+
+
+def _as_utc(dt: datetime) -> datetime:
+    # SignalEvent.generated_at is tz-aware UTC by default; older callers pass
+    # naive UTC datetimes. Normalise so dedupe comparisons never mix the two.
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+
+
+@lru_cache(maxsize=64)
+def _tz_offset(hours: int) -> timedelta:
+    return timedelta(hours=hours)
+
+
+@lru_cache(maxsize=512)
+def _legacy_reason_line(reason: str) -> str:
+    # Reason strings come from a small fixed vocabulary, so cache the result.
+    if "Align" in reason:
+        return f"✅ {_REASON_ALIGN}"
+    return "✅ " + _REASON_RE.sub(lambda m: _REASON_TRANSLATIONS[m.group()], reason)
+
 
 class TelegramNotifier:
     def __init__(self, token: str = TELEGRAM_TOKEN, default_chat_id: int = DEFAULT_CHAT_ID):
@@ -22,27 +66,128 @@ class TelegramNotifier:
         if not self.token:
             logger.warning("TELEGRAM_TOKEN is missing. Notification will fail.")
         self.api_url = f"https://api.telegram.org/bot{self.token}"
-        
-        # History: list of (SignalEvent, sent_time)
-        self._sent_history: List[SignalEvent] = []
 
-    def _is_duplicate(self, signal: SignalEvent) -> bool:
-        now = datetime.utcnow()
-        cutoff = now - timedelta(minutes=DEDUP_WINDOW_MINUTES)
-        
-        # Clean old history
-        self._sent_history = [s for s in self._sent_history if s.generated_at > cutoff]
+        # Keep-alive client shared by all sends (created on first use, so
+        # importing the module-level instance stays cheap).
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+
+        # Send pacing (see _pace): next free slot, globally and per chat.
+        self._rate_lock = threading.Lock()
+        self._next_send_at = 0.0
+        self._next_chat_send_at: Dict[str, float] = {}
         
-        for past_sig in self._sent_history:
-            if past_sig.pair != signal.pair:
+        # History of sent signals, bucketed by (pair, direction, timeframe):
+        # deque of (generated_at, entry) in send order. A check only touches its
+        # own bucket and prunes it from the left, instead of rebuilding and
+        # scanning the whole history on every send.
+        self._sent_history: Dict[Tuple[str, str, str], Deque[Tuple[datetime, float]]] = {}
+
+    def _http(self) -> httpx.Client:
+        client = self._client
+        if client is not None:
+            return client
+        with self._client_lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    timeout=httpx.Timeout(20.0, connect=5.0),
+                    limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+                )
+                atexit.register(self.close)
+            return self._client
+
+    def close(self) -> None:
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def _pace(self, chat_id: Union[int, str]) -> None:
+        """Block until this send fits Telegram's global and per-chat limits.
+
+        Slots are reserved under the lock and slept on outside it, so
+        concurrent senders queue up instead of bursting into 429s.
+        """
+        key = str(chat_id)
+        with self._rate_lock:
+            now = time.monotonic()
+            at = max(now, self._next_send_at, self._next_chat_send_at.get(key, 0.0))
+            self._next_send_at = at + GLOBAL_MIN_INTERVAL_S
+            if len(self._next_chat_send_at) > 1024:
+                self._next_chat_send_at = {k: t for k, t in self._next_chat_send_at.items() if t > now}
+            self._next_chat_send_at[key] = at + CHAT_MIN_INTERVAL_S
+        if at > now:
+            time.sleep(at - now)
+
+    @staticmethod
+    def _retry_after_s(resp: httpx.Response) -> float:
+        try:
+            params = resp.json().get("parameters") or {}
+            return float(params.get("retry_after") or resp.headers.get("Retry-After") or 1.0)
+        except Exception:
+            return 1.0
+
+    def _post(
+        self,
+        method: str,
+        chat_id: Union[int, str],
+        *,
+        timeout: float,
+        retry_after_max_s: Optional[float] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """POST a Bot API method with pacing and bounded retries.
+
+        Retries 429 (honouring retry_after up to `retry_after_max_s`, default
+        RETRY_AFTER_MAX_S), 502/503/504 and connect failures; anything that may
+        already have been delivered is not retried. Pacing and retry sleeps run
+        on the calling thread, which for ScannerService is the scan loop.
+        """
+        url = f"{self.api_url}/{method}"
+        max_wait_s = RETRY_AFTER_MAX_S if retry_after_max_s is None else float(retry_after_max_s)
+        for attempt in range(SEND_MAX_ATTEMPTS - 1):
+            self._pace(chat_id)
+            try:
+                resp = self._http().post(url, timeout=timeout, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                time.sleep(0.5 * (2 ** attempt))
                 continue
-            if past_sig.direction != signal.direction:
+
+            if resp.status_code == 429:
+                wait_s = self._retry_after_s(resp)
+                if wait_s > max_wait_s:
+                    return resp
+                logger.warning("Telegram rate limited: method=%s retry_after=%.1fs", method, wait_s)
+                time.sleep(wait_s)
                 continue
-            if past_sig.timeframe != signal.timeframe:
+            if resp.status_code in (502, 503, 504):
+                time.sleep(0.5 * (2 ** attempt))
+                continue
+            return resp
+
+        self._pace(chat_id)
+        return self._http().post(url, timeout=timeout, **kwargs)
+
+    def _is_duplicate(self, signal: SignalEvent) -> bool:
+        cutoff = datetime.now(timezone.utc) - _DEDUP_WINDOW
+        
+        key = (signal.pair, signal.direction, signal.timeframe)
+        hist = self._sent_history.get(key)
+        if not hist:
+            return False
+
+        # Clean old history (mostly ordered; the loop below re-checks the cutoff)
+        while hist and hist[0][0] <= cutoff:
+            hist.popleft()
+        if not hist:
+            del self._sent_history[key]
+            return False
+
+        for generated_at, entry in hist:
+            if generated_at <= cutoff:
                 continue
-                
             # Check entry price proximity
-            if abs(past_sig.entry - signal.entry) / past_sig.entry < PRICE_TOLERANCE_PERCENT:
+            if abs(entry - signal.entry) / entry < PRICE_TOLERANCE_PERCENT:
                 # It's effectively the same signal
                 return True
                 
@@ -57,6 +202,7 @@ class TelegramNotifier:
         chat_id: Optional[Union[int, str]] = None,
         explain: Optional[Dict[str, Any]] = None,
         mode: str = "all",
+        retry_after_max_s: Optional[float] = None,
     ) -> bool:
         """
         Smart send: checks dedup before sending.
@@ -79,20 +225,10 @@ class TelegramNotifier:
             dir_mn = "ӨСӨХ (BUY)" if signal.direction == "BUY" else "УНАХ (SELL)"
 
             # Translate typical reasons if possible
-            reasons_formatted = []
-            for r in signal.reasons:
-                if "Uptrend" in r:
-                    r = r.replace("Uptrend", "Өсөх тренд")
-                if "Downtrend" in r:
-                    r = r.replace("Downtrend", "Унах тренд")
-                if "Align" in r:
-                    r = "D1 болон H4 тренд баталгаажсан"
-                reasons_formatted.append(f"✅ {r}")
-
-            reasons_str = "\n".join(reasons_formatted)
+            reasons_str = "\n".join([_legacy_reason_line(r) for r in signal.reasons])
 
             tz_h = int(getattr(signal, "tz_offset_hours", 0) or 0)
-            local_dt = signal.generated_at + timedelta(hours=tz_h)
+            local_dt = signal.generated_at + _tz_offset(tz_h)
             local_stamp = local_dt.strftime("%Y-%m-%d %H:%M")
 
             user_label = str(getattr(signal, "user_label", "") or getattr(signal, "user_id", "") or "").strip()
@@ -123,12 +259,13 @@ class TelegramNotifier:
 
         success = False
         if chart_img:
-            success = self.send_photo(caption, chart_img, chat_id=chat_id)
+            success = self.send_photo(caption, chart_img, chat_id=chat_id, retry_after_max_s=retry_after_max_s)
         else:
-            success = self.send_message(caption, chat_id=chat_id)
+            success = self.send_message(caption, chat_id=chat_id, retry_after_max_s=retry_after_max_s)
             
         if success:
-            self._sent_history.append(signal)
+            key = (signal.pair, signal.direction, signal.timeframe)
+            self._sent_history.setdefault(key, deque()).append((_as_utc(signal.generated_at), signal.entry))
             
         return success
 
@@ -137,7 +274,8 @@ class TelegramNotifier:
         text: str,
         chat_id: Optional[Union[int, str]] = None,
         reply_markup: Optional[Dict[str, Any]] = None,
-        parse_mode: str = "HTML"
+        parse_mode: str = "HTML",
+        retry_after_max_s: Optional[float] = None,
     ) -> bool:
         """
         Send a text message to Telegram.
@@ -160,9 +298,10 @@ class TelegramNotifier:
             payload["reply_markup"] = json.dumps(reply_markup)
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                resp = client.post(f"{self.api_url}/sendMessage", data=payload)
-                resp.raise_for_status()
+            resp = self._post(
+                "sendMessage", target_chat_id, data=payload, timeout=10.0, retry_after_max_s=retry_after_max_s
+            )
+            resp.raise_for_status()
             return True
         except httpx.HTTPStatusError as e:
             # Do not log the exception string (it contains full URL incl. bot token).
@@ -185,7 +324,8 @@ class TelegramNotifier:
         image_bytes: io.BytesIO,
         chat_id: Optional[Union[int, str]] = None,
         filename: str = "chart.png",
-        parse_mode: str = "HTML"
+        parse_mode: str = "HTML",
+        retry_after_max_s: Optional[float] = None,
     ) -> bool:
         """
         Send a photo (chart) to Telegram.
@@ -199,14 +339,11 @@ class TelegramNotifier:
             logger.warning("No chat_id provided for Telegram photo.")
             return False
 
-        # Ensure we are at the start of the bytes
+        # Pass the buffer itself: httpx streams it into the multipart body in
+        # chunks (no bytes copy of the chart), rewinds it on every render so
+        # retries resend the whole image, and sizes it for Content-Length.
         image_bytes.seek(0)
-        
-        files = {"photo": (filename, image_bytes.read())} # httpx needs bytes not IO
-        
-        # Reset again just in case replays happen, though read() consumes.
-        # Actually httpx handles read() but let's be safe if passing stream, 
-        # but here we pass bytes content directly.
+        files = {"photo": (filename, image_bytes, "image/png")}
         
         data: Dict[str, Any] = {
             "chat_id": target_chat_id,
@@ -215,9 +352,15 @@ class TelegramNotifier:
         }
 
         try:
-            with httpx.Client(timeout=20.0) as client:
-                resp = client.post(f"{self.api_url}/sendPhoto", data=data, files=files)
-                resp.raise_for_status()
+            resp = self._post(
+                "sendPhoto",
+                target_chat_id,
+                data=data,
+                files=files,
+                timeout=20.0,
+                retry_after_max_s=retry_after_max_s,
+            )
+            resp.raise_for_status()
             return True
         except httpx.HTTPStatusError as e:
             status = getattr(getattr(e, "response", None), "status_code", None)
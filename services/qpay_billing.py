@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import threading
+import time
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import httpx
 
+from core import fast_json
+
 
 class QPayError(RuntimeError):
     pass
@@ -20,28 +24,37 @@ class QPayInvoice:
     raw: dict[str, Any]
 
 
+# Checked in order; the first non-blank value wins.
+_PAYMENT_URL_KEYS = ("payment_url", "checkout_url", "invoice_url", "url")
+_INVOICE_ID_KEYS = ("invoice_id", "id", "invoiceId", "invoice", "invoice_no")
+
+
 def _pick_payment_url(payload: dict[str, Any]) -> Optional[str]:
     # Common shapes we might see from QPay-style APIs.
-    for key in ("payment_url", "checkout_url", "invoice_url", "url"):
-        v = payload.get(key)
-        if isinstance(v, str) and v.strip():
-            return v.strip()
-
-    urls = payload.get("urls")
+    # (str.strip() returns the string itself when there is nothing to trim,
+    # so stripping once up front costs no allocation in the usual case.)
+    get = payload.get
+    for key in _PAYMENT_URL_KEYS:
+        v = get(key)
+        if isinstance(v, str) and (v := v.strip()):
+            return v
+
+    urls = get("urls")
     if isinstance(urls, list):
         for item in urls:
             if not isinstance(item, dict):
                 continue
             link = item.get("link") or item.get("url")
-            if isinstance(link, str) and link.strip():
-                return link.strip()
+            if isinstance(link, str) and (link := link.strip()):
+                return link
 
     return None
 
 
 def _extract_invoice_id(payload: dict[str, Any]) -> Optional[str]:
-    for key in ("invoice_id", "id", "invoiceId", "invoice", "invoice_no"):
-        v = payload.get(key)
+    get = payload.get
+    for key in _INVOICE_ID_KEYS:
+        v = get(key)
         if v is None:
             continue
         s = str(v).strip()
@@ -50,6 +63,73 @@ def _extract_invoice_id(payload: dict[str, Any]) -> Optional[str]:
     return None
 
 
+# Shared keep-alive client: invoices reuse the connection (and a cached token,
+# see _get_token) instead of a fresh TLS handshake + auth POST per call.
+_HTTP: Optional[httpx.Client] = None
+_HTTP_LOCK = threading.Lock()
+
+# (auth_url, username, sha256(password)) -> (access_token, monotonic expiry)
+_TOKEN_CACHE: dict[tuple[str, str, str], tuple[str, float]] = {}
+_TOKEN_LOCK = threading.Lock()
+_TOKEN_REFRESH_AHEAD_S = 60.0
+_TOKEN_DEFAULT_TTL_S = 3600.0
+
+
+def _http_client() -> httpx.Client:
+    global _HTTP
+    with _HTTP_LOCK:
+        if _HTTP is None or _HTTP.is_closed:
+            _HTTP = httpx.Client(timeout=20.0)
+        return _HTTP
+
+
+def _token_key(auth_url: str, username: str, password: str) -> tuple[str, str, str]:
+    return (auth_url, username, hashlib.sha256(password.encode("utf-8")).hexdigest())
+
+
+def _get_token(
+    client: httpx.Client,
+    auth_url: str,
+    username: str,
+    password: str,
+    *,
+    force_refresh: bool = False,
+) -> str:
+    """Return a cached access token, re-authenticating 60s before it expires.
+
+    The lock is held across the auth POST so concurrent callers wait for one
+    refresh instead of stampeding the token endpoint.
+    """
+    key = _token_key(auth_url, username, password)
+    with _TOKEN_LOCK:
+        cached = _TOKEN_CACHE.get(key)
+        if cached and not force_refresh and time.monotonic() < cached[1] - _TOKEN_REFRESH_AHEAD_S:
+            return cached[0]
+
+        auth_res = client.post(auth_url, auth=(username, password))
+        if auth_res.status_code >= 400:
+            raise QPayError(f"Auth failed {auth_res.status_code}: {auth_res.text}")
+
+        try:
+            auth_payload = fast_json.loads(auth_res.content)
+        except Exception as e:
+            raise QPayError(f"Auth JSON parse failed: {e}")
+
+        access_token = str(auth_payload.get("access_token") or "").strip()
+        if not access_token:
+            # Some implementations return token under different keys.
+            access_token = str(auth_payload.get("token") or "").strip()
+        if not access_token:
+            raise QPayError(f"Auth response missing access_token: {auth_payload}")
+
+        try:
+            ttl = float(auth_payload.get("expires_in") or _TOKEN_DEFAULT_TTL_S)
+        except (TypeError, ValueError):
+            ttl = _TOKEN_DEFAULT_TTL_S
+        _TOKEN_CACHE[key] = (access_token, time.monotonic() + ttl)
+        return access_token
+
+
 def create_invoice(
     *,
     base_url: str,
@@ -84,25 +164,6 @@ def create_invoice(
     auth_url = (auth_url or f"{base}/v2/auth/token").strip()
     invoice_url = (invoice_url or f"{base}/v2/invoice").strip()
 
-    # 1) Get access token
-    with httpx.Client(timeout=20.0) as client:
-        auth_res = client.post(auth_url, auth=(username, password))
-
-    if auth_res.status_code >= 400:
-        raise QPayError(f"Auth failed {auth_res.status_code}: {auth_res.text}")
-
-    try:
-        auth_payload = auth_res.json()
-    except Exception as e:
-        raise QPayError(f"Auth JSON parse failed: {e}")
-
-    access_token = str(auth_payload.get("access_token") or "").strip()
-    if not access_token:
-        # Some implementations return token under different keys.
-        access_token = str(auth_payload.get("token") or "").strip()
-    if not access_token:
-        raise QPayError(f"Auth response missing access_token: {auth_payload}")
-
     payload: dict[str, Any] = {
         "invoice_code": invoice_code,
         "sender_invoice_no": reference_id,
@@ -115,20 +176,25 @@ def create_invoice(
     if extra_payload:
         payload.update(extra_payload)
 
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
-
-    with httpx.Client(timeout=20.0) as client:
-        inv_res = client.post(invoice_url, headers=headers, content=json.dumps(payload))
+    body = fast_json.dumps_bytes(payload)
+    client = _http_client()
+    for force_refresh in (False, True):
+        access_token = _get_token(client, auth_url, username, password, force_refresh=force_refresh)
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        inv_res = client.post(invoice_url, headers=headers, content=body)
+        if inv_res.status_code != 401:
+            break
+        # Token revoked/expired early on QPay's side: re-auth once.
 
     if inv_res.status_code >= 400:
         raise QPayError(f"Invoice create failed {inv_res.status_code}: {inv_res.text}")
 
     try:
-        inv_payload = inv_res.json()
+        inv_payload = fast_json.loads(inv_res.content)
     except Exception as e:
         raise QPayError(f"Invoice JSON parse failed: {e}")
 
@@ -11,6 +11,20 @@ This file remains only for backward-compatible imports.
 
 from __future__ import annotations
 
-from scanner_service import scanner_service, ScannerService
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # resolve the re-exports for linters/IDEs without the eager import
+    from scanner_service import ScannerService, scanner_service
 
 __all__ = ["scanner_service", "ScannerService"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved on first access (PEP 562) so importing this shim does not pull
+    # in the scanner and its provider/charting stack.
+    if name in __all__:
+        import scanner_service as _impl
+
+        globals().update(scanner_service=_impl.scanner_service, ScannerService=_impl.ScannerService)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
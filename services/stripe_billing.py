@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import hmac
-import json
+import re
 import time
+from functools import lru_cache
 from hashlib import sha256
 from typing import Any, Optional
+from urllib.parse import urlencode
 
 import httpx
 
+from core import fast_json
+
 
 class StripeError(RuntimeError):
     pass
@@ -28,25 +32,27 @@ def create_checkout_session(
     if not price_id:
         raise StripeError("price_id missing")
 
-    # Stripe expects application/x-www-form-urlencoded.
-    data: dict[str, Any] = {
-        "mode": "subscription",
-        "success_url": success_url,
-        "cancel_url": cancel_url,
-        "client_reference_id": client_reference_id,
-        "line_items[0][price]": price_id,
-        "line_items[0][quantity]": 1,
-    }
+    # Stripe expects application/x-www-form-urlencoded; fields go out in this
+    # order and are encoded once below.
+    data: list[tuple[str, str]] = [
+        ("mode", "subscription"),
+        ("success_url", success_url),
+        ("cancel_url", cancel_url),
+        ("client_reference_id", client_reference_id),
+        ("line_items[0][price]", price_id),
+        ("line_items[0][quantity]", "1"),
+    ]
 
     if customer_email:
-        data["customer_email"] = customer_email
+        data.append(("customer_email", customer_email))
 
     for k, v in (metadata or {}).items():
         if k and v is not None:
-            data[f"metadata[{k}]"] = str(v)
+            sv = str(v)
+            data.append((f"metadata[{k}]", sv))
             # Also attach to the underlying subscription so we can handle
             # customer.subscription.* webhooks without a DB lookup.
-            data[f"subscription_data[metadata][{k}]"] = str(v)
+            data.append((f"subscription_data[metadata][{k}]", sv))
 
     headers = {
         "Authorization": f"Bearer {stripe_secret_key}",
@@ -54,7 +60,11 @@ def create_checkout_session(
     }
 
     with httpx.Client(timeout=20.0) as client:
-        r = client.post("https://api.stripe.com/v1/checkout/sessions", data=data, headers=headers)
+        r = client.post(
+            "https://api.stripe.com/v1/checkout/sessions",
+            content=urlencode(data).encode("ascii"),
+            headers=headers,
+        )
 
     if r.status_code >= 400:
         try:
@@ -66,26 +76,26 @@ def create_checkout_session(
     return r.json()
 
 
-def _parse_stripe_sig(sig_header: str) -> tuple[Optional[int], list[str]]:
+# One "k=v" item of the Stripe-Signature header; only t and v1 are used.
+_SIG_ITEM_RE = re.compile(r"(?:^|,)\s*(t|v1)\s*=\s*([^,]*?)\s*(?=,|$)")
+
+
+@lru_cache(maxsize=256)
+def _parse_stripe_sig(sig_header: str) -> tuple[Optional[int], tuple[str, ...]]:
+    # Cached: Stripe retries re-send the identical header.
     if not sig_header:
-        return None, []
-    parts = [p.strip() for p in sig_header.split(",") if p.strip()]
+        return None, ()
     ts: Optional[int] = None
     v1: list[str] = []
-    for p in parts:
-        if "=" not in p:
-            continue
-        k, v = p.split("=", 1)
-        k = k.strip()
-        v = v.strip()
+    for k, v in _SIG_ITEM_RE.findall(sig_header):
         if k == "t":
             try:
                 ts = int(v)
             except Exception:
                 ts = None
-        elif k == "v1":
+        else:
             v1.append(v)
-    return ts, v1
+    return ts, tuple(v1)
 
 
 def verify_webhook_signature(
@@ -106,18 +116,25 @@ def verify_webhook_signature(
     if abs(now - int(ts)) > int(tolerance_s):
         return False
 
-    signed_payload = f"{ts}.".encode("utf-8") + payload_bytes
-    expected = hmac.new(webhook_secret.encode("utf-8"), signed_payload, sha256).hexdigest()
+    # Feed "<ts>." and the body separately (no concatenated copy of the body)
+    # and compare raw 32-byte digests rather than their hex forms.
+    mac = hmac.new(webhook_secret.encode("utf-8"), f"{ts}.".encode("utf-8"), sha256)
+    mac.update(payload_bytes)
+    expected = mac.digest()
 
     for s in sigs:
-        if hmac.compare_digest(expected, s):
+        try:
+            sig = bytes.fromhex(s)
+        except ValueError:
+            continue
+        if hmac.compare_digest(expected, sig):
             return True
     return False
 
 
 def parse_event(payload_bytes: bytes) -> dict[str, Any]:
     try:
-        obj = json.loads(payload_bytes.decode("utf-8"))
+        obj = fast_json.loads(payload_bytes)
     except Exception as e:
         raise StripeError(f"invalid JSON: {e}")
     if not isinstance(obj, dict):
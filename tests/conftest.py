@@ -1,10 +1,33 @@
 from __future__ import annotations
 
 import os
+import shutil
 import sys
+import tempfile
 
 
 # Ensure repo root is importable regardless of where pytest is invoked from.
 _REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if _REPO_ROOT not in sys.path:
     sys.path.insert(0, _REPO_ROOT)
+
+_ISOLATED_DIR: str | None = None
+
+
+def pytest_configure(config) -> None:
+    """Give each pytest process (each xdist worker) its own user DB and state dir.
+
+    Runs before test modules are imported, so module-level DB_PATH reads
+    (user_db, signals_tracker) pick it up. Without this, parallel workers share
+    and race on ./user_profiles.db and ./state/*.
+    """
+    global _ISOLATED_DIR
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    _ISOLATED_DIR = tempfile.mkdtemp(prefix=f"jkm-tests-{worker}-")
+    os.environ["USER_DB_PATH"] = os.path.join(_ISOLATED_DIR, "user_profiles.db")
+    os.environ["STATE_DIR"] = os.path.join(_ISOLATED_DIR, "state")
+
+
+def pytest_unconfigure(config) -> None:
+    if _ISOLATED_DIR:
+        shutil.rmtree(_ISOLATED_DIR, ignore_errors=True)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+
+def _candles(n: int = 30):
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    out = []
+    p = 1.1
+    for i in range(n):
+        c = p + (0.001 if i % 3 else -0.0015)
+        out.append({"time": t0 + timedelta(minutes=5 * i), "open": p, "high": max(p, c) + 0.0005, "low": min(p, c) - 0.0005, "close": c})
+        p = c
+    return out
+
+
+def test_chart_pil_backend_renders_png(monkeypatch):
+    pytest.importorskip("PIL")
+    import config
+    from services.chart_generator import generate_chart_image
+
+    monkeypatch.setattr(config, "CHART_BACKEND", "pil")
+    buf = generate_chart_image(_candles(), "EURUSD", "M5", tz_offset_hours=8)
+    data = buf.getvalue()
+    assert data.startswith(b"\x89PNG")
+
+    from PIL import Image
+
+    img = Image.open(buf)
+    assert img.size == (1500, 750)
+
+
+def test_chart_empty_candles_returns_empty_buffer(monkeypatch):
+    import config
+    from services.chart_generator import generate_chart_image
+
+    monkeypatch.setattr(config, "CHART_BACKEND", "pil")
+    assert generate_chart_image([], "EURUSD", "M5").getvalue() == b""
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import httpx
+
+
+def test_dashboard_client_reuses_pooled_http_client(monkeypatch):
+    monkeypatch.setenv("DASHBOARD_USER_DATA_URL", "https://dash.example/app/")
+    monkeypatch.setenv("DASHBOARD_INTERNAL_API_KEY", "k1")
+
+    from services import dashboard_user_data_client as mod
+
+    a = mod.DashboardUserDataClient.from_env()
+    b = mod.DashboardUserDataClient.from_env()
+    assert a is not None and b is not None
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((str(request.url), request.headers.get("x-internal-api-key")))
+        return httpx.Response(200, json={"strategies": [{"strategy_id": "s1"}]})
+
+    pooled = httpx.Client(
+        base_url=a.base_url,
+        headers=a._headers(),
+        transport=httpx.MockTransport(handler),
+    )
+    monkeypatch.setitem(mod._HTTP_CLIENTS, a._cache_key(), pooled)
+
+    assert a._client() is b._client() is pooled
+    assert a.get_strategies("u1") == [{"strategy_id": "s1"}]
+    assert b.get_strategies("u2") == [{"strategy_id": "s1"}]
+    assert seen == [
+        ("https://dash.example/app/api/internal/user-data/strategies/u1", "k1"),
+        ("https://dash.example/app/api/internal/user-data/strategies/u2", "k1"),
+    ]
+
+    a.close()
+    assert pooled.is_closed
+    assert a._cache_key() not in mod._HTTP_CLIENTS
@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from scripts import dedupe_signals as mod
+
+
+def _line(symbol, entry, **extra):
+    rec = {"symbol": symbol, "tf": "M15", "direction": "BUY", "entry": entry, "sl": 1.0, "tp": 2.0}
+    rec.update(extra)
+    return json.dumps(rec).encode()
+
+
+def _fixture(ending: bytes) -> bytes:
+    lines = [
+        _line("EURUSD", 1.1),
+        _line("EURUSD", 1.1, note="dup of line 1"),
+        b"",
+        b"not json",
+        _line("GBPUSD", 1.3),
+        _line("EURUSD", 1.100000001),  # rounds to the same key
+        _line("USDJPY", 150.0),
+        _line("GBPUSD", 1.3),
+    ]
+    # Last line: CRLF-terminated, or no trailing newline at all.
+    return b"\n".join(lines[:-1]) + b"\n" + lines[-1] + ending
+
+
+EXPECTED = [
+    _line("EURUSD", 1.1),
+    _line("GBPUSD", 1.3),
+    _line("USDJPY", 150.0),
+]
+
+
+@pytest.mark.parametrize("ending", [b"\r\n", b""], ids=["crlf-last-line", "no-trailing-newline"])
+def test_dedupe_modes_agree(tmp_path, ending):
+    src = tmp_path / "signals.jsonl"
+    src.write_bytes(_fixture(ending))
+
+    outputs = {}
+    for mode, kw in {"exact": {}, "hashed": {"hashed": True}, "sharded": {"shards": 3}}.items():
+        out = tmp_path / f"{mode}.jsonl"
+        result = mod.dedupe_signals(str(src), str(out), **kw)
+        assert result == {"kept": 3, "duplicates": 3}, mode
+        outputs[mode] = out.read_bytes()
+
+    assert outputs["exact"] == b"".join(line + b"\n" for line in EXPECTED)
+    assert outputs["hashed"] == outputs["exact"] == outputs["sharded"]
+
+
+def test_dedupe_empty_file(tmp_path):
+    src = tmp_path / "signals.jsonl"
+    src.write_bytes(b"")
+    for kw in ({}, {"hashed": True}, {"shards": 2}):
+        out = tmp_path / "out.jsonl"
+        assert mod.dedupe_signals(str(src), str(out), **kw) == {"kept": 0, "duplicates": 0}
+        assert out.read_bytes() == b""
+
+
+def test_main_dedupes_both_files_in_place(tmp_path, capsys):
+    (tmp_path / "signals.jsonl").write_bytes(_fixture(b"\r\n"))
+    (tmp_path / "signals_v1.jsonl").write_bytes(_fixture(b""))
+
+    mod.main(["--shards", "2", "--state-dir", str(tmp_path)])
+
+    expected = b"".join(line + b"\n" for line in EXPECTED)
+    assert (tmp_path / "signals.jsonl").read_bytes() == expected
+    assert (tmp_path / "signals_v1.jsonl").read_bytes() == expected
+    assert not list(tmp_path.glob("*.deduped"))
+    assert "kept=3, removed=3" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("argv", [["--shards"], ["--shards", "x"]])
+def test_main_rejects_bad_shards_argument(tmp_path, argv):
+    with pytest.raises(SystemExit) as exc:
+        mod.main([*argv, "--state-dir", str(tmp_path)])
+    assert exc.value.code == 2
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+
+class _FakeSMTP:
+    instances: list["_FakeSMTP"] = []
+
+    def __init__(self, host, port, timeout=None):
+        self.sent = []
+        self.closed = False
+        self.logins = 0
+        _FakeSMTP.instances.append(self)
+
+    def ehlo(self):
+        return (250, b"ok")
+
+    def starttls(self):
+        return (220, b"ok")
+
+    def login(self, username, password):
+        self.logins += 1
+
+    def noop(self):
+        return (250, b"ok") if not self.closed else (421, b"closed")
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        self.sent.append(to_addrs)
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+def test_send_email_reuses_pooled_connection(monkeypatch):
+    from services import email_service as mod
+
+    monkeypatch.setenv("SMTP_USERNAME", "bot@example.com")
+    monkeypatch.setenv("SMTP_PASSWORD", "pw")
+    monkeypatch.setattr(mod.smtplib, "SMTP", _FakeSMTP)
+    monkeypatch.setattr(mod, "_SMTP_POOLS", {})
+    _FakeSMTP.instances = []
+
+    mod.send_email(to_email="a@example.com", subject="s", text_body="b", sync=True)
+    mod.send_email(to_email="b@example.com", subject="s", text_body="b", sync=True)
+
+    assert len(_FakeSMTP.instances) == 1
+    conn = _FakeSMTP.instances[0]
+    assert conn.logins == 1
+    assert conn.sent == [["a@example.com"], ["b@example.com"]]
+
+    # A connection the server dropped is replaced on the next checkout.
+    conn.closed = True
+    mod.send_email(to_email="c@example.com", subject="s", text_body="b", sync=True)
+    assert len(_FakeSMTP.instances) == 2
+    assert _FakeSMTP.instances[1].sent == [["c@example.com"]]
+
+
+def test_send_email_queues_for_background_sender_by_default(monkeypatch):
+    from services import email_service as mod
+
+    monkeypatch.setenv("SMTP_USERNAME", "bot@example.com")
+    monkeypatch.setenv("SMTP_PASSWORD", "pw")
+    monkeypatch.setattr(mod.smtplib, "SMTP", _FakeSMTP)
+    monkeypatch.setattr(mod, "_SMTP_POOLS", {})
+    _FakeSMTP.instances = []
+
+    for addr in ("a@example.com", "b@example.com", "c@example.com"):
+        mod.send_email(to_email=addr, subject="s", text_body="b")
+    mod._MAIL_QUEUE.join()
+
+    assert len(_FakeSMTP.instances) == 1
+    assert _FakeSMTP.instances[0].sent == [["a@example.com"], ["b@example.com"], ["c@example.com"]]
@@ -199,3 +199,143 @@ def test_rr_below_min_na_safe_when_missing() -> None:
     assert "width=NA%" in s
     assert "SL_dist=NA" in s
     assert "TP_dist=NA" in s
+
+
+def test_scanner_emit_explain_attaches_to_result_debug(monkeypatch) -> None:
+    from types import SimpleNamespace
+
+    import scanner_service
+    from scanner_service import _emit_explain
+
+    sunk = []
+    monkeypatch.setattr(scanner_service, "_submit_explain_sinks", lambda payload, **kw: sunk.append(payload))
+
+    dbg = {"buy_score": 0.45, "min_score": 0.60}
+    res = SimpleNamespace(debug=dbg)
+    payload, new_dbg = _emit_explain(
+        kind="NONE",
+        symbol="EURUSD",
+        tf="M15",
+        scan_id="scan_emit",
+        strategy_id="s1",
+        reason="SCORE_BELOW_MIN",
+        debug=dbg,
+        explain_debug=dbg,
+        result=res,
+    )
+    _assert_required(payload)
+    assert res.debug is new_dbg
+    assert new_dbg["explain"]["reason"] == "SCORE_BELOW_MIN"
+    # Source debug is never mutated.
+    assert "explain" not in dbg
+
+    payload_ok, _ = _emit_explain(kind="OK", symbol="EURUSD", tf="M15", scan_id="scan_emit", strategy_id=None)
+    _assert_required(payload_ok)
+    assert payload_ok["strategy_id"] == "NA"
+    assert sunk == [payload, payload_ok]
+
+
+def test_scanner_emit_explain_skips_none_sinks_without_consumers(monkeypatch) -> None:
+    from types import SimpleNamespace
+
+    import scanner_service
+    from scanner_service import _emit_explain
+
+    submitted = []
+    monkeypatch.setattr(scanner_service, "_submit_explain_sinks", lambda payload, **kw: submitted.append(payload))
+
+    dbg = {"buy_score": 0.45}
+    res = SimpleNamespace(debug=dbg)
+    payload, new_dbg = _emit_explain(
+        kind="NONE",
+        symbol="EURUSD",
+        tf="M15",
+        scan_id="scan_skip",
+        strategy_id="s1",
+        reason="NO_HITS",
+        debug=dbg,
+        explain_debug=dbg,
+        result=res,
+        consumers_on=False,
+    )
+    # Still attached to result.debug for downstream readers, just not queued.
+    _assert_required(payload)
+    assert res.debug is new_dbg and new_dbg["explain"] == payload
+    assert new_dbg["buy_score"] == 0.45
+    assert submitted == []
+
+    # Nothing to attach to and nothing consuming: not built at all.
+    assert _emit_explain(
+        kind="NONE", symbol="EURUSD", tf="M15", scan_id="scan_skip", strategy_id="s1",
+        reason="NO_HITS", debug=dbg, consumers_on=False,
+    ) == (None, dbg)
+    assert submitted == []
+
+    # PAIR_OK payloads feed persistence/notify, so they are always built.
+    payload_ok, _ = _emit_explain(
+        kind="OK", symbol="EURUSD", tf="M15", scan_id="scan_skip", strategy_id="s1", consumers_on=False
+    )
+    _assert_required(payload_ok)
+    assert submitted == [payload_ok]
+
+
+def test_scanner_emit_explain_overlay_reaches_builder_and_attached_sink_debug(monkeypatch) -> None:
+    from types import SimpleNamespace
+
+    import scanner_service
+    from scanner_service import _emit_explain
+
+    sink_debugs = []
+    monkeypatch.setattr(
+        scanner_service, "_submit_explain_sinks", lambda payload, debug=None, **kw: sink_debugs.append(debug)
+    )
+
+    dbg = {"buy_score": 0.45, "candidates": [{"strategy_id": "s1"}]}
+    res = SimpleNamespace(debug=dbg)
+    payload, new_dbg = _emit_explain(
+        kind="NONE",
+        symbol="EURUSD",
+        tf="M15",
+        scan_id="scan_overlay",
+        strategy_id="s1",
+        reason="LOW_SCORE",
+        debug=dbg,
+        explain_debug=dbg,
+        overlay={"min_score": 0.6, "direction": "BUY"},
+        result=res,
+    )
+    _assert_required(payload)
+    assert "min_score" not in dbg and "min_score" not in new_dbg
+    (sink_dbg,) = sink_debugs
+    # Sinks see the overlay over the debug dict *after* explain was attached.
+    assert sink_dbg["min_score"] == 0.6 and sink_dbg["direction"] == "BUY"
+    assert sink_dbg["explain"] == payload and sink_dbg["candidates"] == dbg["candidates"]
+
+
+def test_scanner_explain_sinks_run_off_thread_and_drain(monkeypatch) -> None:
+    import threading
+
+    import scanner_service
+
+    seen = []
+
+    def _fake_write(payload, candidates, failover_used):
+        seen.append((payload["scan_id"], candidates, failover_used, threading.current_thread().name))
+
+    monkeypatch.setattr(scanner_service, "_write_explain_sinks", _fake_write)
+    scanner_service._submit_explain_sinks(
+        {"scan_id": "scan_sink"}, debug={"candidates": 3, "other": "x"}, failover_used=True
+    )
+    scanner_service._drain_explain_sinks()
+    assert seen == [("scan_sink", 3, True, "explain-sinks")]
+
+
+def test_scanner_setup_direction_none_keeps_fallbacks() -> None:
+    from scanner_service import _setup_direction_str
+
+    assert _setup_direction_str("SELL") == "SELL"
+    # None must stay falsy (not the string "None") so `or selected["direction"]`
+    # fallbacks in the scan loop still take effect.
+    setup_dir = _setup_direction_str(None)
+    assert setup_dir == ""
+    assert (setup_dir or str({"direction": "BUY"}.get("direction") or "NA")) == "BUY"
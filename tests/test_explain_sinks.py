@@ -0,0 +1,26 @@
+import json
+import time
+
+
+def test_stop_drains_queued_explain_sink_writes(tmp_path, monkeypatch):
+    import config
+    import scanner_service as mod
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("EXPLAIN_AUDIT", "1")
+    monkeypatch.setattr(config, "METRICS_EVENTS_ENABLED", False, raising=False)
+
+    real_audit = mod._maybe_audit_explain
+
+    def slow_audit(payload):
+        time.sleep(0.2)
+        real_audit(payload)
+
+    monkeypatch.setattr(mod, "_maybe_audit_explain", slow_audit)
+
+    service = mod.ScannerService()
+    mod._submit_explain_sinks({"symbol": "EURUSD", "kind": "OK", "scan_id": "s1"})
+    service.stop()
+
+    lines = (tmp_path / "logs" / "explain_events.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["scan_id"] for line in lines] == ["s1"]
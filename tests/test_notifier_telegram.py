@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import io
+
+import httpx
+
+
+def _notifier(monkeypatch, handler):
+    from services import notifier_telegram as mod
+
+    sleeps = []
+    monkeypatch.setattr(mod.time, "sleep", lambda s: sleeps.append(s))
+    n = mod.TelegramNotifier(token="T", default_chat_id=1)
+    n._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return n, sleeps
+
+
+def test_send_message_retries_429_with_retry_after(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            return httpx.Response(429, json={"ok": False, "parameters": {"retry_after": 3}})
+        return httpx.Response(200, json={"ok": True})
+
+    n, sleeps = _notifier(monkeypatch, handler)
+    assert n.send_message("hi", chat_id=42) is True
+    assert calls == ["/botT/sendMessage", "/botT/sendMessage"]
+    assert 3.0 in sleeps
+
+
+def test_send_message_gives_up_on_retry_after_above_caller_cap(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(429, json={"ok": False, "parameters": {"retry_after": 10}})
+
+    n, sleeps = _notifier(monkeypatch, handler)
+    assert n.send_message("hi", chat_id=42, retry_after_max_s=5.0) is False
+    assert len(calls) == 1
+    assert 10.0 not in sleeps
+
+
+def test_send_message_paces_per_chat(monkeypatch):
+    n, sleeps = _notifier(monkeypatch, lambda r: httpx.Response(200, json={"ok": True}))
+
+    assert n.send_message("a", chat_id=1) is True
+    assert n.send_message("b", chat_id=1) is True
+    # Second send to the same chat waits for the per-chat slot (~1s).
+    assert sleeps and sleeps[-1] > 0.5
+
+
+def test_send_photo_streams_buffer_and_resends_on_retry(monkeypatch):
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        bodies.append((body, request.headers.get("content-length")))
+        if len(bodies) == 1:
+            return httpx.Response(429, json={"ok": False, "parameters": {"retry_after": 1}})
+        return httpx.Response(200, json={"ok": True})
+
+    n, _ = _notifier(monkeypatch, handler)
+    png = b"\x89PNG" + b"x" * 100_000
+    assert n.send_photo("cap", io.BytesIO(png), chat_id=7) is True
+    assert len(bodies) == 2
+    for body, length in bodies:
+        assert png in body
+        assert length == str(len(body))
+
+
+def test_send_signal_dedupes_aware_and_naive_timestamps(monkeypatch):
+    from datetime import datetime, timezone
+
+    from services.models import SignalEvent
+
+    n, _ = _notifier(monkeypatch, lambda r: httpx.Response(200, json={"ok": True}))
+
+    def sig(generated_at=None):
+        kw = dict(pair="EURUSD", direction="BUY", timeframe="M15", entry=1.2345, sl=1.23, tp=1.245, rr=2.0)
+        if generated_at is not None:
+            kw["generated_at"] = generated_at
+        # Same construction path as the scanner (default generated_at is tz-aware).
+        return SignalEvent.model_construct(**kw)
+
+    assert n.send_signal(sig()) is True
+    assert n.send_signal(sig()) is False
+    naive_now = datetime.now(timezone.utc).replace(tzinfo=None)
+    assert n.send_signal(sig(naive_now)) is False
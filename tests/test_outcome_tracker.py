@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from core.outcome_tracker import scan_candles_since
+
+
+def test_scan_candles_since_counts_and_extremes_across_time_formats() -> None:
+    t0 = 1_730_000_000
+    candles = [
+        {"timestamp": t0 - 60, "high": 9.0, "low": 0.1},  # before the signal: ignored
+        {"timestamp": t0 + 60, "high": 1.2, "low": 1.0},
+        {"time": datetime.fromtimestamp(t0 + 120, tz=timezone.utc), "high": 1.5, "low": 1.1},
+        {"timestamp": datetime.fromtimestamp(t0 + 180, tz=timezone.utc).isoformat().replace("+00:00", "Z"), "high": 1.3, "low": 0.9},
+        {"timestamp": "not-a-date", "high": 99.0, "low": 0.0},  # unparseable: treated as ts 0
+    ]
+
+    assert scan_candles_since(candles, t0) == (3, 1.5, 0.9)
+    assert scan_candles_since(candles, t0 + 1000) == (0, 0.0, float("inf"))
@@ -126,3 +126,29 @@ def test_rollback_missing_backup_safe_fail(tmp_path) -> None:
 
     # No overwrite
     assert open(strategies_path, "r", encoding="utf-8").read() == original
+
+
+def test_rollback_rejects_corrupt_backup_without_writing(tmp_path) -> None:
+    strategies_path = str(tmp_path / "strategies.json")
+    audit_path = str(tmp_path / "patch_audit.jsonl")
+    _write_strategies(strategies_path, min_score=1.0)
+
+    original = open(strategies_path, "r", encoding="utf-8").read()
+
+    backup_path = tmp_path / "truncated.bak"
+    backup_path.write_text('{"strategies": [', encoding="utf-8")
+    entry = {"ts": 123, "patch_id": "cafebabe", "backup_path": str(backup_path)}
+    with open(audit_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+    with pytest.raises(ValueError, match="rollback_validation_failed"):
+        rollback_patch(
+            patch_id="cafebabe",
+            audit_path=audit_path,
+            strategies_path=strategies_path,
+            dry_run=False,
+            validate=True,
+            deep_validate=False,
+        )
+
+    assert open(strategies_path, "r", encoding="utf-8").read() == original
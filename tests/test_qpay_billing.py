@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import httpx
+
+
+def test_create_invoice_caches_token_and_reauths_on_401(monkeypatch):
+    from services import qpay_billing as mod
+
+    calls = []
+    invoice_status = [200, 401, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path.endswith("/auth/token"):
+            n = calls.count(request.url.path)
+            return httpx.Response(200, json={"access_token": f"tok{n}", "expires_in": 3600})
+        assert request.headers["authorization"].startswith("Bearer tok")
+        return httpx.Response(invoice_status.pop(0), json={"invoice_id": "INV1", "qr_text": "q"})
+
+    monkeypatch.setattr(mod, "_HTTP", httpx.Client(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(mod, "_TOKEN_CACHE", {})
+
+    kw = dict(
+        base_url="https://qpay.example",
+        username="u",
+        password="p",
+        invoice_code="CODE",
+        amount=1000,
+        description="d",
+        reference_id="r1",
+    )
+    assert mod.create_invoice(**kw).invoice_id == "INV1"
+    assert mod.create_invoice(**kw).invoice_id == "INV1"
+    assert calls == [
+        "/v2/auth/token",
+        "/v2/invoice",
+        # Second invoice: cached token rejected -> one re-auth, then retry.
+        "/v2/invoice",
+        "/v2/auth/token",
+        "/v2/invoice",
+    ]
@@ -0,0 +1,155 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from core import fast_json
+from scanner_state import SignalStateStore
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_state_save_load_roundtrip_both_json_backends(tmp_path, monkeypatch, use_orjson):
+    if use_orjson and not fast_json.HAVE_ORJSON:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(fast_json, "_orjson", None)
+
+    path = tmp_path / "signal_state.json"
+    store = SignalStateStore(path=str(path))
+    key = store.make_key(symbol="xauusd", timeframe="m15", strategy_id="Стратеги", direction="buy")
+    store.record_sent(key, 1730000000.5, "xauusd", "buy", timeframe="m15", strategy_id="Стратеги")
+    store.increment_daily("XAUUSD", "M15", "Стратеги", "2025-12-20")
+    store.save_atomic()
+
+    # Stays plain, human-readable JSON regardless of backend.
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    assert raw["schema"] == 2
+    assert "Стратеги" in path.read_text(encoding="utf-8")
+
+    loaded = SignalStateStore(path=str(path))
+    loaded.load()
+    rec = loaded.get_sent_record(key)
+    assert rec is not None and rec.ts == 1730000000.5 and rec.strategy_id == "Стратеги"
+    assert loaded.get_daily_count("XAUUSD", "M15", "Стратеги", "2025-12-20") == 1
+
+
+def test_state_journal_replays_without_snapshot_and_compacts(tmp_path):
+    path = tmp_path / "signal_state.json"
+    store = SignalStateStore(path=str(path), compact_every=3)
+    key = store.make_key(symbol="EURUSD", timeframe="M5", strategy_id="s1", direction="SELL")
+    store.record_sent(key, 1730000000.0, "EURUSD", "SELL", timeframe="M5", strategy_id="s1")
+    store.increment_daily("EURUSD", "M5", "s1", "2025-12-20")
+    store.increment_daily("EURUSD", "M5", "s1", "2025-12-20")
+    assert not path.exists()
+    assert store.should_compact()
+
+    # Simulated crash: nothing but the journal (plus a torn trailing line) on disk.
+    with open(store.journal_path, "ab") as f:
+        f.write(b'{"op":"daily","b":"EUR')
+    loaded = SignalStateStore(path=str(path), compact_every=3)
+    loaded.load()
+    assert loaded.get_sent_record(key).direction == "SELL"
+    assert loaded.get_daily_count("EURUSD", "M5", "s1", "2025-12-20") == 2
+
+    loaded.save_atomic()
+    assert not loaded.should_compact()
+    assert not (tmp_path / "signal_state.json.journal").exists()
+    assert not (tmp_path / "signal_state.json.journal.old").exists()
+
+    again = SignalStateStore(path=str(path))
+    again.load()
+    assert again.get_daily_count("EURUSD", "M5", "s1", "2025-12-20") == 2
+
+
+def test_state_prune_drops_only_expired_sent_even_out_of_order(tmp_path):
+    store = SignalStateStore(path=str(tmp_path / "signal_state.json"), journal=False)
+    now = 1_800_000_000.0
+    day = 86400.0
+    store.record_sent("A|M5|s1|BUY", now - 1 * day, "A", "BUY", timeframe="M5", strategy_id="s1")
+    store.record_sent("B|M5|s1|BUY", now - 20 * day, "B", "BUY", timeframe="M5", strategy_id="s1")
+    store.record_sent("C|M5|s1|BUY", now - 30 * day, "C", "BUY", timeframe="M5", strategy_id="s1")
+    # Re-sending A keeps it (and moves it to the newest end).
+    store.record_sent("A|M5|s1|BUY", now, "A", "BUY", timeframe="M5", strategy_id="s1")
+
+    pruned_sent, _ = store.prune(older_than_days=14, now_ts=now)
+    assert pruned_sent == 2
+    assert [r.symbol for r in store.snapshot_sent()] == ["A"]
+    assert store.prune(older_than_days=14, now_ts=now) == (0, 0)
+
+
+def test_state_prune_daily_by_iso_date_keys(tmp_path):
+    store = SignalStateStore(path=str(tmp_path / "signal_state.json"), journal=False)
+    store.increment_daily("EURUSD", "M5", "s1", "2025-12-01")
+    store.increment_daily("EURUSD", "M5", "s1", "2025-12-19")
+    store.increment_daily("EURUSD", "M5", "s1", "not-a-date")
+    now = datetime(2025, 12, 20, 12, tzinfo=timezone.utc).timestamp()
+
+    assert store.prune(older_than_days=14, now_ts=now) == (0, 1)
+    assert store.get_daily_count("EURUSD", "M5", "s1", "2025-12-01") == 0
+    assert store.get_daily_count("EURUSD", "M5", "s1", "2025-12-19") == 1
+    assert store.get_daily_count("EURUSD", "M5", "s1", "not-a-date") == 1
+
+
+def test_state_msgpack_snapshot_roundtrip_and_json_fallback(tmp_path, monkeypatch):
+    import scanner_state
+
+    path = tmp_path / "signal_state.json"
+    key = SignalStateStore.make_key(symbol="EURUSD", timeframe="M5", strategy_id="s1", direction="BUY")
+
+    if scanner_state._msgpack is not None:
+        store = SignalStateStore(path=str(path), journal=False, fmt="msgpack")
+        store.record_sent(key, 1730000000.0, "EURUSD", "BUY", timeframe="M5", strategy_id="s1")
+        store.save_atomic()
+        assert not path.read_bytes().startswith(b"{")
+        loaded = SignalStateStore(path=str(path), journal=False)
+        loaded.load()
+        assert loaded.get_sent_record(key).ts == 1730000000.0
+
+    # Without the package, fmt=msgpack keeps writing JSON.
+    monkeypatch.setattr(scanner_state, "_msgpack", None)
+    store = SignalStateStore(path=str(path), journal=False, fmt="msgpack")
+    store.record_sent(key, 1730000001.0, "EURUSD", "BUY", timeframe="M5", strategy_id="s1")
+    store.save_atomic()
+    assert json.loads(path.read_text(encoding="utf-8"))["schema"] == 2
+
+
+def test_state_can_send_batch_matches_scalar(tmp_path):
+    store = SignalStateStore(path=str(tmp_path / "signal_state.json"), journal=False)
+    now = 1_800_000_000.0
+    store.record_sent("A|M5|s1|BUY", now - 10 * 60, "A", "BUY", timeframe="M5", strategy_id="s1")
+    store.record_sent("B|M5|s1|BUY", now - 30 * 60, "B", "BUY", timeframe="M5", strategy_id="s1")
+    keys = ["A|M5|s1|BUY", "B|M5|s1|BUY", "C|M5|s1|BUY"]
+
+    assert store.can_send_batch(keys, now, 30) == [store.can_send(k, now, 30) for k in keys] == [False, True, True]
+    assert store.can_send_batch(keys, now, 0) == [True, True, True]
+
+
+def test_state_failed_journal_append_forces_snapshot_next_cycle(tmp_path, monkeypatch):
+    import time
+
+    import scanner_state
+    from scanner_service import ScannerService
+
+    path = tmp_path / "signal_state.json"
+    service = ScannerService()
+    service._state_store = SignalStateStore(path=str(path), compact_every=500)
+    store = service._state_store
+    key = store.make_key(symbol="EURUSD", timeframe="M5", strategy_id="s1", direction="BUY")
+
+    def _fail_write(fd, data):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(scanner_state.os, "write", _fail_write)
+    store.record_sent(key, time.time(), "EURUSD", "BUY", timeframe="M5", strategy_id="s1")
+    monkeypatch.undo()
+    service._state_dirty = True
+
+    # Far below compact_every, but the change never reached the journal.
+    assert store.should_compact()
+    service._flush_state_if_dirty(scan_id="t1")
+    assert path.exists()
+    assert not store.should_compact()
+
+    loaded = SignalStateStore(path=str(path))
+    loaded.load()
+    assert loaded.get_sent_record(key).direction == "BUY"
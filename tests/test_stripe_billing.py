@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import hmac
+import time
+from hashlib import sha256
+
+from services.stripe_billing import verify_webhook_signature
+
+
+def _header(secret: str, body: bytes, ts: int) -> str:
+    sig = hmac.new(secret.encode(), f"{ts}.".encode() + body, sha256).hexdigest()
+    return f"t={ts},v1=deadbeef,v1=not-hex,v1={sig}"
+
+
+def test_verify_webhook_signature():
+    body = b'{"id":"evt_1","type":"checkout.session.completed"}'
+    ts = int(time.time())
+    header = _header("whsec_x", body, ts)
+
+    assert verify_webhook_signature(payload_bytes=body, stripe_signature_header=header, webhook_secret="whsec_x")
+    assert not verify_webhook_signature(payload_bytes=body + b" ", stripe_signature_header=header, webhook_secret="whsec_x")
+    assert not verify_webhook_signature(payload_bytes=body, stripe_signature_header=header, webhook_secret="whsec_y")
+    old = _header("whsec_x", body, ts - 3600)
+    assert not verify_webhook_signature(payload_bytes=body, stripe_signature_header=old, webhook_secret="whsec_x")